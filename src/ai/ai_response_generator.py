@@ -1,44 +1,78 @@
-import csv
+import asyncio
+import hashlib
 import json
 import logging
 import os
-import random
 import re
+import shutil
+import threading
 import time
 import traceback
 import warnings
-from datetime import date, datetime
-from itertools import product
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-import faiss
 import numpy as np
-import ollama
-import pyautogui
-import PyPDF2
-import requests
 from dotenv import load_dotenv
-from litellm import completion
-from pypdf import PdfReader
+
+from src.ai.cache import LRUCache, PersistentCache, make_cache_key, normalize_text
+from src.ai.concurrency import AsyncCallLimiter, provider_of
+from src.ai.document_extractor import DocumentExtractor
+from src.ai.embeddings import EmbeddingService
+from src.ai.llm_scheduler import LLMScheduler
+from src.ai.model_router import ModelRouter
+from src.ai.onnx_embeddings import OnnxSentenceEncoder
+from src.ai.question_memory import QuestionMemory
+from src.ai.skill_extractor import SkillExtractor
+from src.ai.tokens import count_tokens, truncate_to_tokens
+from src.utils.lazy_import import lazy_import
 
 # Suppress Pydantic serialization warnings from LiteLLM
 warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
-from selenium.common.exceptions import (
-    NoSuchElementException,
-    StaleElementReferenceException,
-    TimeoutException,
-)
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select, WebDriverWait
 
-# Add new imports for RAG
-from sentence_transformers import SentenceTransformer
+# Heavy dependencies are imported on first use so that importing this module
+# (and therefore starting the bot) stays fast when AI features are disabled.
+faiss = lazy_import("faiss")
+PyPDF2 = lazy_import("PyPDF2")
+
+
+def completion(*args, **kwargs):
+    """Call ``litellm.completion``, importing LiteLLM on the first request"""
+    from litellm import completion as litellm_completion
+
+    return litellm_completion(*args, **kwargs)
+
 
 load_dotenv()
 
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+EMBEDDING_BACKENDS = ("torch", "onnx")
+# Completion tokens reserved from the token budget when a call sets no limit
+DEFAULT_COMPLETION_TOKENS = 256
+# Job skills extracted for resume tailoring, and the fewest the local lexicon
+# has to find before the LLM is asked instead
+TOP_JOB_SKILLS = 10
+MIN_LOCAL_JOB_SKILLS = 3
+
+# Opening of every answer prompt in prefix-cached mode. Together with the
+# candidate profile it forms a prefix that is byte-identical across questions.
+ANSWER_PREAMBLE = (
+    "You are answering job application questions on behalf of the candidate "
+    "described below. Pretend you are the candidate and rely only on their "
+    "background and resume."
+)
+# Chunks that go into the stable prefix: the personal info chunk and the top
+# of the resume
+PREFIX_CORE_CHUNKS = (-1, 0)
+
+# Job fit decisions while streaming: an explicit "DECISION: X" line may appear
+# anywhere, a bare APPLY/SKIP only after the reasoning block. Both need a
+# following character so a partial token ("SKIP" of "SKIPPED") can't match.
+JOB_FIT_SIGNAL = re.compile(r"\bDECISION:\s*(APPLY|SKIP)(?=\W)", re.IGNORECASE)
+JOB_FIT_DECISION = re.compile(r"\b(APPLY|SKIP)(?=\W)", re.IGNORECASE)
+JOB_FIT_MODES = ("full", "stream", "decision_only")
+
 
 class AIResponseGenerator:
     def __init__(
@@ -51,27 +85,148 @@ class AIResponseGenerator:
         checkboxes,
         model_name,
         text_resume_path=None,
+        docx_resume_path=None,
         debug=False,
+        cache_dir="output/cache",
+        answer_cache=True,
+        answer_cache_ttl_days=30,
+        answer_cache_max_entries=5000,
+        job_specific_answer_types=("text",),
+        question_memory=True,
+        question_similarity_threshold=0.92,
+        max_concurrent_requests=4,
+        provider_rate_limits=None,
+        context_cache_max_entries=256,
+        context_cache_max_mb=16,
+        context_cache_persist=False,
+        embedding_cache_max_entries=4096,
+        job_fit_cache=True,
+        job_fit_cache_ttl_days=30,
+        prefix_cached_prompts=True,
+        job_fit_mode="stream",
+        job_fit_prefilter=True,
+        job_fit_skip_below=0.30,
+        job_fit_apply_above=0.65,
+        model_tiers=None,
+        task_model_tiers=None,
+        model_escalation=True,
+        provider_token_limits=None,
+        llm_max_retries=4,
+        embedding_backend="torch",
+        embedding_quantized=True,
+        tailored_resume_cache_mb=50,
+        local_skill_extraction=True,
+        skill_lexicon=None,
     ):
         self.personal_info = personal_info
         self.experience = experience
         self.languages = languages
         self.pdf_resume_path = resume_path
         self.text_resume_path = text_resume_path
+        self.docx_resume_path = docx_resume_path
+        self._documents = None
         self.checkboxes = checkboxes
         self._resume_content = None
         self._client = True
         self.model_name = model_name
+        # Model per task type, escalating to larger tiers on invalid answers
+        self.router = ModelRouter(
+            default_model=model_name,
+            model_tiers=model_tiers,
+            task_tiers=task_model_tiers,
+            escalate=model_escalation,
+        )
         self.debug = debug
         self.resume_dir = resume_path
+        # Size cap for the tailored resume copies kept next to the original
+        self.tailored_resume_cache_mb = tailored_resume_cache_mb
+        # Job skills come from a local lexicon matcher; the LLM is the fallback
+        self.local_skill_extraction = local_skill_extraction
+        self.skill_lexicon = skill_lexicon
+        self._skill_extractor = None
+        self.skill_extraction_stats = {"local": 0, "llm": 0}
+        self.cache_dir = Path(cache_dir)
 
         # Initialize RAG components
         self._embedding_model = None
+        # "torch" runs sentence-transformers, "onnx" an ONNX Runtime export
+        # (int8-quantized unless embedding_quantized is off) without PyTorch
+        if embedding_backend not in EMBEDDING_BACKENDS:
+            print(f"Unknown embeddingBackend '{embedding_backend}', using 'torch'")
+            embedding_backend = "torch"
+        self.embedding_backend = embedding_backend
+        self.embedding_quantized = embedding_quantized
+        self.embeddings = EmbeddingService(
+            lambda: self.embedding_model, max_entries=embedding_cache_max_entries
+        )
         self._resume_chunks = None
         self._chunk_embeddings = None
         self._faiss_index = None
-        self._context_cache = {}
+        # Chunks and vectors of the previous resume version, reused by content
+        # hash when the index is rebuilt after the resume changed
+        self._previous_index = None
+        self.index_stats = {"encoded": 0, "reused": 0}
+        self._context_cache = None
+        self.token_stats = {}  # Prompt tokens sent per call type
+        self.prefix_cached_prompts = prefix_cached_prompts
+        self._stable_prefix = None  # (profile fingerprint, prefix text)
+        self.context_cache_max_entries = context_cache_max_entries
+        self.context_cache_max_mb = context_cache_max_mb
+        self.context_cache_persist = context_cache_persist
         self._last_ai_response_text = None  # Store last AI response text for CSV
+        self._last_ai_response_texts = []  # Same, for batched questions
+
+        # Persistent answer cache for repeated screening questions
+        self._answer_cache = None
+        self._answer_cache_enabled = answer_cache
+        self.answer_cache_ttl_days = answer_cache_ttl_days
+        self.answer_cache_max_entries = answer_cache_max_entries
+        # Only these answers depend on the job description (free text written
+        # for the posting); everything else is reused across jobs
+        self.job_specific_answer_types = frozenset(job_specific_answer_types or ())
+
+        # Persistent job summaries and APPLY/SKIP decisions per job description
+        self._job_fit_cache = None
+        self._job_fit_cache_enabled = job_fit_cache
+        self.job_fit_cache_ttl_days = job_fit_cache_ttl_days
+        # "full" waits for the whole reasoning, "stream" stops at the decision,
+        # "decision_only" asks for the decision without reasoning
+        if job_fit_mode not in JOB_FIT_MODES:
+            print(f"Unknown jobFitMode '{job_fit_mode}', using 'stream'")
+            job_fit_mode = "stream"
+        self.job_fit_mode = job_fit_mode
+
+        # Embedding-similarity prefilter that settles clear cases without the LLM
+        self.job_fit_prefilter = job_fit_prefilter
+        self.job_fit_skip_below = job_fit_skip_below
+        self.job_fit_apply_above = job_fit_apply_above
+        self.job_fit_tiers = {
+            "cache": 0,
+            "prefilter_skip": 0,
+            "prefilter_apply": 0,
+            "llm": 0,
+        }
+
+        # Semantic memory for reusing answers to reworded questions
+        self._question_memory = None
+        self._question_memory_enabled = question_memory
+        self.question_similarity_threshold = question_similarity_threshold
+        # Serializes question memory and embedding access from worker threads
+        self._memory_lock = threading.RLock()
+        # Worker threads load the embedding model and build the index only once
+        self._model_lock = threading.Lock()
+        self._index_lock = threading.RLock()
+
+        # Per-provider request/token budgets and retries for every LLM call
+        self.scheduler = LLMScheduler(
+            requests_per_minute=provider_rate_limits,
+            tokens_per_minute=provider_token_limits,
+            max_retries=llm_max_retries,
+        )
+        # Concurrency for the async answer path; rate limits are the scheduler's
+        self.call_limiter = AsyncCallLimiter(
+            max_concurrency=max_concurrent_requests, requests_per_minute={}
+        )
         
         # Setup logging for AI responses
         self._setup_logging()
@@ -79,20 +234,200 @@ class AIResponseGenerator:
     @property
     def embedding_model(self):
         """Lazy load the embedding model"""
-        if self._embedding_model is None:
+        if self._embedding_model is not None:
+            return self._embedding_model
+        with self._model_lock:
+            if self._embedding_model is not None:
+                return self._embedding_model
             print("Loading embedding model...")
-            # Using a small, efficient model
-            self._embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+            model = None
+            if self.embedding_backend == "onnx":
+                try:
+                    model = OnnxSentenceEncoder.from_pretrained(
+                        EMBEDDING_MODEL_NAME, quantized=self.embedding_quantized
+                    )
+                except Exception as e:
+                    print(
+                        f"Could not load ONNX embedding model, using PyTorch: {str(e)}"
+                    )
+            if model is None:
+                from sentence_transformers import SentenceTransformer
+
+                # Using a small, efficient model
+                model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+            self._embedding_model = model
             print("Embedding model loaded successfully")
         return self._embedding_model
 
+    @property
+    def documents(self):
+        """Text extraction of resume files, cached on disk by content hash"""
+        if self._documents is None:
+            cache = None
+            try:
+                cache = PersistentCache(
+                    self.cache_dir / "cache.sqlite3",
+                    namespace="documents",
+                    max_entries=200,
+                )
+            except Exception as e:
+                print(f"Could not open document cache, continuing without it: {str(e)}")
+            self._documents = DocumentExtractor(
+                cache=cache, pdf_reader=lambda path: PyPDF2.PdfReader(path)
+            )
+        return self._documents
+
     @property
     def resume_chunks(self):
-        """Lazy load resume chunks"""
-        if self._resume_chunks is None:
+        """Lazy load resume chunks, preferring the persisted index from a previous run"""
+        if self._resume_chunks is None and not self._load_vector_index():
             self._resume_chunks = self._create_semantic_chunks()
         return self._resume_chunks
 
+    @property
+    def answer_cache(self):
+        """Lazily open the on-disk answer cache, scoped to the current profile"""
+        if self._answer_cache is None and self._answer_cache_enabled:
+            try:
+                self._answer_cache = PersistentCache(
+                    self.cache_dir / "cache.sqlite3",
+                    namespace="answers",
+                    ttl_seconds=(self.answer_cache_ttl_days or 0) * 24 * 3600,
+                    max_entries=self.answer_cache_max_entries,
+                    scope=self._content_fingerprint(),
+                )
+            except Exception as e:
+                print(f"Could not open answer cache, continuing without it: {str(e)}")
+                self._answer_cache_enabled = False
+        return self._answer_cache
+
+    @property
+    def job_fit_cache(self):
+        """Lazily open the on-disk job fit store, scoped to the current profile"""
+        if self._job_fit_cache is None and self._job_fit_cache_enabled:
+            try:
+                self._job_fit_cache = PersistentCache(
+                    self.cache_dir / "cache.sqlite3",
+                    namespace="job_fit",
+                    ttl_seconds=(self.job_fit_cache_ttl_days or 0) * 24 * 3600,
+                    scope=self._content_fingerprint(),
+                )
+            except Exception as e:
+                print(f"Could not open job fit cache, continuing without it: {str(e)}")
+                self._job_fit_cache_enabled = False
+        return self._job_fit_cache
+
+    @property
+    def context_cache(self):
+        """Bounded LRU of built RAG contexts, optionally persisted to the cache db"""
+        if self._context_cache is None:
+            backing = None
+            if self.context_cache_persist:
+                try:
+                    backing = PersistentCache(
+                        self.cache_dir / "cache.sqlite3",
+                        namespace="rag_context",
+                        max_entries=self.context_cache_max_entries * 4,
+                        scope=self._content_fingerprint(),
+                    )
+                except Exception as e:
+                    print(f"Could not open persistent context cache: {str(e)}")
+            self._context_cache = LRUCache(
+                max_entries=self.context_cache_max_entries,
+                max_bytes=int(self.context_cache_max_mb * 1024 * 1024),
+                backing=backing,
+            )
+        return self._context_cache
+
+    @property
+    def question_memory(self):
+        """Lazily load the near-duplicate question memory for the current profile"""
+        if self._question_memory is None and self._question_memory_enabled:
+            try:
+                self._question_memory = QuestionMemory(
+                    self.cache_dir / "question_memory",
+                    encode=self._encode_texts,
+                    threshold=self.question_similarity_threshold,
+                    max_entries=self.answer_cache_max_entries,
+                    scope=self._content_fingerprint(),
+                    job_specific_types=self.job_specific_answer_types,
+                )
+            except Exception as e:
+                print(
+                    f"Could not load question memory, continuing without it: {str(e)}"
+                )
+                self._question_memory_enabled = False
+        return self._question_memory
+
+    def save_question_memory(self):
+        """Persist the answers remembered since the last save, once per form step"""
+        if self._question_memory is None:
+            return
+        with self._memory_lock:
+            try:
+                self._question_memory.save()
+            except Exception as e:
+                print(f"Could not persist question memory: {str(e)}")
+
+    def _encode_texts(self, texts):
+        """Encode texts into L2-normalized float32 vectors for cosine search"""
+        return self.embeddings.encode(texts)
+
+    def prefetch_embeddings(self, texts):
+        """
+        Embed many texts in one batched pass ahead of time, e.g. every question
+        of a form step, so that later searches and lookups hit the cache.
+        """
+        try:
+            self.embeddings.prefetch(t for t in texts if t)
+        except Exception as e:
+            print(f"Could not prefetch embeddings: {str(e)}")
+
+    def _answer_cache_key(self, question_text, response_type, options, jd):
+        option_texts = [normalize_text(text) for _, text in (options or [])]
+        return make_cache_key(
+            normalize_text(question_text),
+            response_type,
+            option_texts,
+            (
+                normalize_text(jd)
+                if response_type in self.job_specific_answer_types
+                else ""
+            ),
+            self._content_fingerprint(),
+        )
+
+    def cache_stats(self):
+        """Hit/miss counters of the AI caches, for logging and tuning"""
+        stats = {}
+        if self._answer_cache is not None:
+            stats["answers"] = self._answer_cache.stats()
+        if self._question_memory is not None:
+            stats["question_memory"] = self._question_memory.stats()
+        if self._job_fit_cache is not None:
+            stats["job_fit"] = self._job_fit_cache.stats()
+        if self._context_cache is not None:
+            stats["context"] = self._context_cache.stats()
+        stats["embeddings"] = self.embeddings.stats()
+        stats["resume_index"] = self.index_stats
+        if self._documents is not None:
+            stats["documents"] = self._documents.stats()
+        stats["concurrent_calls"] = self.call_limiter.stats()
+        stats["scheduler"] = self.scheduler.stats()
+        stats["prompt_tokens"] = self.token_stats
+        stats["models"] = self.router.stats()
+        stats["job_fit_tiers"] = self.job_fit_tier_stats()
+        stats["skill_extraction"] = self.skill_extraction_stats
+        return stats
+
+    def job_fit_tier_stats(self):
+        """How many evaluated jobs each tier decided, and the fraction of all jobs"""
+        total = sum(self.job_fit_tiers.values())
+        return {
+            tier: {"count": count, "fraction": count / total if total else 0.0}
+            for tier, count in self.job_fit_tiers.items()
+        }
+
     def _setup_logging(self):
         """Setup file logging for AI responses"""
         # Create output directory if it doesn't exist
@@ -213,32 +548,185 @@ class AIResponseGenerator:
         print(f"Created {len(chunks)} semantic chunks from resume")
         return chunks
 
+    def _content_fingerprint(self):
+        """
+        Hash of every input that shapes the resume chunks and their embeddings.
+        Any change to the resume text or profile maps produces a new fingerprint.
+        """
+        payload = json.dumps(
+            {
+                "embedding_model": EMBEDDING_MODEL_NAME,
+                "resume": self.resume_content or "",
+                "personal_info": self.personal_info,
+                "experience": self.experience,
+                "languages": self.languages,
+                "checkboxes": self.checkboxes,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @property
+    def _index_cache_root(self):
+        return self.cache_dir / "rag_index"
+
+    def _vector_index_dir(self):
+        """Index directory for the current fingerprint and embedding backend"""
+        name = self._content_fingerprint()
+        if self.embedding_backend == "onnx":
+            name += "-onnx-int8" if self.embedding_quantized else "-onnx"
+        return self._index_cache_root / name
+
+    def _load_vector_index(self):
+        """Load chunks, embeddings and FAISS index saved for the current fingerprint"""
+        index_dir = self._vector_index_dir()
+        if not (index_dir / "index.faiss").exists():
+            return False
+
+        try:
+            with open(index_dir / "chunks.json", "r", encoding="utf-8") as f:
+                chunks = json.load(f)
+            embeddings = np.load(index_dir / "embeddings.npy")
+            index = faiss.read_index(str(index_dir / "index.faiss"))
+        except Exception as e:
+            print(f"Could not load cached vector index, rebuilding: {str(e)}")
+            return False
+
+        if index.ntotal != len(chunks):
+            print("Cached vector index is inconsistent, rebuilding")
+            return False
+
+        self._resume_chunks = chunks
+        self._chunk_embeddings = embeddings
+        self._faiss_index = index
+        print(f"Loaded cached vector index with {len(chunks)} chunks")
+        return True
+
+    def _save_vector_index(self, max_versions=5):
+        """Persist chunks, embeddings and FAISS index under the current fingerprint"""
+        root = self._index_cache_root
+        index_dir = self._vector_index_dir()
+        if index_dir.exists():
+            return
+
+        # Write into a scratch directory first so readers never see a partial
+        # index; the name is unique per process and thread
+        tmp_dir = root / f"{index_dir.name}.tmp-{os.getpid()}-{threading.get_ident()}"
+        try:
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_dir / "chunks.json", "w", encoding="utf-8") as f:
+                json.dump(self._resume_chunks, f)
+            np.save(tmp_dir / "embeddings.npy", self._chunk_embeddings)
+            faiss.write_index(self._faiss_index, str(tmp_dir / "index.faiss"))
+            os.replace(tmp_dir, index_dir)
+        except Exception as e:
+            print(f"Could not persist vector index: {str(e)}")
+            return
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        # Keep only the most recent versions around
+        versions = sorted(
+            (p for p in root.iterdir() if p.is_dir() and ".tmp-" not in p.name),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for stale_dir in versions[max_versions:]:
+            shutil.rmtree(stale_dir, ignore_errors=True)
+
     def _build_vector_index(self):
-        """Build FAISS index for semantic search"""
+        """Build FAISS index for semantic search, reusing a persisted index when possible"""
         if self._faiss_index is not None:
             return
 
-        chunks = self.resume_chunks
-        if not chunks:
-            return
+        # Concurrent workers wait for the first one instead of building their own
+        with self._index_lock:
+            if self._faiss_index is not None:
+                return
 
-        print("Building vector index...")
-        # Get embeddings for all chunks
-        chunk_texts = [chunk["text"] for chunk in chunks]
-        embeddings = self.embedding_model.encode(chunk_texts, show_progress_bar=False)
+            if self._load_vector_index():
+                return
 
-        # Create FAISS index
-        dimension = embeddings.shape[1]
-        self._faiss_index = faiss.IndexFlatIP(
-            dimension
-        )  # Inner product for cosine similarity
+            chunks = self.resume_chunks
+            if not chunks:
+                return
 
-        # Normalize embeddings for cosine similarity
-        faiss.normalize_L2(embeddings)
-        self._faiss_index.add(embeddings.astype("float32"))
+            print("Building vector index...")
+            embeddings = self._embed_chunks(chunks)
 
-        self._chunk_embeddings = embeddings
-        print(f"Vector index built with {len(chunks)} chunks")
+            # Create FAISS index; inner product for cosine similarity
+            index = faiss.IndexFlatIP(embeddings.shape[1])
+
+            # Normalize embeddings for cosine similarity
+            faiss.normalize_L2(embeddings)
+            index.add(embeddings)
+
+            self._chunk_embeddings = embeddings
+            self._faiss_index = index
+            print(f"Vector index built with {len(chunks)} chunks")
+            self._save_vector_index()
+
+    @staticmethod
+    def _chunk_hash(chunk):
+        return make_cache_key(chunk["section"], chunk["text"])
+
+    def _embed_chunks(self, chunks):
+        """
+        Embeddings for ``chunks``. Chunks whose content is unchanged since the
+        previous resume version keep their vectors; only added or modified
+        chunks are encoded, in one batch.
+        """
+        reusable = {}
+        if self._previous_index is not None:
+            previous_chunks, previous_embeddings = self._previous_index
+            for chunk, vector in zip(previous_chunks, previous_embeddings):
+                reusable[self._chunk_hash(chunk)] = vector
+        self._previous_index = None
+
+        vectors = [reusable.get(self._chunk_hash(chunk)) for chunk in chunks]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            encoded = self.embedding_model.encode(
+                [chunks[i]["text"] for i in missing], show_progress_bar=False
+            )
+            for i, vector in zip(missing, np.asarray(encoded, dtype="float32")):
+                vectors[i] = vector
+
+        reused = len(chunks) - len(missing)
+        self.index_stats["encoded"] += len(missing)
+        self.index_stats["reused"] += reused
+        if reused:
+            print(f"Reused {reused} unchanged chunk embeddings, encoded {len(missing)}")
+        return np.vstack(vectors).astype("float32")
+
+    def invalidate_resume(self):
+        """
+        Forget the resume text after the resume changed, e.g. once a tailored
+        version was written. The index is rebuilt on next use, re-embedding
+        only the chunks that changed, and contexts built from the old resume
+        are dropped. The answer cache, question memory and job fit store are
+        reopened under the new profile fingerprint.
+        """
+        with self._index_lock:
+            if self._resume_chunks is not None and self._chunk_embeddings is not None:
+                self._previous_index = (self._resume_chunks, self._chunk_embeddings)
+            self._resume_content = None
+            self._resume_chunks = None
+            self._chunk_embeddings = None
+            self._faiss_index = None
+        # Context cache keys don't include the resume; reopen it for the new one
+        self._context_cache = None
+
+        # The stores below keep the fingerprint they were opened with
+        with self._memory_lock:
+            self.save_question_memory()
+            self._question_memory = None
+            for cache in (self._answer_cache, self._job_fit_cache):
+                if cache is not None:
+                    cache.close()
+            self._answer_cache = None
+            self._job_fit_cache = None
 
     def _semantic_search(self, query: str, top_k: int = 5) -> List[Dict]:
         """Perform semantic search on resume chunks"""
@@ -247,14 +735,11 @@ class AIResponseGenerator:
         if self._faiss_index is None or not self.resume_chunks:
             return []
 
-        # Encode query
-        query_embedding = self.embedding_model.encode([query], show_progress_bar=False)
-        faiss.normalize_L2(query_embedding)
+        # Encode query (memoized, see EmbeddingService)
+        query_embedding = self._encode_texts([query])
 
         # Search
-        scores, indices = self._faiss_index.search(
-            query_embedding.astype("float32"), top_k
-        )
+        scores, indices = self._faiss_index.search(query_embedding, top_k)
 
         # Return relevant chunks with scores
         results = []
@@ -266,21 +751,42 @@ class AIResponseGenerator:
 
         return results
 
-    def _build_context_rag(self, query="", job_description="", max_tokens=2000):
+    def _build_context_rag(
+        self,
+        query="",
+        job_description="",
+        max_tokens=2000,
+        model=None,
+        exclude_chunks=(),
+    ):
         """
-        Build focused context using semantic RAG
+        Build focused context using semantic RAG.
+        Whole chunks are packed in order of relevance while they fit in
+        ``max_tokens``, counted with the tokenizer of ``model``. Chunks whose
+        ``chunk_index`` is in ``exclude_chunks`` are left out (-1 being the
+        personal info chunk).
         """
-        # Create cache key
-        cache_key = hash(query + job_description + str(max_tokens))
-        if cache_key in self._context_cache:
-            return self._context_cache[cache_key]
+        exclude_chunks = tuple(sorted(exclude_chunks))
+        cache_key = make_cache_key(
+            query, job_description, max_tokens, model, exclude_chunks
+        )
+        cached_context = self.context_cache.get(cache_key)
+        if cached_context is not None:
+            return cached_context
 
         context_parts = []
+        separator = "\n\n"
+        separator_tokens = count_tokens(separator, model)
 
         # Always include personal info (it's the first chunk)
         personal_chunk = self.resume_chunks[0] if self.resume_chunks else None
-        if personal_chunk:
-            context_parts.append(f"Personal Info: {personal_chunk['text']}")
+        if personal_chunk and -1 not in exclude_chunks:
+            context_parts.append(
+                truncate_to_tokens(
+                    f"Personal Info: {personal_chunk['text']}", max_tokens, model
+                )
+            )
+        used_tokens = count_tokens(context_parts[0], model) if context_parts else 0
 
         # Combine query and job description for search
         search_query = f"{query} {job_description}".strip()
@@ -291,63 +797,220 @@ class AIResponseGenerator:
 
             # Filter out personal info chunk (already included)
             relevant_chunks = [
-                chunk for chunk in relevant_chunks if chunk.get("chunk_index", 0) != -1
+                chunk
+                for chunk in relevant_chunks
+                if chunk.get("chunk_index", 0) != -1
+                and chunk.get("chunk_index") not in exclude_chunks
             ]
 
-            # Group by section and add most relevant content
+            # Group by section and add the most relevant chunks that still fit
             sections_added = set()
-            total_chars = len(context_parts[0]) if context_parts else 0
 
             for chunk in relevant_chunks:
-                if total_chars >= max_tokens * 4:  # Rough token estimation
-                    break
-
                 section = chunk["section"]
-                chunk_text = chunk["text"]
+                parts = [chunk["text"]]
 
                 # Add section header if new section
                 if section not in sections_added and section != "general":
-                    section_header = f"\n{section.title().replace('_', ' ')}:"
-                    context_parts.append(section_header)
-                    sections_added.add(section)
-                    total_chars += len(section_header)
+                    parts.insert(0, f"\n{section.title().replace('_', ' ')}:")
 
-                # Add chunk content
-                context_parts.append(chunk_text)
-                total_chars += len(chunk_text)
+                cost = sum(
+                    count_tokens(part, model) + separator_tokens for part in parts
+                )
+                if used_tokens + cost > max_tokens:
+                    continue
+
+                context_parts.extend(parts)
+                sections_added.add(section)
+                used_tokens += cost
 
                 if self.debug:
                     print(
-                        f"Added chunk (score: {chunk['relevance_score']:.3f}): {chunk_text[:100]}..."
+                        f"Added chunk (score: {chunk['relevance_score']:.3f}): {chunk['text'][:100]}..."
                     )
 
         # Join context
-        context = "\n\n".join(context_parts)
-
-        # Truncate if too long
-        if len(context) > max_tokens * 4:
-            context = context[: max_tokens * 4] + "..."
+        context = separator.join(context_parts)
 
         # Cache the result
-        self._context_cache[cache_key] = context
+        self.context_cache.set(cache_key, context)
 
         if self.debug:
-            print(f"Built RAG context with {len(context)} characters")
+            print(f"Built RAG context with {count_tokens(context, model)} tokens")
 
         return context
 
+    def _record_prompt_tokens(self, response, messages, model, label):
+        """
+        Log the prompt size of a completion, as reported by the provider when
+        available and counted locally otherwise, and add it to ``token_stats``.
+        """
+        usage = getattr(response, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", None)
+        if not isinstance(prompt_tokens, int):
+            prompt_tokens = sum(
+                count_tokens(message["content"], model) for message in messages
+            )
+        # Tokens the provider served from its prompt prefix cache
+        details = getattr(usage, "prompt_tokens_details", None)
+        if isinstance(details, dict):
+            cached_tokens = details.get("cached_tokens")
+        else:
+            cached_tokens = getattr(details, "cached_tokens", None)
+        if not isinstance(cached_tokens, int):
+            cached_tokens = 0
+
+        stats = self.token_stats.setdefault(
+            label, {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0}
+        )
+        stats["calls"] += 1
+        stats["prompt_tokens"] += prompt_tokens
+        stats["cached_tokens"] += cached_tokens
+        self.logger.info(
+            f"{label}: {prompt_tokens} prompt tokens ({cached_tokens} cached)"
+        )
+        return prompt_tokens
+
+    @staticmethod
+    def _completion_tokens(response, text, model):
+        usage = getattr(response, "usage", None)
+        completion_tokens = getattr(usage, "completion_tokens", None)
+        if isinstance(completion_tokens, int):
+            return completion_tokens
+        return count_tokens(text, model)
+
+    @staticmethod
+    def _estimate_tokens(model, messages, options):
+        """Tokens a request may use: its prompt plus the completion limit"""
+        prompt_tokens = sum(
+            count_tokens(message["content"], model) for message in messages
+        )
+        return prompt_tokens + options.get(
+            "max_completion_tokens", DEFAULT_COMPLETION_TOKENS
+        )
+
+    def _scheduled_completion(self, model, messages, **kwargs):
+        """``completion`` within the scheduler's budgets, with retries"""
+        return self.scheduler.call(
+            model,
+            lambda: completion(model=model, messages=messages, **kwargs),
+            estimated_tokens=self._estimate_tokens(model, messages, kwargs),
+        )
+
+    def _routed_completion(self, task, messages, label, validate=None, **kwargs):
+        """
+        Send ``messages`` to the model routed for ``task``.
+
+        When ``validate`` rejects the answer (with reasoning tags stripped),
+        the request is repeated on the next larger model tier. Latency and
+        token usage of every request are recorded per tier. Returns
+        ``(response, answer, model)`` of the last request made.
+        """
+        route = self.router.route(task)
+        if validate is None:
+            route = route[:1]
+        for attempt, (tier, model) in enumerate(route):
+            started = time.monotonic()
+            response = self._scheduled_completion(model, messages, **kwargs)
+            latency = time.monotonic() - started
+            prompt_tokens = self._record_prompt_tokens(response, messages, model, label)
+            answer = self._strip_reasoning(
+                response.choices[0]["message"]["content"].strip()
+            )
+            self.router.record(
+                tier,
+                model,
+                latency,
+                prompt_tokens,
+                self._completion_tokens(response, answer, model),
+                escalated=attempt > 0,
+            )
+            if validate is None or attempt == len(route) - 1 or validate(answer):
+                return response, answer, model
+            self.logger.info(
+                f"{label}: answer from {model} failed validation, escalating"
+            )
+
+    def _stable_prompt_prefix(self):
+        """
+        Preamble and candidate profile shared by every answer prompt, rebuilt
+        only when the profile fingerprint changes
+        """
+        fingerprint = self._content_fingerprint()
+        if self._stable_prefix is None or self._stable_prefix[0] != fingerprint:
+            core_chunks = [
+                chunk["text"]
+                for chunk in self.resume_chunks
+                if chunk.get("chunk_index") in PREFIX_CORE_CHUNKS
+            ]
+            prefix = f"{ANSWER_PREAMBLE}\n\nCandidate profile:\n" + "\n\n".join(
+                core_chunks
+            )
+            self._stable_prefix = (fingerprint, prefix)
+        return self._stable_prefix[1]
+
+    def _answer_messages(
+        self, instructions, query, jd, request, max_tokens=1500, model=None
+    ):
+        """
+        Chat messages for an answer prompt.
+
+        ``instructions`` describe the expected answer, ``query`` and ``jd``
+        drive retrieval and ``request`` is the question part; ``model`` is
+        the model whose tokenizer the context budget is counted in. With
+        ``prefix_cached_prompts`` the system message holds only content that is
+        identical for every question of this profile, so the provider can reuse
+        its cached prefix; instructions, retrieved snippets and the question
+        follow in the user message.
+        """
+        model = model or self.router.model_for("text")
+        if not self.prefix_cached_prompts:
+            context = self._build_context_rag(
+                query=query,
+                job_description=jd,
+                max_tokens=max_tokens,
+                model=model,
+            )
+            return [
+                {"role": "system", "content": instructions},
+                {
+                    "role": "user",
+                    "content": f"Using this candidate's background and resume:\n{context}\n\n{request}",
+                },
+            ]
+
+        prefix = self._stable_prompt_prefix()
+        excerpts = self._build_context_rag(
+            query=query,
+            job_description=jd,
+            max_tokens=max(200, max_tokens - count_tokens(prefix, model)),
+            model=model,
+            exclude_chunks=PREFIX_CORE_CHUNKS,
+        )
+        return [
+            {"role": "system", "content": prefix},
+            {
+                "role": "user",
+                "content": f"{instructions}\n\nRelevant resume excerpts:\n{excerpts}\n\n{request}",
+            },
+        ]
+
     @property
     def resume_content(self):
         if self._resume_content is None:
-            # First try to read from text resume if available
-            if self.text_resume_path:
+            # First try to read from text or DOCX resume if available
+            for kind, path in (
+                ("text", self.text_resume_path),
+                ("DOCX", self.docx_resume_path),
+            ):
+                if not path:
+                    continue
                 try:
-                    with open(self.text_resume_path, "r", encoding="utf-8") as f:
-                        self._resume_content = f.read()
-                        print("Successfully loaded text resume")
-                        return self._resume_content
+                    self._resume_content = self.documents.text(path)
+                    print(f"Successfully loaded {kind} resume")
+                    return self._resume_content
                 except Exception as e:
-                    print(f"Could not read text resume: {str(e)}")
+                    print(f"Could not read {kind} resume: {str(e)}")
 
             # Fall back to PDF resume if text resume fails or isn't available
             # Ensure this uses self.resume_dir which might be updated
@@ -357,12 +1020,8 @@ class AIResponseGenerator:
                 else self.pdf_resume_path
             )
             try:
-                content = []
-                # reader = PdfReader(self.pdf_resume_path) # Original line
-                reader = PdfReader(current_pdf_path)  # Use current_pdf_path
-                for page in reader.pages:
-                    content.append(page.extract_text())
-                self._resume_content = "\n".join(content)
+                # Parsed once per file version, see DocumentExtractor
+                self._resume_content = self.documents.text(current_pdf_path)
                 print(f"Successfully loaded PDF resume from {current_pdf_path}")
             except Exception as e:
                 print(
@@ -375,8 +1034,25 @@ class AIResponseGenerator:
         """Legacy method - now uses RAG by default"""
         return self._build_context_rag()
 
-    def get_tailored_skills_replacements(self, job_description):
-        # Step 1: Extract top 10 technical skills from job description
+    @property
+    def skill_extractor(self):
+        if self._skill_extractor is None:
+            self._skill_extractor = SkillExtractor(self.skill_lexicon)
+        return self._skill_extractor
+
+    def extract_job_skills(self, job_description):
+        """
+        Comma-separated top skills of ``job_description``, from the local
+        lexicon when it finds enough of them, otherwise from the LLM.
+        """
+        if self.local_skill_extraction:
+            skills = self.skill_extractor.extract(job_description, TOP_JOB_SKILLS)
+            if len(skills) >= MIN_LOCAL_JOB_SKILLS:
+                self.skill_extraction_stats["local"] += 1
+                return ", ".join(skills)
+            print(f"Only {len(skills)} known skills in the job description, asking AI")
+
+        # Extract top 10 technical skills from job description
         system_prompt_1 = (
             "You are an expert resume and job description analyst.\n"
             "Your task is to read the job description below and extract the **top 10 technical skills or tools** that are essential for the role.\n"
@@ -387,12 +1063,19 @@ class AIResponseGenerator:
             "- Return the output as a **comma-separated list** of skill keywords, in order of relevance and frequency.\n\n"
             f"Job Description:\n{job_description}"
         )
+        _, job_skills, _ = self._routed_completion(
+            "skill_extraction",
+            [{"role": "system", "content": system_prompt_1}],
+            "skill_extraction",
+            validate=bool,
+        )
+        self.skill_extraction_stats["llm"] += 1
+        return job_skills
+
+    def get_tailored_skills_replacements(self, job_description):
+        # Step 1: Top technical skills of the job description
         try:
-            response_1 = completion(
-                model=self.model_name,
-                messages=[{"role": "system", "content": system_prompt_1}],
-            )
-            job_skills = response_1.choices[0]["message"]["content"].strip()
+            job_skills = self.extract_job_skills(job_description)
         except Exception as e:
             print(f"Error extracting job skills: {str(e)}")
             return None
@@ -419,14 +1102,15 @@ class AIResponseGenerator:
         )
         user_content_2 = f"Job Skills:\n{job_skills}\n\nResume:\n{self.resume_content}"
         try:
-            response_2 = completion(
-                model=self.model_name,
-                messages=[
+            _, answer, _ = self._routed_completion(
+                "skill_extraction",
+                [
                     {"role": "system", "content": system_prompt_2},
                     {"role": "user", "content": user_content_2},
                 ],
+                "skill_replacements",
+                validate=lambda answer: self._parse_json_array(answer) is not None,
             )
-            answer = response_2.choices[0]["message"]["content"].strip()
             replacements = json.loads(re.search(r"\[.*\]", answer, re.DOTALL).group())
             print(f"AI response: {answer}")
             return replacements[:MAX_SKILL_REPLACEMENTS]
@@ -434,22 +1118,109 @@ class AIResponseGenerator:
             print(f"Error using AI to generate resume tailoring skills: {str(e)}")
             return None
 
+    @staticmethod
+    def _parse_json_array(answer):
+        """The first JSON array in ``answer``, or None if there is no valid one"""
+        match = re.search(r"\[.*\]", answer, re.DOTALL)
+        if match is None:
+            return None
+        try:
+            return json.loads(match.group())
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _normalize_replacements(replacements):
+        """Skill replacements without blanks or duplicates, in a canonical order"""
+        normalized = {}
+        for r in replacements or []:
+            old_skill = str(r.get("old") or "").strip()
+            new_skill = str(r.get("new") or "").strip()
+            if old_skill and new_skill:
+                normalized.setdefault(
+                    old_skill.lower(), {"old": old_skill, "new": new_skill}
+                )
+        return [normalized[key] for key in sorted(normalized)]
+
+    def tailored_resume_path(self, input_pdf_path, replacements):
+        """
+        Content-addressed path of the tailored copy of ``input_pdf_path``: the
+        same source resume and replacement set always map to the same file.
+        """
+        source = self.documents.fingerprint(input_pdf_path) or os.path.abspath(
+            input_pdf_path
+        )
+        version = make_cache_key(
+            source,
+            [
+                (r["old"].lower(), r["new"])
+                for r in self._normalize_replacements(replacements)
+            ],
+        )[:16]
+        name, ext = os.path.splitext(os.path.basename(input_pdf_path))
+        return os.path.join(
+            os.path.dirname(input_pdf_path), f"{name}_tailored_{version}{ext}"
+        )
+
+    def _collect_tailored_resumes(self, output_pdf_path):
+        """Delete the least recently used tailored copies beyond the size cap"""
+        directory = os.path.dirname(output_pdf_path) or "."
+        prefix = os.path.basename(output_pdf_path).rsplit("_tailored_", 1)[0]
+        max_bytes = self.tailored_resume_cache_mb * 1024 * 1024
+        try:
+            copies = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in os.scandir(directory)
+                if entry.is_file() and entry.name.startswith(f"{prefix}_tailored_")
+            ]
+            total = 0
+            for _, size, path in sorted(copies, reverse=True):
+                total += size
+                if total > max_bytes and not os.path.samefile(path, output_pdf_path):
+                    os.remove(path)
+                    print(f"Removed old tailored resume: {path}")
+        except OSError as e:
+            print(f"Could not clean up tailored resumes: {str(e)}")
+
     def tailor_resume_pdf(self, replacements, input_pdf_path):
         try:
             if not input_pdf_path:
                 print("Error: Input PDF path is not provided.")
                 return None
 
+            replacements = self._normalize_replacements(replacements)
+            output_pdf_path = self.tailored_resume_path(input_pdf_path, replacements)
+            if os.path.exists(output_pdf_path):
+                # Another job already produced this replacement set
+                print(f"Reusing tailored resume: {output_pdf_path}")
+                os.utime(output_pdf_path)
+                if self.resume_dir != output_pdf_path:
+                    self.resume_dir = output_pdf_path
+                    self.invalidate_resume()
+                return output_pdf_path
+
             print(f"Starting to tailor PDF: {input_pdf_path}")
             pdf_reader = PyPDF2.PdfReader(input_pdf_path)
             pdf_writer = PyPDF2.PdfWriter()
+            # Page texts come from the document cache when this file was seen before
+            page_texts = self.documents.pages(input_pdf_path, reader=pdf_reader)
 
             modified_texts = []
+            # All skills are replaced in one case-insensitive pass per page,
+            # longest first so that e.g. "Java" doesn't cut into "JavaScript"
+            new_skills = {r["old"].lower(): r["new"] for r in replacements}
+            pattern = re.compile(
+                "|".join(
+                    re.escape(r["old"])
+                    for r in sorted(replacements, key=lambda r: -len(r["old"]))
+                ),
+                re.IGNORECASE,
+            )
 
             for page_num in range(len(pdf_reader.pages)):
                 page = pdf_reader.pages[page_num]
                 try:
-                    original_text = page.extract_text()
+                    original_text = page_texts[page_num]
                     if original_text is None:
                         print(
                             f"Warning: Could not extract text from page {page_num + 1}."
@@ -458,16 +1229,22 @@ class AIResponseGenerator:
                         pdf_writer.add_page(page)
                         continue
 
-                    modified_page_text = original_text
+                    replaced = set()
+
+                    def substitute(match):
+                        old_key = match.group(0).lower()
+                        replaced.add(old_key)
+                        return new_skills.get(old_key, match.group(0))
+
+                    modified_page_text = (
+                        pattern.sub(substitute, original_text)
+                        if replacements
+                        else original_text
+                    )
                     for r in replacements:
                         old_skill = r["old"]
                         new_skill = r["new"]
-                        # Use re.compile for case-insensitive search and re.escape for literal matching
-                        pattern = re.compile(re.escape(old_skill), re.IGNORECASE)
-                        if pattern.search(modified_page_text):
-                            modified_page_text = pattern.sub(
-                                new_skill, modified_page_text
-                            )
+                        if old_skill.lower() in replaced:
                             print(
                                 f"  Page {page_num + 1}: Replaced '{old_skill}' (case-insensitively) with '{new_skill}'"
                             )
@@ -496,24 +1273,18 @@ class AIResponseGenerator:
                     # Add original page in case of error processing it
                     pdf_writer.add_page(page)
 
-            # Define dynamic output path based on input path
-            directory = os.path.dirname(input_pdf_path)
-            base_name = os.path.basename(input_pdf_path)
-            name, ext = os.path.splitext(base_name)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_pdf_path = os.path.join(
-                directory, f"{name}_tailored_{timestamp}{ext}"
-            )
-
             with open(output_pdf_path, "wb") as output_file:
                 pdf_writer.write(output_file)
+            # The pages are copied unchanged, so the tailored PDF has the same text
+            self.documents.store(output_pdf_path, page_texts)
+            if os.path.exists(output_pdf_path):
+                self._collect_tailored_resumes(output_pdf_path)
 
             self.resume_dir = (
                 output_pdf_path  # Update the resume_dir with the path of the new PDF
             )
-            self._resume_content = (
-                None  # Reset resume content so it's re-read next time
-            )
+            # Re-read the resume and update the index next time it's needed
+            self.invalidate_resume()
 
             print(
                 f"Resume tailoring process complete. Modified PDF (original structure preserved) saved to: {output_pdf_path}"
@@ -550,54 +1321,60 @@ class AIResponseGenerator:
         self, question_text, response_type="text", options=None, max_tokens=100, jd=""
     ):
         """
-        Generate a response using OpenAI's API with RAG-optimized context
+        Generate a response using OpenAI's API with RAG-optimized context.
+        Answers are served from the persistent answer cache when the same
+        question was already answered for this profile, or from the question
+        memory when a reworded variant of it was.
         """
-        try:
-            # Use RAG context with job description
-            context = self._build_context_rag(
-                query=question_text, job_description=jd, max_tokens=1500
-            )
+        known = self._known_answer(question_text, response_type, options, jd)
+        if known is not None:
+            answer, parsed = known
+            self._last_ai_response_text = answer
+            return parsed
+
+        parsed, answer = self._answer_question(
+            question_text, response_type, options, jd
+        )
+        if answer is not None:
+            # Store original answer as attribute for CSV logging
+            self._last_ai_response_text = answer
+        return parsed
 
+    def _answer_question(self, question_text, response_type, options=None, jd=""):
+        """
+        Ask the model one question, bypassing the caches for the lookup.
+        Returns ``(parsed, answer_text)``; ``answer_text`` is None on errors.
+        Safe to call from worker threads.
+        """
+        try:
             system_prompt = {
                 "text": "You are a helpful assistant answering job application questions professionally and short. Use the candidate's background information and resume to personalize responses. Pretend you are the candidate. Only give the answer if you are sure from background. Otherwise return NA.",
                 "numeric": "You are a helpful assistant providing numeric answers to job application questions. Based on the candidate's experience, provide a single number as your response. No explanation needed.",
                 "choice": "You are a helpful assistant selecting the most appropriate answer choice for job application questions. Based on the candidate's background, select the best option by returning only its index number. No explanation needed.",
             }[response_type]
 
-            user_content = f"Using this candidate's background and resume:\n{context}\n\nPlease answer this job application question: {question_text}"
+            request = f"Please answer this job application question: {question_text}"
             if response_type == "choice" and options:
                 options_text = "\n".join([f"{idx}: {text}" for idx, text in options])
-                user_content += f"\n\nSelect the most appropriate answer by providing its index number from these options:\n{options_text}"
+                request += f"\n\nSelect the most appropriate answer by providing its index number from these options:\n{options_text}"
 
-            response = completion(
-                model="groq/openai/gpt-oss-120b",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_content},
-                ],
+            # Use RAG context with job description
+            messages = self._answer_messages(
+                system_prompt,
+                query=question_text,
+                jd=jd,
+                request=request,
+                model=self.router.model_for(response_type),
+            )
+            # Small models answer simple questions; unparsable answers escalate
+            _, answer, _ = self._routed_completion(
+                response_type,
+                messages,
+                "generate_response",
+                validate=lambda answer: bool(answer)
+                and self._parse_response(answer, response_type, options) is not None,
             )
 
-            answer = response.choices[0]["message"]["content"].strip()
-            
-            # Handle reasoning tags - extract only the actual response
-            # Some models return responses in format: <tag>...</tag> Actual answer here
-            # Handle both <think> and <think> tags used by different models
-            reasoning_tags = [
-                ("<think>", "</think>"),
-                ("<think>", "</think>"),
-            ]
-            
-            for open_tag, close_tag in reasoning_tags:
-                if open_tag in answer and close_tag in answer:
-                    # Extract text after the closing tag
-                    parts = answer.split(close_tag, 1)
-                    if len(parts) > 1:
-                        answer = parts[1].strip()
-                    else:
-                        # Fallback: remove the tags if format is unexpected
-                        answer = re.sub(f'{re.escape(open_tag)}.*?{re.escape(close_tag)}', '', answer, flags=re.DOTALL).strip()
-                    break  # Only process one type of tag
-            
             # Store original answer for CSV logging (before cleaning)
             original_answer = answer
             
@@ -615,53 +1392,396 @@ class AIResponseGenerator:
             self.logger.info(log_message)
             print(f"AI response: {answer}")
 
-            # Store original answer as attribute for CSV logging
-            self._last_ai_response_text = original_answer
-
-            if response_type == "numeric":
-                numbers = re.findall(r"\d+", answer)
-                if numbers:
-                    return int(numbers[0])
-                return 0
-            elif response_type == "choice":
-                numbers = re.findall(r"\d+", answer)
-                if numbers and options:
-                    index = int(numbers[0])
-                    if 0 <= index < len(options):
-                        return index
-                return None
+            parsed = self._parse_response(answer, response_type, options)
+            if parsed is not None:
+                self._store_answer(question_text, response_type, answer, options, jd)
 
-            return answer
+            if parsed is None and response_type == "numeric":
+                return 0, original_answer
+            return parsed, original_answer
 
         except Exception as e:
             error_msg = f"Error using AI to generate response: {str(e)}\nQuestion: {question_text}\nResponse Type: {response_type}"
             self.logger.error(error_msg)
             print(f"Error using AI to generate response: {str(e)}")
+            return None, None
+
+    async def agenerate_response(
+        self, question_text, response_type="text", options=None, jd=""
+    ):
+        """
+        Async variant of ``generate_response``.
+        The model call runs in a worker thread under ``call_limiter``, so many
+        questions can be answered concurrently within the configured
+        concurrency and per-provider rate limits. Identical questions asked
+        concurrently share a single request.
+        """
+        parsed, _ = await self._agenerate(question_text, response_type, options, jd)
+        return parsed
+
+    async def agenerate_responses(self, questions, jd=""):
+        """
+        Answer all ``questions`` concurrently, see ``generate_responses`` for
+        the format. Returns the parsed answers in input order and keeps the
+        raw answer texts in ``_last_ai_response_texts``.
+        """
+        if not questions:
+            self._last_ai_response_texts = []
+            return []
+
+        # Load the embedding model and build the resume index once, and embed
+        # every question in one batch, before the workers need them
+        await asyncio.to_thread(self._build_vector_index)
+        if self.question_memory is not None:
+            await asyncio.to_thread(
+                self.prefetch_embeddings, [q["question"] for q in questions]
+            )
+        results = await asyncio.gather(
+            *(
+                self._agenerate(q["question"], q["response_type"], q.get("options"), jd)
+                for q in questions
+            )
+        )
+        self._last_ai_response_texts = [answer or "" for _, answer in results]
+        await asyncio.to_thread(self.save_question_memory)
+        return [parsed for parsed, _ in results]
+
+    def generate_responses_concurrently(self, questions, jd=""):
+        """Blocking wrapper around ``agenerate_responses`` for the Selenium handlers"""
+        return asyncio.run(self.agenerate_responses(questions, jd=jd))
+
+    async def _agenerate(self, question_text, response_type, options, jd):
+        known = await asyncio.to_thread(
+            self._known_answer, question_text, response_type, options, jd
+        )
+        if known is not None:
+            answer, parsed = known
+            return parsed, answer
+
+        key = make_cache_key(
+            normalize_text(question_text),
+            response_type,
+            [normalize_text(text) for _, text in (options or [])],
+            normalize_text(jd),
+        )
+        return await self.call_limiter.run(
+            key,
+            provider_of(self.router.model_for(response_type)),
+            self._answer_question,
+            question_text,
+            response_type,
+            options,
+            jd,
+        )
+
+    def generate_responses(self, questions, jd=""):
+        """
+        Answer several form questions with a single model call.
+
+        ``questions`` is a list of dicts with ``question``, ``response_type``
+        and optional ``options`` keys. Questions already known to the answer
+        cache or question memory are resolved locally; the rest share one RAG
+        context and one structured JSON request. Any question whose answer is
+        missing or fails to parse falls back to ``generate_response``. Returns
+        the parsed answers in input order; the raw answer texts are kept in
+        ``_last_ai_response_texts`` for CSV logging.
+        """
+        results = [None] * len(questions)
+        texts = [""] * len(questions)
+        if self.question_memory is not None:
+            self.prefetch_embeddings(q["question"] for q in questions)
+        unresolved = []
+        for i, q in enumerate(questions):
+            known = self._known_answer(
+                q["question"], q["response_type"], q.get("options"), jd
+            )
+            if known is None:
+                unresolved.append(i)
+            else:
+                texts[i], results[i] = known
+
+        if len(unresolved) > 1:
+            batch_answers = self._generate_batch([questions[i] for i in unresolved], jd)
+            for position, i in enumerate(unresolved):
+                q = questions[i]
+                answer = batch_answers.get(position)
+                if answer is None:
+                    continue
+                parsed = self._parse_response(
+                    answer, q["response_type"], q.get("options")
+                )
+                if parsed is None:
+                    continue
+                self._store_answer(
+                    q["question"], q["response_type"], answer, q.get("options"), jd
+                )
+                texts[i], results[i] = answer, parsed
+            unresolved = [i for i in unresolved if results[i] is None]
+
+        # Per-question fallback for anything the batch could not answer
+        for i in unresolved:
+            q = questions[i]
+            results[i] = self.generate_response(
+                q["question"],
+                response_type=q["response_type"],
+                options=q.get("options"),
+                jd=jd,
+            )
+            texts[i] = self._last_ai_response_text or ""
+
+        self._last_ai_response_texts = texts
+        self.save_question_memory()
+        return results
+
+    def _generate_batch(self, questions, jd=""):
+        """
+        Send one structured request for all ``questions``.
+        Returns ``{position: answer_text}``; empty if the response can't be parsed.
+        """
+        payload = []
+        for position, q in enumerate(questions):
+            item = {
+                "id": position,
+                "type": q["response_type"],
+                "question": q["question"],
+            }
+            if q["response_type"] == "choice" and q.get("options"):
+                item["options"] = {str(idx): text for idx, text in q["options"]}
+            payload.append(item)
+
+        system_prompt = (
+            "You are a helpful assistant answering several job application questions "
+            "for a candidate. Pretend you are the candidate and use only their "
+            "background and resume.\n"
+            "Answer every question according to its type:\n"
+            '- "numeric": a single whole number, no explanation.\n'
+            '- "choice": only the index number of the best option.\n'
+            '- "text": a short, professional answer. If the background does not '
+            "support an answer, return NA.\n"
+            "Return only a JSON object mapping each question id to its answer, "
+            'e.g. {"0": "5", "1": "2", "2": "Yes, I am willing to relocate."}'
+        )
+        # The batch goes to the tier of its hardest question type
+        types = {q["response_type"] for q in questions}
+        task = (
+            "text" if "text" in types else "choice" if "choice" in types else "numeric"
+        )
+        messages = self._answer_messages(
+            system_prompt,
+            query=" ".join(q["question"] for q in questions),
+            jd=jd,
+            request=f"Questions:\n{json.dumps(payload, ensure_ascii=False, indent=2)}",
+            model=self.router.model_for(task),
+        )
+
+        def answers_all(raw_answer):
+            answers = self._parse_batch_answers(raw_answer, len(questions))
+            return len(answers) == len(questions) and all(
+                self._parse_response(
+                    answers[position], q["response_type"], q.get("options")
+                )
+                is not None
+                for position, q in enumerate(questions)
+            )
+
+        try:
+            _, raw_answer, _ = self._routed_completion(
+                task,
+                messages,
+                "generate_responses",
+                validate=answers_all,
+                response_format={"type": "json_object"},
+                drop_params=True,
+            )
+        except Exception as e:
+            self.logger.warning(f"Batched question answering failed: {str(e)}")
+            return {}
+        parsed_answers = self._parse_batch_answers(raw_answer, len(questions))
+        if not parsed_answers:
+            self.logger.warning("Batched question answering failed: no JSON answers")
+            return {}
+
+        log_message = f"\n{'='*80}\n"
+        log_message += f"Batched questions: {len(questions)}\n"
+        for position, q in enumerate(questions):
+            log_message += (
+                f"[{q['response_type']}] {q['question']} -> "
+                f"{parsed_answers.get(position, '<missing>')}\n"
+            )
+        log_message += f"{'='*80}\n"
+        self.logger.info(log_message)
+        return parsed_answers
+
+    @staticmethod
+    def _parse_batch_answers(raw_answer, count):
+        """``{position: answer_text}`` from a batched JSON response"""
+        try:
+            answers = json.loads(re.search(r"\{.*\}", raw_answer, re.DOTALL).group())
+        except (AttributeError, ValueError):
+            return {}
+        if not isinstance(answers, dict):
+            return {}
+        if isinstance(answers.get("answers"), dict):
+            answers = answers["answers"]
+
+        parsed_answers = {}
+        for key, value in answers.items():
+            try:
+                position = int(key)
+            except (TypeError, ValueError):
+                continue
+            if 0 <= position < count and value is not None:
+                parsed_answers[position] = str(value).strip()
+        return parsed_answers
+
+    def _known_answer(self, question_text, response_type, options, jd):
+        """Return ``(answer, parsed)`` from the answer cache or question memory"""
+        with self._memory_lock:
+            return self._lookup_known_answer(question_text, response_type, options, jd)
+
+    def _lookup_known_answer(self, question_text, response_type, options, jd):
+        cache_key = None
+        if self.answer_cache is not None:
+            cache_key = self._answer_cache_key(
+                question_text, response_type, options, jd
+            )
+            cached_answer = self.answer_cache.get(cache_key)
+            if cached_answer is not None:
+                parsed = self._parse_response(cached_answer, response_type, options)
+                if parsed is not None:
+                    if self.debug:
+                        print(f"Answer cache hit: {question_text}")
+                    return cached_answer, parsed
+
+        reused = self._reuse_similar_answer(question_text, response_type, options, jd)
+        if reused is not None and cache_key is not None:
+            self.answer_cache.set(cache_key, reused[0])
+        return reused
+
+    def _store_answer(self, question_text, response_type, answer, options, jd):
+        with self._memory_lock:
+            self._remember_answer(question_text, response_type, answer, options, jd)
+            if self.answer_cache is not None:
+                self.answer_cache.set(
+                    self._answer_cache_key(question_text, response_type, options, jd),
+                    answer,
+                )
+
+    @staticmethod
+    def _strip_reasoning(answer):
+        """
+        Handle reasoning tags - extract only the actual response.
+        Some models return responses in format: <think>...</think> Actual answer here
+        """
+        open_tag, close_tag = "<think>", "</think>"
+        if open_tag in answer and close_tag in answer:
+            # Extract text after the closing tag
+            parts = answer.split(close_tag, 1)
+            if len(parts) > 1:
+                return parts[1].strip()
+            # Fallback: remove the tags if format is unexpected
+            return re.sub(
+                f"{re.escape(open_tag)}.*?{re.escape(close_tag)}",
+                "",
+                answer,
+                flags=re.DOTALL,
+            ).strip()
+        return answer
+
+    def _reuse_similar_answer(self, question_text, response_type, options, jd):
+        """Return ``(answer, parsed)`` from a near-duplicate question, if any"""
+        if self.question_memory is None:
+            return None
+        try:
+            match = self.question_memory.lookup(
+                question_text, response_type, options, jd
+            )
+        except Exception as e:
+            print(f"Question memory lookup failed: {str(e)}")
+            return None
+        if match is None:
+            return None
+
+        answer, score, matched_question = match
+        parsed = self._parse_response(answer, response_type, options)
+        if parsed is None:
+            return None
+        self.logger.info(
+            f"Reused answer (similarity {score:.3f}) from '{matched_question}' "
+            f"for '{question_text}': {answer}"
+        )
+        return answer, parsed
+
+    def _remember_answer(self, question_text, response_type, answer, options, jd):
+        if self.question_memory is None:
+            return
+        try:
+            self.question_memory.add(question_text, response_type, answer, options, jd)
+        except Exception as e:
+            print(f"Could not add answer to question memory: {str(e)}")
+
+    @staticmethod
+    def _parse_response(answer, response_type, options=None):
+        """Convert a cleaned model answer to the value expected for the response type"""
+        if response_type == "numeric":
+            numbers = re.findall(r"\d+", answer)
+            if numbers:
+                return int(numbers[0])
+            return None
+        elif response_type == "choice":
+            numbers = re.findall(r"\d+", answer)
+            if numbers and options:
+                index = int(numbers[0])
+                if 0 <= index < len(options):
+                    return index
             return None
 
+        return answer
+
     def evaluate_job_fit(self, job_title, job_description):
         """
-        Evaluate job fit using RAG for more focused comparison
+        Evaluate job fit using RAG for more focused comparison.
+        The job summary and decision are stored under a hash of the normalized
+        job description, so reposts and repeated searches are answered from
+        the job fit cache until the profile changes.
         """
+        fit_key = make_cache_key(normalize_text(job_description))
+        record = self._cached_job_fit(fit_key)
+        if record and record.get("decision"):
+            self.job_fit_tiers["cache"] += 1
+            print(
+                f"Decision (cached {record['evaluated_at']}): {record['decision']}"
+            )
+            return record["decision"] == "APPLY"
+
+        if self.job_fit_prefilter:
+            decision = self._prefilter_job_fit(job_title, job_description)
+            if decision is not None:
+                self.job_fit_tiers[f"prefilter_{decision.lower()}"] += 1
+                return decision == "APPLY"
+
+        self.job_fit_tiers["llm"] += 1
         try:
             # First, get job summary
-            system_prompt = "Given Job description summarize it in 120 words, focus on qualifications and years of experience and technical skills. Expertise needed"
-            response = completion(
-                model=self.model_name,
-                messages=[
+            if record and record.get("summary"):
+                job_summary = record["summary"]
+            else:
+                system_prompt = "Given Job description summarize it in 120 words, focus on qualifications and years of experience and technical skills. Expertise needed"
+                messages = [
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": f"Job: {job_title}\n{job_description}"},
-                ],
-            )
-
-            job_summary = response.choices[0]["message"]["content"].strip()
-            time.sleep(random.uniform(2, 4))
+                ]
+                _, job_summary, _ = self._routed_completion(
+                    "summary", messages, "job_summary", validate=bool
+                )
+                self._store_job_fit(fit_key, job_summary)
 
             # Use RAG to get relevant context for the job
             context = self._build_context_rag(
                 query=f"{job_title} requirements qualifications",
                 job_description=job_summary,
                 max_tokens=1200,
+                model=self.router.model_for("fit_decision"),
             )
 
             system_prompt = """
@@ -674,78 +1794,56 @@ class AIResponseGenerator:
                 The decision must appear after the closing tag.
             """
 
-            if self.debug:
+            if self.job_fit_mode == "decision_only":
+                system_prompt = """
+                Based on the candidate's resume and the job description, respond with APPLY if the resume matches at least 85 percent of the required qualifications and experience. Otherwise, respond with SKIP.
+                Do not explain or reason. Return only APPLY or SKIP.
+            """
+            elif self.debug:
                 system_prompt += """Return APPLY or SKIP followed by a brief explanation. Format response as: <think>reasoning</think> APPLY/SKIP: [brief reason]"""
             else:
                 system_prompt += """Return only: <think>reasoning</think> APPLY or <think>reasoning</think> SKIP"""
+            if self.job_fit_mode == "stream":
+                system_prompt += """
+                If you are certain of the decision before finishing your reasoning, write DECISION: APPLY or DECISION: SKIP on its own line right away."""
+
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {
+                    "role": "user",
+                    "content": f"Job: {job_title}\n{job_summary}\n\nCandidate:\n{context}",
+                },
+            ]
+            if self.job_fit_mode == "full":
+                response, _, _ = self._routed_completion(
+                    "fit_decision",
+                    messages,
+                    "job_fit",
+                    # Escalate when the answer has no decision outside the reasoning
+                    validate=lambda answer: JOB_FIT_DECISION.search(f"{answer} ")
+                    is not None,
+                    temperature=0.9,
+                    # Increase max tokens significantly to accommodate long reasoning tags + decision
+                    # Models with <think> tags can generate very long reasoning, so we need ample space
+                    max_completion_tokens=1500 if self.debug else 1000,
+                )
+                raw_answer = response.choices[0]["message"]["content"].strip()
+                finish_reason = response.choices[0].get("finish_reason", "")
+                decision = None
+            else:
+                raw_answer, decision, finish_reason = self._stream_job_fit_decision(
+                    messages
+                )
 
-            response = completion(
-                model="groq/qwen/qwen3-32b",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {
-                        "role": "user",
-                        "content": f"Job: {job_title}\n{job_summary}\n\nCandidate:\n{context}",
-                    },
-                ],
-                temperature=0.9,
-                # Increase max tokens significantly to accommodate long reasoning tags + decision
-                # Models with <think> tags can generate very long reasoning, so we need ample space
-                max_completion_tokens=1500 if self.debug else 1000,
-            )
-
-            answer = response.choices[0]["message"]["content"].strip()
-            raw_answer = answer  # Keep original for logging
-            
             # Check if response was truncated (common with long reasoning)
-            finish_reason = response.choices[0].get("finish_reason", "")
             was_truncated = finish_reason == "length"  # Token limit reached
-            
-            # Handle reasoning tags - extract only the actual response
-            # Some models return responses in format: <tag>...</tag> Actual answer here
-            reasoning_tags = [
-                ("<think>", "</think>"),
-                ("<think>", "</think>"),
-            ]
-            
-            # First, try to extract decision from after the closing tag
-            decision_found = False
-            for open_tag, close_tag in reasoning_tags:
-                if open_tag in answer and close_tag in answer:
-                    # Extract text after the closing tag
-                    parts = answer.split(close_tag, 1)
-                    if len(parts) > 1:
-                        answer_after_tags = parts[1].strip()
-                        # Check if decision is in the text after tags
-                        answer_upper = answer_after_tags.upper()
-                        if "APPLY" in answer_upper:
-                            decision = "APPLY"
-                            decision_found = True
-                            answer = answer_after_tags
-                            break
-                        elif "SKIP" in answer_upper:
-                            decision = "SKIP"
-                            decision_found = True
-                            answer = answer_after_tags
-                            break
-                    break  # Only process one type of tag
-            
-            # If decision not found after tags, search the entire response
-            if not decision_found:
-                answer_upper = answer.upper()
-                if "APPLY" in answer_upper:
-                    decision = "APPLY"
-                elif "SKIP" in answer_upper:
-                    decision = "SKIP"
-                else:
-                    # Fallback: check if it starts with A (for APPLY) or S (for SKIP)
-                    # If truncated and no decision found, default to SKIP (safer)
-                    if was_truncated:
-                        decision = "SKIP"
-                        self.logger.warning(f"Response was truncated and no clear decision found. Defaulting to SKIP.")
-                    else:
-                        decision = "APPLY" if answer_upper.startswith("A") else "SKIP"
-            
+            if decision is None:
+                decision, answer = self._parse_job_fit_answer(
+                    raw_answer, was_truncated
+                )
+            else:
+                answer = self._strip_reasoning(raw_answer) or decision
+
             # Warn if response was truncated
             if was_truncated:
                 self.logger.warning(f"Response was truncated (finish_reason: {finish_reason}). Decision extracted: {decision}")
@@ -755,7 +1853,7 @@ class AIResponseGenerator:
             log_message += f"JOB FIT EVALUATION\n"
             log_message += f"Job Title: {job_title}\n"
             log_message += f"Job Description (first 300 chars): {job_description[:300]}...\n"
-            log_message += f"AI Evaluation (raw): {response.choices[0]['message']['content'].strip()}\n"
+            log_message += f"AI Evaluation (raw): {raw_answer}\n"
             log_message += f"AI Evaluation (cleaned): {answer}\n"
             log_message += f"Decision: {decision}\n"
             log_message += f"{'='*80}\n"
@@ -763,7 +1861,8 @@ class AIResponseGenerator:
             self.logger.info(log_message)
             print(f"AI evaluation: {answer}")
             print(f"Decision: {decision}")
-            time.sleep(random.uniform(2, 4))
+            if not was_truncated:
+                self._store_job_fit(fit_key, job_summary, decision)
             return decision == "APPLY"
 
         except Exception as e:
@@ -771,3 +1870,202 @@ class AIResponseGenerator:
             self.logger.error(error_msg)
             print(f"Error evaluating job fit: {str(e)}")
             return True
+
+    def job_fit_similarity(self, job_description, top_k=5):
+        """
+        Embedding similarity between a job description and the resume.
+
+        The description is split into paragraphs, which are embedded in one
+        batch; each paragraph is scored by its best-matching resume chunk, and
+        the score is the mean of the ``top_k`` best paragraphs, so boilerplate
+        (benefits, EEO statements) doesn't drag it down. None if either side
+        has nothing to compare.
+        """
+        segments = [
+            segment.strip()
+            for segment in re.split(r"\n\s*\n|\n", job_description or "")
+            if len(segment.strip()) > 30
+        ][:32]
+        if not segments:
+            return None
+
+        self._build_vector_index()
+        if self._chunk_embeddings is None or not len(self._chunk_embeddings):
+            return None
+
+        similarities = self._encode_texts(segments) @ self._chunk_embeddings.T
+        best_per_segment = np.sort(similarities.max(axis=1))[::-1]
+        return float(best_per_segment[:top_k].mean())
+
+    def _prefilter_job_fit(self, job_title, job_description):
+        """APPLY or SKIP when the similarity is clearly outside the thresholds, else None"""
+        try:
+            score = self.job_fit_similarity(job_description)
+        except Exception as e:
+            print(f"Job fit prefilter failed, asking the AI: {str(e)}")
+            return None
+        if score is None:
+            return None
+
+        if score < self.job_fit_skip_below:
+            decision = "SKIP"
+        elif score > self.job_fit_apply_above:
+            decision = "APPLY"
+        else:
+            self.logger.info(
+                f"Job fit prefilter: {job_title} scored {score:.3f}, asking the AI"
+            )
+            return None
+
+        self.logger.info(
+            f"Job fit prefilter: {job_title} scored {score:.3f} -> {decision}"
+        )
+        print(f"Decision (similarity {score:.2f}): {decision}")
+        return decision
+
+    def _stream_job_fit_decision(self, messages):
+        """
+        Stream the job fit response and stop reading as soon as a decision is
+        known. Returns ``(text_so_far, decision_or_None, finish_reason)``; the
+        decision is None when the stream ended without an early decision.
+        """
+        decision_only = self.job_fit_mode == "decision_only"
+        if decision_only:
+            # reasoning_effort="none" turns off Qwen3 thinking on Groq; dropped
+            # for providers that don't support it
+            options = dict(
+                temperature=0,
+                max_completion_tokens=20,
+                reasoning_effort="none",
+                drop_params=True,
+            )
+        else:
+            options = dict(
+                temperature=0.9, max_completion_tokens=1500 if self.debug else 1000
+            )
+        tier, model = self.router.route("fit_decision")[0]
+        started = time.monotonic()
+        response = self._scheduled_completion(model, messages, stream=True, **options)
+        prompt_tokens = self._record_prompt_tokens(None, messages, model, "job_fit")
+
+        text, decision, finish_reason = "", None, ""
+        try:
+            for chunk in response:
+                choice = chunk.choices[0]
+                delta = choice.delta
+                if isinstance(delta, dict):
+                    content = delta.get("content")
+                else:
+                    content = getattr(delta, "content", None)
+                text += content or ""
+                finish_reason = getattr(choice, "finish_reason", None) or finish_reason
+                decision = self._early_job_fit_decision(text, decision_only)
+                if decision is not None:
+                    break
+        finally:
+            # Closing the stream stops generation instead of draining the reasoning
+            close = getattr(response, "close", None)
+            if callable(close):
+                close()
+            completion_tokens = count_tokens(text, model)
+            self.router.record(
+                tier,
+                model,
+                time.monotonic() - started,
+                prompt_tokens,
+                completion_tokens,
+            )
+            # Streams report no usage; settle the reservation with local counts
+            self.scheduler.settle(
+                model,
+                self._estimate_tokens(model, messages, options),
+                prompt_tokens + completion_tokens,
+            )
+        return text.strip(), decision, finish_reason or ""
+
+    @staticmethod
+    def _early_job_fit_decision(text, decision_only=False):
+        """APPLY/SKIP if ``text`` (a partial response) already settles the decision"""
+        signal = JOB_FIT_SIGNAL.search(text)
+        if signal:
+            return signal.group(1).upper()
+        if "</think>" in text:
+            tail = text.split("</think>", 1)[1]
+        elif decision_only and "<think>" not in text:
+            tail = text
+        else:
+            return None
+        match = JOB_FIT_DECISION.search(tail)
+        return match.group(1).upper() if match else None
+
+    def _parse_job_fit_answer(self, answer, was_truncated):
+        """Extract ``(decision, cleaned_answer)`` from a complete job fit response"""
+        # Handle reasoning tags - extract only the actual response
+        # Some models return responses in format: <tag>...</tag> Actual answer here
+        reasoning_tags = [
+            ("<think>", "</think>"),
+            ("<think>", "</think>"),
+        ]
+        
+        # First, try to extract decision from after the closing tag
+        decision_found = False
+        for open_tag, close_tag in reasoning_tags:
+            if open_tag in answer and close_tag in answer:
+                # Extract text after the closing tag
+                parts = answer.split(close_tag, 1)
+                if len(parts) > 1:
+                    answer_after_tags = parts[1].strip()
+                    # Check if decision is in the text after tags
+                    answer_upper = answer_after_tags.upper()
+                    if "APPLY" in answer_upper:
+                        decision = "APPLY"
+                        decision_found = True
+                        answer = answer_after_tags
+                        break
+                    elif "SKIP" in answer_upper:
+                        decision = "SKIP"
+                        decision_found = True
+                        answer = answer_after_tags
+                        break
+                break  # Only process one type of tag
+        
+        # If decision not found after tags, search the entire response
+        if not decision_found:
+            answer_upper = answer.upper()
+            if "APPLY" in answer_upper:
+                decision = "APPLY"
+            elif "SKIP" in answer_upper:
+                decision = "SKIP"
+            else:
+                # Fallback: check if it starts with A (for APPLY) or S (for SKIP)
+                # If truncated and no decision found, default to SKIP (safer)
+                if was_truncated:
+                    decision = "SKIP"
+                    self.logger.warning(f"Response was truncated and no clear decision found. Defaulting to SKIP.")
+                else:
+                    decision = "APPLY" if answer_upper.startswith("A") else "SKIP"
+        return decision, answer
+
+    def _cached_job_fit(self, fit_key):
+        if self.job_fit_cache is None:
+            return None
+        try:
+            return self.job_fit_cache.get(fit_key)
+        except Exception as e:
+            print(f"Job fit cache lookup failed: {str(e)}")
+            return None
+
+    def _store_job_fit(self, fit_key, summary, decision=None):
+        if self.job_fit_cache is None:
+            return
+        try:
+            self.job_fit_cache.set(
+                fit_key,
+                {
+                    "summary": summary,
+                    "decision": decision,
+                    "evaluated_at": datetime.now().isoformat(timespec="seconds"),
+                },
+            )
+        except Exception as e:
+            print(f"Could not store job fit result: {str(e)}")
@@ -0,0 +1,253 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+
+def make_cache_key(*parts):
+    """Stable content hash of the given parts, usable across processes"""
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def normalize_text(text):
+    """Lowercase, strip punctuation and collapse whitespace for cache keys"""
+    text = (text or "").lower()
+    text = "".join(ch if ch.isalnum() else " " for ch in text)
+    return " ".join(text.split())
+
+
+class PersistentCache:
+    """
+    SQLite-backed key/value store shared by the AI caches.
+
+    Values are stored as JSON under a namespace, expire after ``ttl_seconds``
+    and are evicted least-recently-used once a namespace holds more than
+    ``max_entries`` rows. Entries written under a different ``scope`` (e.g. a
+    fingerprint of the candidate profile) are never returned, so changing the
+    resume invalidates everything derived from it. They are kept, though:
+    several profiles or processes can share one file, and the entries of a
+    profile no longer in use age out through TTL and LRU eviction.
+    """
+
+    def __init__(self, path, namespace, ttl_seconds=None, max_entries=10000, scope=""):
+        self.path = Path(path)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.scope = scope
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False
+        )
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    scope TEXT NOT NULL DEFAULT '',
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, scope, key)
+                )
+                """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_lru ON cache (namespace, accessed_at)"
+            )
+
+    def get(self, key, default=None):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM cache "
+                "WHERE namespace = ? AND key = ? AND scope = ?",
+                (self.namespace, key, self.scope),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+
+            value, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                with self._conn:
+                    self._conn.execute(
+                        "DELETE FROM cache "
+                        "WHERE namespace = ? AND key = ? AND scope = ?",
+                        (self.namespace, key, self.scope),
+                    )
+                self.evictions += 1
+                self.misses += 1
+                return default
+
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE cache SET accessed_at = ? "
+                    "WHERE namespace = ? AND key = ? AND scope = ?",
+                    (now, self.namespace, key, self.scope),
+                )
+            self.hits += 1
+        return json.loads(value)
+
+    def set(self, key, value):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache "
+                "(namespace, key, value, scope, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), self.scope, now, now),
+            )
+            self._evict()
+
+    def delete(self, key):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ? AND scope = ?",
+                (self.namespace, key, self.scope),
+            )
+
+    def clear(self):
+        """Drop the entries of this scope; other scopes keep theirs"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND scope = ?",
+                (self.namespace, self.scope),
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM cache WHERE namespace = ? AND scope = ?",
+                (self.namespace, self.scope),
+            ).fetchone()[0]
+
+    def _evict(self):
+        """Drop expired rows, then the least recently used rows over the size cap"""
+        if self.ttl_seconds:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND created_at < ?",
+                (self.namespace, time.time() - self.ttl_seconds),
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        if self.max_entries:
+            cursor = self._conn.execute(
+                """
+                DELETE FROM cache WHERE rowid IN (
+                    SELECT rowid FROM cache WHERE namespace = ?
+                    ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.namespace, self.max_entries),
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self),
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class LRUCache:
+    """
+    In-memory least-recently-used cache bounded by entry count and total size.
+
+    Sizes are measured by ``sizeof`` (by default the length of the JSON-encoded
+    value), so memory stays flat however many distinct keys are seen. When
+    ``backing`` (a ``PersistentCache``) is given, writes go through to it and
+    in-memory misses are looked up there, which lets entries be shared across
+    runs and processes.
+    """
+
+    def __init__(
+        self, max_entries=256, max_bytes=16 * 1024 * 1024, backing=None, sizeof=None
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.backing = backing
+        self.sizeof = sizeof or (lambda value: len(json.dumps(value)))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+
+        value = self.backing.get(key) if self.backing is not None else None
+        if value is None:
+            with self._lock:
+                self.misses += 1
+            return default
+
+        with self._lock:
+            self.hits += 1
+            self._put(key, value)
+        return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._put(key, value)
+        if self.backing is not None:
+            self.backing.set(key, value)
+
+    def _put(self, key, value):
+        size = self.sizeof(value)
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[1]
+        if self.max_bytes and size > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self._bytes += size
+        while (self.max_entries and len(self._entries) > self.max_entries) or (
+            self.max_bytes and self._bytes > self.max_bytes
+        ):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.backing is not None:
+            self.backing.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "bytes": self._bytes,
+        }
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+# Requests per minute allowed per LLM provider when none are configured
+DEFAULT_PROVIDER_RATE_LIMITS = {"groq": 30}
+
+
+def provider_of(model):
+    """LiteLLM provider prefix of a model name, e.g. ``groq`` for ``groq/...``"""
+    return model.split("/", 1)[0] if "/" in model else "openai"
+
+
+class AsyncCallLimiter:
+    """
+    Runs blocking LLM calls from asyncio with a bounded number in flight.
+
+    Calls run in worker threads, at most ``max_concurrency`` at a time, and are
+    spaced out per provider so that no more than ``requests_per_minute[provider]``
+    start within a minute. Concurrent calls sharing a ``key`` (the same prompt)
+    are de-duplicated: only the first one runs and the others await its result.
+    """
+
+    def __init__(self, max_concurrency=4, requests_per_minute=None):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.requests_per_minute = dict(
+            DEFAULT_PROVIDER_RATE_LIMITS
+            if requests_per_minute is None
+            else requests_per_minute
+        )
+        self.calls = 0
+        self.deduplicated = 0
+        self._next_start = {}
+        self._loop = None
+        self._semaphore = None
+        self._inflight = {}
+
+    def _bind_loop(self):
+        # Semaphores and tasks belong to one event loop; every asyncio.run() gets
+        # a fresh one, so reset the per-loop state when the loop changes.
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._inflight = {}
+
+    async def run(self, key, provider, func, *args, **kwargs):
+        self._bind_loop()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._call(provider, func, *args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.deduplicated += 1
+        # Shielded so that one cancelled caller doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _call(self, provider, func, *args, **kwargs):
+        async with self._semaphore:
+            await self._wait_for_rate_limit(provider)
+            self.calls += 1
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def _wait_for_rate_limit(self, provider):
+        rate = self.requests_per_minute.get(provider)
+        if not rate:
+            return
+        now = time.monotonic()
+        start = max(now, self._next_start.get(provider, now))
+        self._next_start[provider] = start + 60.0 / rate
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def stats(self):
+        return {"calls": self.calls, "deduplicated": self.deduplicated}
@@ -0,0 +1,220 @@
+import hashlib
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
+
+from src.ai.cache import make_cache_key
+from src.utils.lazy_import import lazy_import
+
+PyPDF2 = lazy_import("PyPDF2")
+
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _extract_pdf_range(path, start, stop):
+    """Text of pages ``start``..``stop`` of a PDF; runs in a worker process"""
+    reader = PyPDF2.PdfReader(path)
+    return [reader.pages[i].extract_text() for i in range(start, stop)]
+
+
+def _extract_docx(path):
+    """Paragraph text of a .docx file, read straight from its document XML"""
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    paragraphs = []
+    for paragraph in root.iter(f"{WORD_NAMESPACE}p"):
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f"{WORD_NAMESPACE}t":
+                parts.append(node.text or "")
+            elif node.tag == f"{WORD_NAMESPACE}tab":
+                parts.append("\t")
+            elif node.tag in (f"{WORD_NAMESPACE}br", f"{WORD_NAMESPACE}cr"):
+                parts.append("\n")
+        paragraphs.append("".join(parts).strip())
+    # Blank lines between paragraphs, as the resume chunker splits on them
+    return "\n\n".join(text for text in paragraphs if text)
+
+
+class DocumentExtractor:
+    """
+    Text of resume documents (PDF, DOCX, plain text), parsed once per version.
+
+    Extracted pages are stored in ``cache`` (a ``PersistentCache``) under the
+    SHA-256 of the file content, with a second entry keyed by path, mtime and
+    size pointing at that hash, so an unchanged file is neither parsed nor
+    hashed again and a copied or touched file is hashed but not parsed. PDFs
+    with at least ``parallel_min_pages`` pages are split across a process pool.
+    ``pdf_reader`` opens PDFs (``PyPDF2.PdfReader`` by default).
+    """
+
+    def __init__(
+        self, cache=None, max_workers=None, parallel_min_pages=8, pdf_reader=None
+    ):
+        self.cache = cache
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.parallel_min_pages = parallel_min_pages
+        self._pdf_reader = pdf_reader or (lambda path: PyPDF2.PdfReader(path))
+        self._memory = {}
+        self._lock = threading.Lock()
+        self.parsed = 0
+        self.hits = 0
+
+    @staticmethod
+    def _stat_key(path):
+        """Key of the file version, or None when the file can't be stat'ed"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return make_cache_key(
+            "document", os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+        )
+
+    @staticmethod
+    def _content_hash(path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _cache_get(self, key):
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.get(key)
+        except Exception as e:
+            print(f"Document cache lookup failed: {str(e)}")
+            return None
+
+    def _cache_set(self, key, value):
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(key, value)
+        except Exception as e:
+            print(f"Could not store extracted document: {str(e)}")
+
+    def _cached_pages(self, stat_key, path):
+        """Pages of an already parsed version of ``path`` and the content hash"""
+        if stat_key in self._memory:
+            return self._memory[stat_key], None
+        record = self._cache_get(stat_key)
+        content_hash = record["sha256"] if record else self._content_hash(path)
+        document = self._cache_get(make_cache_key("content", content_hash))
+        if document is not None:
+            if record is None:
+                self._cache_set(stat_key, {"sha256": content_hash})
+            return document["pages"], content_hash
+        return None, content_hash
+
+    def pages(self, path, reader=None):
+        """
+        Text per page of ``path``; DOCX and text files are a single page.
+        ``reader`` is an already opened PDF reader for ``path`` to parse with.
+        Pages whose text can't be extracted are None.
+        """
+        path = str(path)
+        stat_key = self._stat_key(path)
+        if stat_key is None:
+            # Not a readable file on disk (e.g. a stream): parse, don't cache
+            return self._parse(path, reader)
+
+        with self._lock:
+            pages, content_hash = self._cached_pages(stat_key, path)
+            if pages is not None:
+                self.hits += 1
+                self._memory[stat_key] = pages
+                return list(pages)
+
+        pages = self._parse(path, reader)
+        with self._lock:
+            self.parsed += 1
+            self._memory[stat_key] = pages
+            self._cache_set(make_cache_key("content", content_hash), {"pages": pages})
+            self._cache_set(stat_key, {"sha256": content_hash})
+        return list(pages)
+
+    def fingerprint(self, path):
+        """SHA-256 of the content of ``path``, or None if it can't be read"""
+        stat_key = self._stat_key(str(path))
+        if stat_key is None:
+            return None
+        with self._lock:
+            record = self._cache_get(stat_key)
+            if record is not None:
+                return record["sha256"]
+            try:
+                content_hash = self._content_hash(str(path))
+            except OSError:
+                return None
+            self._cache_set(stat_key, {"sha256": content_hash})
+            return content_hash
+
+    def text(self, path):
+        return "\n".join(page or "" for page in self.pages(path))
+
+    def store(self, path, pages):
+        """Record the known page texts of ``path``, e.g. a copy just written"""
+        stat_key = self._stat_key(str(path))
+        if stat_key is None:
+            return
+        try:
+            content_hash = self._content_hash(str(path))
+        except OSError:
+            return
+        with self._lock:
+            self._memory[stat_key] = list(pages)
+            self._cache_set(
+                make_cache_key("content", content_hash), {"pages": list(pages)}
+            )
+            self._cache_set(stat_key, {"sha256": content_hash})
+
+    def _parse(self, path, reader=None):
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".docx":
+            return [_extract_docx(path)]
+        if extension != ".pdf":
+            with open(path, "r", encoding="utf-8") as f:
+                return [f.read()]
+        return self._parse_pdf(path, reader)
+
+    def _parse_pdf(self, path, reader=None):
+        reader = reader if reader is not None else self._pdf_reader(path)
+        page_count = len(reader.pages)
+        if page_count >= self.parallel_min_pages and self.max_workers > 1:
+            try:
+                return self._parse_pdf_parallel(path, page_count)
+            except Exception as e:
+                print(f"Parallel PDF extraction failed, extracting serially: {str(e)}")
+
+        pages = []
+        for page_num in range(page_count):
+            try:
+                pages.append(reader.pages[page_num].extract_text())
+            except Exception as e:
+                print(f"Could not extract text from page {page_num + 1}: {str(e)}")
+                pages.append(None)
+        return pages
+
+    def _parse_pdf_parallel(self, path, page_count):
+        workers = min(self.max_workers, page_count)
+        step = -(-page_count // workers)
+        ranges = [
+            (start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            results = pool.map(
+                _extract_pdf_range,
+                [path] * len(ranges),
+                [start for start, _ in ranges],
+                [stop for _, stop in ranges],
+            )
+            return [text for chunk in results for text in chunk]
+
+    def stats(self):
+        return {"parsed": self.parsed, "hits": self.hits}
@@ -0,0 +1,70 @@
+import threading
+
+import numpy as np
+
+from src.ai.cache import LRUCache, make_cache_key
+
+
+class EmbeddingService:
+    """
+    Batched, memoized sentence embeddings.
+
+    ``encode`` returns one L2-normalized float32 vector per input text. Texts
+    seen before are served from a bounded LRU keyed by a hash of the text; all
+    the others are encoded together in a single batched forward pass. The model
+    is obtained from ``load_model`` on the first miss, so it stays lazily
+    loaded.
+    """
+
+    def __init__(
+        self, load_model, max_entries=4096, max_bytes=32 * 1024 * 1024, batch_size=64
+    ):
+        self._load_model = load_model
+        self.batch_size = batch_size
+        self.cache = LRUCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            sizeof=lambda vector: vector.nbytes,
+        )
+        self.batches = 0
+        self._lock = threading.Lock()
+
+    def encode(self, texts):
+        texts = list(texts)
+        keys = [make_cache_key(text) for text in texts]
+        vectors = [self.cache.get(key) for key in keys]
+
+        # Each distinct uncached text is encoded once, in one batch
+        missing = {}
+        for key, text, vector in zip(keys, texts, vectors):
+            if vector is None:
+                missing.setdefault(key, text)
+        if missing:
+            fresh = dict(zip(missing, self._encode_batch(list(missing.values()))))
+            for key, vector in fresh.items():
+                self.cache.set(key, vector)
+            vectors = [
+                fresh[key] if vector is None else vector
+                for key, vector in zip(keys, vectors)
+            ]
+
+        if not vectors:
+            return np.empty((0, 0), dtype="float32")
+        return np.vstack(vectors)
+
+    def prefetch(self, texts):
+        """Warm the cache for texts that are about to be searched or compared"""
+        self.encode(texts)
+
+    def _encode_batch(self, texts):
+        with self._lock:
+            embeddings = self._load_model().encode(
+                texts, batch_size=self.batch_size, show_progress_bar=False
+            )
+            self.batches += 1
+        embeddings = np.asarray(embeddings, dtype="float32").reshape(len(texts), -1)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, 1e-12)
+
+    def stats(self):
+        return {**self.cache.stats(), "batches": self.batches}
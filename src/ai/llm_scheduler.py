@@ -0,0 +1,224 @@
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from src.ai.concurrency import DEFAULT_PROVIDER_RATE_LIMITS, provider_of
+
+# Exceptions worth retrying besides rate limits, by LiteLLM/OpenAI class name
+TRANSIENT_ERRORS = {
+    "APIConnectionError",
+    "APITimeoutError",
+    "InternalServerError",
+    "ServiceUnavailableError",
+    "Timeout",
+}
+TRANSIENT_STATUS_CODES = {408, 500, 502, 503, 504}
+# Groq and OpenAI put the wait in the message, e.g. "Please try again in 1m2.5s"
+RETRY_IN_MESSAGE = re.compile(
+    r"try again in (?:(\d+)m)?(\d+(?:\.\d+)?)(ms|s)\b", re.IGNORECASE
+)
+
+
+class TokenBucket:
+    """
+    Budget of ``per_minute`` units refilled continuously.
+
+    Reservations are always granted and may take the level below zero; the
+    returned wait is how long the caller has to sleep before its reservation
+    is covered, so concurrent callers queue up in reservation order.
+    """
+
+    def __init__(self, per_minute, now):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = now
+
+    def _refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount, now):
+        self._refill(now)
+        # A request larger than the whole bucket would never fit
+        self.level -= min(amount, self.capacity)
+        return max(0.0, -self.level / self.rate)
+
+    def refund(self, amount, now):
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+
+class LLMScheduler:
+    """
+    Gate for every LLM request: per-provider request and token budgets, plus
+    retries of rate-limited and transient failures.
+
+    Limits are keyed by provider (``groq``) or by full model name, which takes
+    precedence. A request only sleeps when its budget is exhausted or the
+    provider asked to back off; after a 429 the ``Retry-After`` delay is
+    honoured for all callers of that model, otherwise retries back off
+    exponentially with jitter.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute=None,
+        tokens_per_minute=None,
+        max_retries=4,
+        base_delay=1.0,
+        max_delay=60.0,
+    ):
+        self.requests_per_minute = dict(
+            DEFAULT_PROVIDER_RATE_LIMITS
+            if requests_per_minute is None
+            else requests_per_minute
+        )
+        self.tokens_per_minute = dict(tokens_per_minute or {})
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._buckets = {}
+        self._blocked_until = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "waits": 0,
+            "waited_seconds": 0.0,
+            "retries": 0,
+            "rate_limited": 0,
+        }
+
+    @staticmethod
+    def _limit_key(limits, model):
+        if model in limits:
+            return model
+        provider = provider_of(model)
+        return provider if provider in limits else None
+
+    def _bucket(self, kind, limits, model, now):
+        key = self._limit_key(limits, model)
+        if key is None or not limits[key]:
+            return None
+        bucket = self._buckets.get((kind, key))
+        if bucket is None:
+            bucket = self._buckets[(kind, key)] = TokenBucket(limits[key], now)
+        return bucket
+
+    def acquire(self, model, tokens=0):
+        """Reserve one request and ``tokens`` for ``model``, sleeping only if over budget"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until.get(model, now) - now)
+            requests = self._bucket("requests", self.requests_per_minute, model, now)
+            if requests is not None:
+                wait = max(wait, requests.reserve(1, now))
+            token_bucket = self._bucket("tokens", self.tokens_per_minute, model, now)
+            if token_bucket is not None and tokens:
+                wait = max(wait, token_bucket.reserve(tokens, now))
+            self._stats["requests"] += 1
+            if wait > 0:
+                self._stats["waits"] += 1
+                self._stats["waited_seconds"] += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def settle(self, model, reserved, used):
+        """Correct the token budget once the real usage of a request is known"""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket("tokens", self.tokens_per_minute, model, now)
+            if bucket is None:
+                return
+            if used > reserved:
+                bucket.reserve(used - reserved, now)
+            else:
+                bucket.refund(reserved - used, now)
+
+    def call(self, model, func, estimated_tokens=0):
+        """
+        Run ``func()`` (one request to ``model``) within the budgets, retrying
+        rate limits and transient errors. The token reservation is settled with
+        ``usage.total_tokens`` of the result when it reports one.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.acquire(model, estimated_tokens)
+            try:
+                result = func()
+            except Exception as e:
+                self.settle(model, estimated_tokens, 0)
+                delay = self._retry_delay(e, attempt)
+                if delay is None or attempt == self.max_retries:
+                    raise
+                with self._lock:
+                    self._stats["retries"] += 1
+                    until = time.monotonic() + delay
+                    self._blocked_until[model] = max(
+                        self._blocked_until.get(model, 0.0), until
+                    )
+                print(
+                    f"{type(e).__name__} from {model}, retrying in {delay:.1f}s "
+                    f"({attempt + 1}/{self.max_retries})"
+                )
+                continue
+
+            usage = getattr(result, "usage", None)
+            used = getattr(usage, "total_tokens", None)
+            if isinstance(used, int):
+                self.settle(model, estimated_tokens, used)
+            return result
+
+    def _retry_delay(self, error, attempt):
+        """Seconds to wait before retrying ``error``, or None if it isn't retryable"""
+        status = getattr(error, "status_code", None)
+        name = type(error).__name__
+        if status == 429 or "RateLimit" in name:
+            with self._lock:
+                self._stats["rate_limited"] += 1
+            retry_after = self.retry_after(error)
+            if retry_after is not None:
+                return min(retry_after, self.max_delay)
+        elif status not in TRANSIENT_STATUS_CODES and name not in TRANSIENT_ERRORS:
+            return None
+        backoff = min(self.max_delay, self.base_delay * 2**attempt)
+        return backoff * random.uniform(0.5, 1.0)
+
+    @staticmethod
+    def retry_after(error):
+        """Delay requested by the provider, from the response headers or the message"""
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or getattr(error, "headers", None)
+        if headers:
+            value = headers.get("retry-after-ms")
+            if value is not None:
+                try:
+                    return float(value) / 1000
+                except ValueError:
+                    pass
+            value = headers.get("retry-after")
+            if value is not None:
+                try:
+                    return max(0.0, float(value))
+                except ValueError:
+                    try:
+                        retry_at = parsedate_to_datetime(value)
+                        return max(0.0, retry_at.timestamp() - time.time())
+                    except (TypeError, ValueError):
+                        pass
+
+        match = RETRY_IN_MESSAGE.search(str(error))
+        if match:
+            minutes, amount, unit = match.groups()
+            seconds = float(amount) / 1000 if unit.lower() == "ms" else float(amount)
+            return seconds + 60 * int(minutes or 0)
+        return None
+
+    def stats(self):
+        with self._lock:
+            return {
+                **self._stats,
+                "waited_seconds": round(self._stats["waited_seconds"], 3),
+            }
@@ -0,0 +1,108 @@
+import threading
+
+# Models per tier, smallest first; escalation moves to the next tier in this order
+DEFAULT_MODEL_TIERS = {
+    "small": "groq/llama-3.1-8b-instant",
+    "medium": "groq/qwen/qwen3-32b",
+    "large": "groq/openai/gpt-oss-120b",
+}
+
+# Tier for each task type. "default" is the model configured as ``modelName``.
+DEFAULT_TASK_TIERS = {
+    "numeric": "small",
+    "choice": "small",
+    "text": "large",
+    "summary": "default",
+    "fit_decision": "medium",
+    "skill_extraction": "default",
+}
+
+
+class ModelRouter:
+    """
+    Picks the model for each kind of LLM task and keeps per-tier call stats.
+
+    Tasks are mapped to tiers by ``task_tiers`` and tiers to models by
+    ``model_tiers``. ``route(task)`` returns the task's tier followed by the
+    larger tiers it may escalate to when an answer fails validation; the
+    caller makes the requests and reports each one through ``record``.
+    """
+
+    def __init__(
+        self, default_model=None, model_tiers=None, task_tiers=None, escalate=True
+    ):
+        self.model_tiers = dict(model_tiers or DEFAULT_MODEL_TIERS)
+        if default_model:
+            self.model_tiers.setdefault("default", default_model)
+        self.task_tiers = {**DEFAULT_TASK_TIERS, **(task_tiers or {})}
+        self.escalate = escalate
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def tier_for(self, task):
+        tier = self.task_tiers.get(task, "large")
+        if tier not in self.model_tiers:
+            # Unknown tiers (or "default" without a modelName) use the largest model
+            tier = self._escalation_tiers()[-1]
+        return tier
+
+    def _escalation_tiers(self):
+        return [tier for tier in self.model_tiers if tier != "default"]
+
+    def model_for(self, task):
+        return self.model_tiers[self.tier_for(task)]
+
+    def route(self, task):
+        """``[(tier, model), ...]`` to try for ``task``, in escalation order"""
+        tier = self.tier_for(task)
+        route = [(tier, self.model_tiers[tier])]
+        if not self.escalate:
+            return route
+        tiers = self._escalation_tiers()
+        if tier in tiers:
+            for larger in tiers[tiers.index(tier) + 1 :]:
+                if self.model_tiers[larger] != route[-1][1]:
+                    route.append((larger, self.model_tiers[larger]))
+        return route
+
+    def record(
+        self,
+        tier,
+        model,
+        latency,
+        prompt_tokens=0,
+        completion_tokens=0,
+        escalated=False,
+    ):
+        """Add one request to the stats of ``tier``; ``escalated`` marks a retry"""
+        with self._lock:
+            stats = self._stats.setdefault(
+                tier,
+                {
+                    "model": model,
+                    "calls": 0,
+                    "escalations": 0,
+                    "latency_seconds": 0.0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                },
+            )
+            stats["calls"] += 1
+            stats["escalations"] += int(escalated)
+            stats["latency_seconds"] += latency
+            stats["prompt_tokens"] += prompt_tokens
+            stats["completion_tokens"] += completion_tokens
+
+    def stats(self):
+        """Per-tier calls, escalations into the tier, latency and token usage"""
+        with self._lock:
+            return {
+                tier: {
+                    **stats,
+                    "latency_seconds": round(stats["latency_seconds"], 3),
+                    "avg_latency_seconds": round(
+                        stats["latency_seconds"] / stats["calls"], 3
+                    ),
+                }
+                for tier, stats in self._stats.items()
+            }
@@ -0,0 +1,113 @@
+import platform
+
+import numpy as np
+
+from src.utils.lazy_import import lazy_import
+
+ort = lazy_import("onnxruntime")
+
+# int8 exports published alongside the PyTorch weights on the Hugging Face Hub
+QUANTIZED_ONNX_FILES = {
+    "arm64": "onnx/model_qint8_arm64.onnx",
+    "x86_64": "onnx/model_quint8_avx2.onnx",
+}
+FULL_PRECISION_ONNX_FILE = "onnx/model.onnx"
+
+
+def default_onnx_file(quantized=True):
+    """ONNX export to use on this CPU: an int8 one by default"""
+    if not quantized:
+        return FULL_PRECISION_ONNX_FILE
+    machine = platform.machine().lower()
+    if machine in ("arm64", "aarch64"):
+        return QUANTIZED_ONNX_FILES["arm64"]
+    return QUANTIZED_ONNX_FILES["x86_64"]
+
+
+class OnnxSentenceEncoder:
+    """
+    Sentence-transformers compatible ``encode`` on ONNX Runtime.
+
+    Runs the transformer with ONNX Runtime and applies the model's mean pooling
+    and L2 normalization in numpy, so neither PyTorch nor sentence-transformers
+    is imported. Vectors match the PyTorch model up to quantization error.
+    """
+
+    def __init__(self, session, tokenizer, max_length=256):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+        self._input_names = {node.name for node in session.get_inputs()}
+
+    @classmethod
+    def from_pretrained(
+        cls,
+        model_name,
+        quantized=True,
+        onnx_file=None,
+        threads=None,
+        local_files_only=False,
+    ):
+        """
+        Load ``sentence-transformers/<model_name>`` from the Hugging Face Hub
+        cache, downloading the ONNX export and tokenizer on first use.
+        """
+        from huggingface_hub import hf_hub_download
+        from tokenizers import Tokenizer
+
+        repo_id = (
+            model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        )
+        model_path = hf_hub_download(
+            repo_id,
+            onnx_file or default_onnx_file(quantized),
+            local_files_only=local_files_only,
+        )
+        tokenizer = Tokenizer.from_file(
+            hf_hub_download(
+                repo_id, "tokenizer.json", local_files_only=local_files_only
+            )
+        )
+
+        options = ort.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        session = ort.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        return cls(session, tokenizer)
+
+    def encode(self, sentences, batch_size=32, show_progress_bar=False, **kwargs):
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        batches = [
+            self._encode_batch(sentences[start : start + batch_size])
+            for start in range(0, len(sentences), batch_size)
+        ]
+        embeddings = (
+            np.vstack(batches) if batches else np.empty((0, 0), dtype="float32")
+        )
+        return embeddings[0] if single else embeddings
+
+    def _encode_batch(self, sentences):
+        encodings = self.tokenizer.encode_batch(list(sentences))
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype="int64")
+        inputs = {
+            "input_ids": np.array([e.ids for e in encodings], dtype="int64"),
+            "attention_mask": attention_mask,
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype="int64"),
+        }
+        inputs = {
+            name: value for name, value in inputs.items() if name in self._input_names
+        }
+        token_embeddings = self.session.run(None, inputs)[0]
+
+        # Mean pooling over real tokens, then L2 normalization, as in the
+        # sentence-transformers pipeline of MiniLM
+        mask = attention_mask[:, :, None].astype("float32")
+        summed = (token_embeddings * mask).sum(axis=1)
+        pooled = summed / np.maximum(mask.sum(axis=1), 1e-9)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.maximum(norms, 1e-12)).astype("float32")
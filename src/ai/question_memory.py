@@ -0,0 +1,154 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from src.ai.cache import make_cache_key, normalize_text
+from src.utils.lazy_import import lazy_import
+
+faiss = lazy_import("faiss")
+
+# Words that may differ between two phrasings of the same question. Any other
+# word present in only one of the questions (e.g. "java" vs "python") blocks
+# reuse, however close the embeddings are.
+FILLER_WORDS = set("""
+    a about an and any are as at be been by can could describe did do does
+    for have has how i if in is it many much of on or please professional
+    provide the this to total what which with work would you your
+    """.split())
+
+
+def content_words(text):
+    return set(normalize_text(text).split()) - FILLER_WORDS
+
+
+class QuestionMemory:
+    """
+    Embedding-backed memory of answered screening questions.
+
+    Each answered question is stored with its response type, option list and
+    normalized embedding; answers of ``job_specific_types`` (free text written
+    for a posting) also with a job-description key. ``lookup`` reuses a stored
+    answer when a new question is a near duplicate: cosine similarity at or
+    above ``threshold``, same response type, same options, and no differing
+    content words. New answers are appended to the index and written to
+    ``directory`` by ``save``, once per form step; the memory is discarded
+    when the ``scope`` (profile fingerprint) changes.
+    """
+
+    def __init__(
+        self,
+        directory,
+        encode,
+        threshold=0.92,
+        max_entries=5000,
+        scope="",
+        job_specific_types=("text",),
+    ):
+        self.directory = Path(directory)
+        self.encode = encode
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.scope = scope
+        self.job_specific_types = frozenset(job_specific_types or ())
+        self.hits = 0
+        self.misses = 0
+        self.entries = []
+        self._vectors = None  # Vectors as of the last save or load
+        self._unsaved = []  # Vectors added since then
+        self._index = None
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.directory / "entries.json", "r", encoding="utf-8") as f:
+                data = json.load(f)
+            vectors = np.load(self.directory / "vectors.npy")
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Could not load question memory, starting empty: {str(e)}")
+            return
+
+        if data.get("scope") != self.scope or len(data["entries"]) != len(vectors):
+            return
+        self.entries = data["entries"]
+        self._set_vectors(vectors.astype("float32"))
+
+    def save(self):
+        """Write the entries added since the last save, trimmed to ``max_entries``"""
+        if not self._unsaved:
+            return
+        vectors = np.vstack(
+            ([] if self._vectors is None else [self._vectors]) + self._unsaved
+        )
+        self._unsaved = []
+        if self.max_entries and len(self.entries) > self.max_entries:
+            self.entries = self.entries[-self.max_entries :]
+            self._set_vectors(np.ascontiguousarray(vectors[-self.max_entries :]))
+        else:
+            self._vectors = vectors
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_entries = self.directory / f"entries.json.tmp-{os.getpid()}"
+        tmp_vectors = self.directory / f"vectors.tmp-{os.getpid()}.npy"
+        with open(tmp_entries, "w", encoding="utf-8") as f:
+            json.dump({"scope": self.scope, "entries": self.entries}, f)
+        np.save(tmp_vectors, self._vectors)
+        os.replace(tmp_vectors, self.directory / "vectors.npy")
+        os.replace(tmp_entries, self.directory / "entries.json")
+
+    def _set_vectors(self, vectors):
+        self._vectors = vectors
+        self._index = faiss.IndexFlatIP(vectors.shape[1])
+        self._index.add(vectors)
+
+    def _compatibility_key(self, response_type, options, jd):
+        option_texts = [normalize_text(text) for _, text in (options or [])]
+        if response_type not in self.job_specific_types:
+            jd = ""
+        return make_cache_key(response_type, option_texts, normalize_text(jd))
+
+    def lookup(self, question_text, response_type, options=None, jd="", top_k=5):
+        """Return ``(answer, score, matched_question)`` for a near duplicate, else None"""
+        if not self.entries:
+            self.misses += 1
+            return None
+
+        query = np.asarray(self.encode([question_text]), dtype="float32")
+        scores, indices = self._index.search(query, min(top_k, len(self.entries)))
+
+        compatibility = self._compatibility_key(response_type, options, jd)
+        words = content_words(question_text)
+        for score, idx in zip(scores[0], indices[0]):
+            if idx < 0 or score < self.threshold:
+                break
+            entry = self.entries[idx]
+            if entry["compatibility"] != compatibility:
+                continue
+            if content_words(entry["question"]) != words:
+                continue
+            self.hits += 1
+            return entry["answer"], float(score), entry["question"]
+
+        self.misses += 1
+        return None
+
+    def add(self, question_text, response_type, answer, options=None, jd=""):
+        vector = np.asarray(self.encode([question_text]), dtype="float32")
+        entry = {
+            "question": question_text,
+            "response_type": response_type,
+            "compatibility": self._compatibility_key(response_type, options, jd),
+            "answer": answer,
+        }
+
+        if self._index is None:
+            self._index = faiss.IndexFlatIP(vector.shape[1])
+        self._index.add(vector)
+        self.entries.append(entry)
+        self._unsaved.append(vector)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries)}
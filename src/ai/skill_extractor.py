@@ -0,0 +1,226 @@
+from collections import deque
+
+# Skill name -> lowercase spellings matched in job descriptions. Ambiguous
+# spellings ("go", "r", "rest", "node", "excel") are left out on purpose;
+# add them through ``skillLexicon`` if they matter for your searches.
+DEFAULT_SKILL_LEXICON = {
+    # Languages
+    "Python": ["python"],
+    "Java": ["java"],
+    "JavaScript": ["javascript", "js", "ecmascript"],
+    "TypeScript": ["typescript"],
+    "C++": ["c++", "cpp"],
+    "C#": ["c#", "csharp"],
+    "Go": ["golang"],
+    "Rust": ["rust"],
+    "Kotlin": ["kotlin"],
+    "Swift": ["swift"],
+    "Scala": ["scala"],
+    "Ruby": ["ruby"],
+    "PHP": ["php"],
+    "MATLAB": ["matlab"],
+    "Bash": ["bash", "shell scripting"],
+    "SQL": ["sql"],
+    "NoSQL": ["nosql"],
+    "HTML": ["html", "html5"],
+    "CSS": ["css", "css3"],
+    # Frameworks and libraries
+    "React": ["react", "react.js", "reactjs"],
+    "Angular": ["angular", "angularjs"],
+    "Vue.js": ["vue", "vue.js", "vuejs"],
+    "Next.js": ["next.js", "nextjs"],
+    "Node.js": ["node.js", "nodejs"],
+    "Express": ["express.js", "expressjs"],
+    "Django": ["django"],
+    "Flask": ["flask"],
+    "FastAPI": ["fastapi"],
+    "Spring Boot": ["spring boot", "springboot"],
+    "Ruby on Rails": ["ruby on rails", "rails"],
+    ".NET": [".net", "dotnet", "asp.net"],
+    "GraphQL": ["graphql"],
+    "REST APIs": ["rest api", "rest apis", "restful", "restful apis"],
+    "gRPC": ["grpc"],
+    "Pandas": ["pandas"],
+    "NumPy": ["numpy"],
+    "scikit-learn": ["scikit-learn", "sklearn"],
+    "TensorFlow": ["tensorflow"],
+    "PyTorch": ["pytorch"],
+    "Keras": ["keras"],
+    "Hugging Face": ["hugging face", "huggingface", "transformers"],
+    "LangChain": ["langchain"],
+    "Spark": ["spark", "pyspark", "apache spark"],
+    "Hadoop": ["hadoop"],
+    "Airflow": ["airflow", "apache airflow"],
+    "Kafka": ["kafka", "apache kafka"],
+    "dbt": ["dbt"],
+    # Data stores
+    "PostgreSQL": ["postgresql", "postgres"],
+    "MySQL": ["mysql"],
+    "MongoDB": ["mongodb", "mongo"],
+    "Redis": ["redis"],
+    "Elasticsearch": ["elasticsearch", "elastic search"],
+    "Cassandra": ["cassandra"],
+    "DynamoDB": ["dynamodb"],
+    "Snowflake": ["snowflake"],
+    "BigQuery": ["bigquery"],
+    "Oracle": ["oracle"],
+    # Cloud and infrastructure
+    "AWS": ["aws", "amazon web services"],
+    "Azure": ["azure", "microsoft azure"],
+    "GCP": ["gcp", "google cloud", "google cloud platform"],
+    "Docker": ["docker"],
+    "Kubernetes": ["kubernetes", "k8s"],
+    "Terraform": ["terraform"],
+    "Ansible": ["ansible"],
+    "Jenkins": ["jenkins"],
+    "GitHub Actions": ["github actions"],
+    "CI/CD": ["ci/cd", "continuous integration", "continuous delivery"],
+    "Git": ["git"],
+    "Linux": ["linux", "unix"],
+    "Microservices": ["microservices", "microservice"],
+    "Serverless": ["serverless", "aws lambda"],
+    # Machine learning and data
+    "Machine Learning": ["machine learning", "ml"],
+    "Deep Learning": ["deep learning"],
+    "NLP": ["nlp", "natural language processing"],
+    "Computer Vision": ["computer vision"],
+    "LLMs": ["llm", "llms", "large language models", "large language model"],
+    "Generative AI": ["generative ai", "genai"],
+    "RAG": ["rag", "retrieval augmented generation", "retrieval-augmented generation"],
+    "MLOps": ["mlops"],
+    "Data Analysis": ["data analysis", "data analytics"],
+    "ETL": ["etl", "elt"],
+    "Tableau": ["tableau"],
+    "Power BI": ["power bi", "powerbi"],
+    "Excel": ["microsoft excel", "ms excel"],
+    # Practices and tools
+    "Agile": ["agile", "scrum"],
+    "Jira": ["jira"],
+    "Unit Testing": ["unit testing", "unit tests"],
+    "Selenium": ["selenium"],
+    "Figma": ["figma"],
+}
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == "_"
+
+
+class SkillExtractor:
+    """
+    Local skill extraction with an Aho-Corasick automaton over a lexicon.
+
+    ``lexicon`` maps each skill to the spellings that mention it; spellings
+    are matched case-insensitively, on word boundaries, in one pass over the
+    text. Overlapping mentions resolve to the leftmost, longest spelling, so
+    "Ruby on Rails" wins over the "Ruby" inside it. ``extract`` ranks the
+    skills of a job description by how often and how early they are
+    mentioned, and returns each one as first written in the text.
+    """
+
+    def __init__(self, lexicon=None, include_defaults=True):
+        self.lexicon = dict(DEFAULT_SKILL_LEXICON) if include_defaults else {}
+        for skill, spellings in (lexicon or {}).items():
+            if isinstance(spellings, str):
+                spellings = [spellings]
+            self.lexicon[skill] = list(self.lexicon.get(skill, [])) + list(
+                spellings or []
+            )
+        self._build()
+
+    @classmethod
+    def from_terms(cls, terms):
+        """Matcher for the literal ``terms``, e.g. the keys of ``experience``"""
+        return cls({str(term): [str(term)] for term in terms}, include_defaults=False)
+
+    def _build(self):
+        # goto[state] maps a character to the next state; out[state] lists the
+        # (length, skill) of every spelling ending in that state
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for skill, spellings in self.lexicon.items():
+            for spelling in {skill.lower(), *(s.lower() for s in spellings)}:
+                spelling = spelling.strip()
+                if not spelling:
+                    continue
+                state = 0
+                for char in spelling:
+                    next_state = self._goto[state].get(char)
+                    if next_state is None:
+                        next_state = len(self._goto)
+                        self._goto[state][char] = next_state
+                        self._goto.append({})
+                        self._fail.append(0)
+                        self._out.append([])
+                    state = next_state
+                self._out[state].append((len(spelling), skill))
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._out[next_state] = (
+                    self._out[next_state] + self._out[self._fail[next_state]]
+                )
+
+    @staticmethod
+    def _lower(text):
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        # A few characters lower to several (e.g. "İ"); keep offsets aligned
+        return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+    def mentions(self, text):
+        """``(start, end, skill)`` of every skill mention in ``text``, in order"""
+        if not text:
+            return []
+        lowered = self._lower(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        candidates = []
+        state = 0
+        for end, char in enumerate(lowered, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, skill in out[state]:
+                start = end - length
+                if (start == 0 or not _is_word_char(lowered[start - 1])) and (
+                    end == len(lowered) or not _is_word_char(lowered[end])
+                ):
+                    candidates.append((start, end, skill))
+
+        mentions = []
+        last_end = 0
+        for start, end, skill in sorted(candidates, key=lambda m: (m[0], -m[1])):
+            if start >= last_end:
+                mentions.append((start, end, skill))
+                last_end = end
+        return mentions
+
+    def find(self, text):
+        """Skills mentioned in ``text``, in order of first mention"""
+        return list(dict.fromkeys(skill for _, _, skill in self.mentions(text)))
+
+    def extract(self, text, top_k=10):
+        """
+        The ``top_k`` skills of ``text``, most relevant first, as written in
+        the text. Each mention counts one point, plus up to one point for how
+        close the first mention is to the start, where job descriptions put
+        their core requirements.
+        """
+        ranked = {}
+        for start, end, skill in self.mentions(text):
+            entry = ranked.get(skill)
+            if entry is None:
+                position_bonus = 1.0 - start / len(text)
+                ranked[skill] = [position_bonus, start, text[start:end]]
+            ranked[skill][0] += 1
+        order = sorted(ranked.values(), key=lambda entry: (-entry[0], entry[1]))
+        return [written for _, _, written in order[:top_k]]
@@ -0,0 +1,86 @@
+import importlib.util
+import math
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+
+# Models whose tokenizer is o200k_base; everything else is counted with
+# cl100k_base, which is within a few percent for Llama, Qwen and Mixtral models.
+O200K_MODEL_MARKERS = ("gpt-4o", "gpt-4.1", "gpt-5", "gpt-oss", "o1", "o3", "o4")
+# Encodings LiteLLM ships with its package
+BUNDLED_ENCODINGS = ("cl100k_base",)
+
+
+def _bundled_tiktoken_dir():
+    """Directory of the tiktoken files shipped with LiteLLM, or None"""
+    spec = importlib.util.find_spec("litellm")
+    if spec is None or not spec.origin:
+        return None
+    bundled = os.path.join(
+        os.path.dirname(spec.origin), "litellm_core_utils", "tokenizers"
+    )
+    return bundled if os.path.isdir(bundled) else None
+
+
+@contextmanager
+def _bundled_tiktoken_files(name):
+    # tiktoken downloads its encodings on first use. LiteLLM ships cl100k_base,
+    # so point tiktoken at that copy while it loads, to keep token counting
+    # offline without importing LiteLLM here. A TIKTOKEN_CACHE_DIR of the user
+    # ("" disables tiktoken's cache) is left alone, and so is the environment
+    # once the encoding is loaded.
+    bundled = None
+    if name in BUNDLED_ENCODINGS and "TIKTOKEN_CACHE_DIR" not in os.environ:
+        bundled = _bundled_tiktoken_dir()
+    if bundled is None:
+        yield
+        return
+    os.environ["TIKTOKEN_CACHE_DIR"] = bundled
+    try:
+        yield
+    finally:
+        os.environ.pop("TIKTOKEN_CACHE_DIR", None)
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(name):
+    """tiktoken encoding by name, or None when it can't be loaded offline"""
+    try:
+        import tiktoken
+
+        with _bundled_tiktoken_files(name):
+            return tiktoken.get_encoding(name)
+    except Exception:
+        return None
+
+
+def encoding_for(model=None):
+    model = (model or "").lower()
+    if any(marker in model for marker in O200K_MODEL_MARKERS):
+        encoding = _get_encoding("o200k_base")
+        if encoding is not None:
+            return encoding
+    return _get_encoding("cl100k_base")
+
+
+def count_tokens(text, model=None):
+    """
+    Number of tokens in ``text`` for ``model``.
+    Falls back to roughly four characters per token without tiktoken.
+    """
+    if not text:
+        return 0
+    encoding = encoding_for(model)
+    if encoding is None:
+        return math.ceil(len(text) / 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text, max_tokens, model=None):
+    """Cut ``text`` down to at most ``max_tokens`` tokens"""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    encoding = encoding_for(model)
+    if encoding is None:
+        return text[: max_tokens * 4]
+    return encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens])
@@ -1,4 +1,3 @@
-import csv
 import os
 import random
 import re
@@ -7,7 +6,6 @@ import traceback
 from datetime import date, datetime
 from itertools import product
 
-import pyautogui
 from selenium.common.exceptions import (
     NoSuchElementException,
     StaleElementReferenceException,
@@ -19,8 +17,13 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
 
 from src.ai.ai_response_generator import AIResponseGenerator
+from src.ai.skill_extractor import SkillExtractor
 from src.external.external_applications import apply_to_ashby, apply_to_greenhouse
+from src.utils.application_ledger import ApplicationLedger
 from src.utils.file_utils import record_unprepared_question, write_to_file
+from src.utils.form_schema import read_form_schema
+from src.utils.job_cards import extract_job_cards
+from src.utils.job_filter import JobFilter
 from src.utils.utils import (
     enter_text,
     get_base_search_url,
@@ -28,6 +31,17 @@ from src.utils.utils import (
     scroll_slow,
     select_dropdown,
 )
+from src.utils.waits import (
+    PageWaits,
+    any_present,
+    modal_changed,
+    modal_state,
+    new_window_or,
+    none_present,
+    replaced_by,
+    text_changed,
+    text_of,
+)
 
 
 class LinkedinEasyApply:
@@ -43,15 +57,33 @@ class LinkedinEasyApply:
         self.company_blacklist = parameters.get("companyBlacklist", []) or []
         self.title_blacklist = parameters.get("titleBlacklist", []) or []
         self.poster_blacklist = parameters.get("posterBlacklist", []) or []
+        self.job_filter = JobFilter(
+            self.title_blacklist, self.company_blacklist, self.poster_blacklist
+        )
         self.positions = parameters.get("positions", [])
         self.locations = parameters.get("locations", [])
         self.residency = parameters.get("residentStatus", [])
         self.base_search_url = get_base_search_url(parameters)
-        self.seen_jobs = []
+        # Waits end when the page is ready; the pause between actions is
+        # configured separately
+        self.waits = PageWaits(
+            driver,
+            timeout=parameters.get("waitTimeout", 10),
+            min_delay=parameters.get("minActionDelay", 1.0),
+            max_delay=parameters.get("maxActionDelay", 2.0),
+        )
         self.file_name = "output"
         self.unprepared_questions_file_name = "unprepared_questions"
         self.output_file_directory = parameters["outputFileDirectory"]
+        # Jobs applied to, by LinkedIn job ID; loaded once instead of
+        # re-reading output.csv for every results page
+        self.seen_jobs = ApplicationLedger(
+            os.path.join(self.output_file_directory, "applications.db"),
+            csv_path=self.file_name + ".csv",
+        )
         self.resume_dir = parameters["uploads"]["resume"]
+        # Resume uploaded for the current job: the tailored copy, if any
+        self.job_resume_dir = self.resume_dir
         self.text_resume = parameters.get("textResume", "")
         self.docx_resume = parameters.get("docxResume", "")
         if "coverLetter" in parameters["uploads"]:
@@ -67,9 +99,14 @@ class LinkedinEasyApply:
         self.personal_info = parameters.get("personalInfo", [])
         self.eeo = parameters.get("eeo", [])
         self.experience_default = int(self.experience["default"])
+        # One-pass, word-boundary lookup of the experience keys in questions
+        self.experience_matcher = SkillExtractor.from_terms(
+            term for term in self.experience if term != "default"
+        )
         self.debug = parameters.get("debug", False)
         self.evaluate_job_fit = parameters.get("evaluateJobFit", True)
         self.tailor_resume = parameters.get("tailorResume", True)
+        self.batch_questions = parameters.get("batchQuestions", True)
         self.ai_response_generator = AIResponseGenerator(
             api_key=self.openai_api_key,
             personal_info=self.personal_info,
@@ -78,8 +115,44 @@ class LinkedinEasyApply:
             resume_path=self.resume_dir,
             checkboxes=self.checkboxes,
             text_resume_path=self.text_resume,
+            docx_resume_path=self.docx_resume,
             debug=self.debug,
             model_name=self.model_name,
+            answer_cache=parameters.get("answerCache", True),
+            answer_cache_ttl_days=parameters.get("answerCacheTtlDays", 30),
+            answer_cache_max_entries=parameters.get("answerCacheMaxEntries", 5000),
+            job_specific_answer_types=parameters.get(
+                "jobSpecificAnswerTypes", ["text"]
+            ),
+            question_memory=parameters.get("questionMemory", True),
+            question_similarity_threshold=parameters.get(
+                "questionSimilarityThreshold", 0.92
+            ),
+            max_concurrent_requests=parameters.get("maxConcurrentRequests", 4),
+            provider_rate_limits=parameters.get("providerRateLimits"),
+            context_cache_max_entries=parameters.get("contextCacheMaxEntries", 256),
+            context_cache_max_mb=parameters.get("contextCacheMaxMb", 16),
+            context_cache_persist=parameters.get("contextCachePersist", False),
+            embedding_cache_max_entries=parameters.get(
+                "embeddingCacheMaxEntries", 4096
+            ),
+            job_fit_cache=parameters.get("jobFitCache", True),
+            job_fit_cache_ttl_days=parameters.get("jobFitCacheTtlDays", 30),
+            prefix_cached_prompts=parameters.get("prefixCachedPrompts", True),
+            job_fit_mode=parameters.get("jobFitMode", "stream"),
+            job_fit_prefilter=parameters.get("jobFitPrefilter", True),
+            job_fit_skip_below=parameters.get("jobFitSkipBelow", 0.30),
+            job_fit_apply_above=parameters.get("jobFitApplyAbove", 0.65),
+            model_tiers=parameters.get("modelTiers"),
+            task_model_tiers=parameters.get("taskModelTiers"),
+            model_escalation=parameters.get("modelEscalation", True),
+            provider_token_limits=parameters.get("providerTokenLimits"),
+            llm_max_retries=parameters.get("llmMaxRetries", 4),
+            embedding_backend=parameters.get("embeddingBackend", "torch"),
+            embedding_quantized=parameters.get("embeddingQuantized", True),
+            tailored_resume_cache_mb=parameters.get("tailoredResumeCacheMb", 50),
+            local_skill_extraction=parameters.get("localSkillExtraction", True),
+            skill_lexicon=parameters.get("skillLexicon"),
         )
 
     def login(self):
@@ -88,7 +161,12 @@ class LinkedinEasyApply:
             print("Attempting to restore previous session...")
             if os.path.exists("chrome_bot"):
                 self.browser.get("https://www.linkedin.com/feed/")
-                time.sleep(random.uniform(5, 10))
+                self.waits.until(
+                    EC.url_contains("https://www.linkedin.com/feed/"),
+                    timeout=5,
+                    description="the feed page",
+                )
+                self.waits.pause()
 
                 # Check if the current URL is the feed page
                 if self.browser.current_url != "https://www.linkedin.com/feed/":
@@ -134,7 +212,7 @@ class LinkedinEasyApply:
             EC.url_contains("https://www.linkedin.com/feed/")
         )
 
-        time.sleep(random.uniform(5, 10))
+        self.waits.pause()
 
     def start_applying(self):
         searches = list(product(self.positions, self.locations))
@@ -156,7 +234,14 @@ class LinkedinEasyApply:
                     job_page_number += 1
                     print("Going to job page " + str(job_page_number))
                     self.next_job_page(position, location_url, job_page_number)
-                    time.sleep(random.uniform(1.5, 3.5))
+                    self.waits.until(
+                        any_present(
+                            ".scaffold-layout__list-item",
+                            ".jobs-search-two-pane__no-results-banner--expand",
+                        ),
+                        description="the job results",
+                    )
+                    self.waits.pause()
                     print("Starting the application process for this page...")
                     self.apply_jobs(location)
                     print(
@@ -204,16 +289,6 @@ class LinkedinEasyApply:
 
         if "unfortunately, things are" in self.browser.page_source.lower():
             raise Exception("No more jobs on this page.")
-        try:
-            with open("output.csv", "r", encoding="utf-8") as f:
-                reader = csv.reader(f)
-                self.seen_jobs = [
-                    row[2] for row in reader if len(row) > 2
-                ]  # Assuming the link is in the 3rd column
-        except FileNotFoundError:
-            print("output.csv not found. Starting with an empty seen_jobs list.")
-        except Exception as e:
-            print(f"Error reading output.csv: {e}")
         job_results_header = ""
         maybe_jobs_crap = ""
         job_results_header = self.browser.find_element(
@@ -288,79 +363,34 @@ class LinkedinEasyApply:
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
 
-        for job_tile in job_list:
-            job_title, company, poster, job_location, apply_method, link = (
-                "",
-                "",
-                "",
-                "",
-                "",
-                "",
-            )
-
-            try:
-                ## patch to incorporate new 'verification' crap by LinkedIn
-                # job_title = job_tile.find_element(By.CLASS_NAME, 'job-card-list__title').text # original code
-                job_title_element = job_tile.find_element(
-                    By.CLASS_NAME, "job-card-list__title--link"
-                )
-                job_title = job_title_element.find_element(By.TAG_NAME, "strong").text
-
-                link = (
-                    job_tile.find_element(By.CLASS_NAME, "job-card-list__title--link")
-                    .get_attribute("href")
-                    .split("?")[0]
+        # One script call for the whole page; element lookups are the fallback
+        cards = extract_job_cards(self.browser, job_list)
+        if cards is None:
+            cards = [None] * len(job_list)
+
+        for job_tile, card in zip(job_list, cards):
+            if card is None:
+                card = self._read_job_tile(job_tile)
+            job_title = card["title"]
+            company = card["company"]
+            poster = card["poster"]
+            job_location = card["location"]
+            apply_method = card["apply_method"]
+            link = card["link"]
+
+            if card.get("applied") and link not in self.seen_jobs:
+                print(f"Already applied to {company} for the position of {job_title}.")
+                self.seen_jobs.record(
+                    link, "applied_earlier", company, job_title, job_location, location
                 )
-            except:
-                pass
-            try:
-                # company = job_tile.find_element(By.CLASS_NAME, 'job-card-container__primary-description').text # original code
-                company = job_tile.find_element(
-                    By.CLASS_NAME, "artdeco-entity-lockup__subtitle"
-                ).text
-            except:
-                pass
-            try:
-                # get the name of the person who posted for the position, if any is listed
-                hiring_line = job_tile.find_element(
-                    By.XPATH, "//span[contains(.,' is hiring for this')]"
-                )
-                hiring_line_text = hiring_line.text
-                name_terminating_index = hiring_line_text.find(" is hiring for this")
-                if name_terminating_index != -1:
-                    poster = hiring_line_text[:name_terminating_index]
-            except:
-                pass
-            try:
-                job_location = job_tile.find_element(
-                    By.CLASS_NAME, "job-card-container__metadata-item"
-                ).text
-            except:
-                pass
-            try:
-                apply_method = job_tile.find_element(
-                    By.CLASS_NAME, "job-card-container__apply-method"
-                ).text
-            except:
-                pass
-
-            contains_blacklisted_keywords = False
-            job_title_parsed = job_title.lower().split(" ")
+                continue
 
-            for word in self.title_blacklist:
-                if word.lower() in job_title_parsed:
-                    contains_blacklisted_keywords = True
-                    break
+            rejection = self.job_filter.rejection(job_title, company, poster)
 
-            if (
-                company.lower() not in [word.lower() for word in self.company_blacklist]
-                and poster.lower()
-                not in [word.lower() for word in self.poster_blacklist]
-                and contains_blacklisted_keywords is False
-                and link not in self.seen_jobs
-            ):
+            if rejection is None and link not in self.seen_jobs:
                 try:
                     # Click the job to load description
+                    previous_description = text_of(self.browser, "#job-details")
                     max_retries = 3
                     retries = 0
                     while retries < max_retries:
@@ -375,11 +405,17 @@ class LinkedinEasyApply:
                             retries += 1
                             continue
 
-                    time.sleep(random.uniform(3, 5))
+                    self.waits.until(
+                        text_changed("#job-details", previous_description),
+                        timeout=5,
+                        description="the job description",
+                    )
+                    self.waits.pause()
 
                     # TODO: Check if the job is already applied or the application has been reached
                     # "You’ve reached the Easy Apply application limit for today. Save this job and come back tomorrow to continue applying."
                     # Do this before evaluating job fit to save on API calls
+                    self.job_resume_dir = self.resume_dir
                     if self.tailor_resume:
                         try:
                             job_description = self.browser.find_element(
@@ -388,7 +424,16 @@ class LinkedinEasyApply:
                             replacements = self.ai_response_generator.get_tailored_skills_replacements(
                                 job_description
                             )
-                            self.ai_response_generator.tailor_resume_pdf(replacements)
+                            if replacements:
+                                # Always tailor the original resume; identical
+                                # replacement sets reuse the same tailored file
+                                tailored_resume = (
+                                    self.ai_response_generator.tailor_resume_pdf(
+                                        replacements, self.resume_dir
+                                    )
+                                )
+                                if tailored_resume:
+                                    self.job_resume_dir = tailored_resume
                         except:
                             print("Could not load job description and tailorResume")
                     if self.evaluate_job_fit:
@@ -409,13 +454,16 @@ class LinkedinEasyApply:
                         except:
                             print("Could not load job description")
 
+                    status = "failed"
                     try:
                         done_applying = self.apply_to_job()
                         if done_applying:
+                            status = "applied"
                             print(
                                 f"Application sent to {company} for the position of {job_title}."
                             )
                         else:
+                            status = "applied_earlier"
                             print(
                                 f"An application for a job at {company} has been submitted earlier."
                             )
@@ -440,6 +488,15 @@ class LinkedinEasyApply:
                         self.file_name = temp
                         print(f"updated {temp}.")
 
+                    try:
+                        self.seen_jobs.record(
+                            link, status, company, job_title, job_location, location
+                        )
+                    except Exception as e:
+                        print(
+                            f"Unable to record the job in the application ledger: {e}"
+                        )
+
                     try:
                         write_to_file(
                             self.file_name,
@@ -458,12 +515,80 @@ class LinkedinEasyApply:
                     traceback.print_exc()
                     print(f"Could not apply to the job in {company}")
                     pass
-            else:
+            elif rejection is not None:
+                field, entry = rejection
                 print(
-                    f"Job for {company} by {poster} contains a blacklisted word {word}."
+                    f"Job for {company} by {poster} skipped: {field} matches blacklist entry '{entry}'."
                 )
 
-            self.seen_jobs += link
+            self.seen_jobs.mark_seen(link)
+
+    def _read_job_tile(self, job_tile):
+        """Fields of one job card, read element by element"""
+        job_title, company, poster, job_location, apply_method, link = (
+            "",
+            "",
+            "",
+            "",
+            "",
+            "",
+        )
+
+        try:
+            ## patch to incorporate new 'verification' crap by LinkedIn
+            # job_title = job_tile.find_element(By.CLASS_NAME, 'job-card-list__title').text # original code
+            job_title_element = job_tile.find_element(
+                By.CLASS_NAME, "job-card-list__title--link"
+            )
+            job_title = job_title_element.find_element(By.TAG_NAME, "strong").text
+
+            link = (
+                job_tile.find_element(By.CLASS_NAME, "job-card-list__title--link")
+                .get_attribute("href")
+                .split("?")[0]
+            )
+        except:
+            pass
+        try:
+            # company = job_tile.find_element(By.CLASS_NAME, 'job-card-container__primary-description').text # original code
+            company = job_tile.find_element(
+                By.CLASS_NAME, "artdeco-entity-lockup__subtitle"
+            ).text
+        except:
+            pass
+        try:
+            # get the name of the person who posted for the position, if any is listed
+            hiring_line = job_tile.find_element(
+                By.XPATH, ".//span[contains(.,' is hiring for this')]"
+            )
+            hiring_line_text = hiring_line.text
+            name_terminating_index = hiring_line_text.find(" is hiring for this")
+            if name_terminating_index != -1:
+                poster = hiring_line_text[:name_terminating_index]
+        except:
+            pass
+        try:
+            job_location = job_tile.find_element(
+                By.CLASS_NAME, "job-card-container__metadata-item"
+            ).text
+        except:
+            pass
+        try:
+            apply_method = job_tile.find_element(
+                By.CLASS_NAME, "job-card-container__apply-method"
+            ).text
+        except:
+            pass
+
+        return {
+            "title": job_title,
+            "link": link,
+            "company": company,
+            "poster": poster,
+            "location": job_location,
+            "apply_method": apply_method,
+            "applied": False,
+        }
 
     def apply_to_job(self):
         easy_apply_button = None
@@ -484,8 +609,14 @@ class LinkedinEasyApply:
             pass
 
         print("Starting the job application...")
+        window_count = len(self.browser.window_handles)
         easy_apply_button.click()
-        time.sleep(3)  # Wait for redirect/new tab
+        # Easy Apply opens the modal, external applications a new tab
+        self.waits.until(
+            new_window_or(window_count, ".jobs-easy-apply-modal"),
+            timeout=5,
+            description="the application form",
+        )
 
         # --- New Logic: Check for External Application ---
         main_window = self.browser.current_window_handle
@@ -504,7 +635,7 @@ class LinkedinEasyApply:
                         success = apply_to_greenhouse(
                             self.browser,
                             self.personal_info,
-                            self.resume_dir,
+                            self.job_resume_dir,
                             getattr(self, "cover_letter_dir", ""),
                             self.ai_response_generator,
                         )
@@ -522,7 +653,7 @@ class LinkedinEasyApply:
                         success = apply_to_ashby(
                             self.browser,
                             self.personal_info,
-                            self.resume_dir,
+                            self.job_resume_dir,
                             self.ai_response_generator,
                         )
                         self.browser.close()
@@ -553,9 +684,13 @@ class LinkedinEasyApply:
                         self.unfollow()
                     except:
                         print("Failed to unfollow company.")
-                time.sleep(random.uniform(1.5, 2.5))
+                self.waits.pause()
+                state = modal_state(self.browser)
                 next_button.click()
-                time.sleep(random.uniform(3.0, 5.0))
+                # The step advances, shows errors or the modal closes on submit
+                self.waits.until(
+                    modal_changed(state), timeout=5, description="the next step"
+                )
 
                 # Newer error handling
                 error_messages = [
@@ -598,20 +733,43 @@ class LinkedinEasyApply:
                 self.browser.find_element(
                     By.CLASS_NAME, "artdeco-modal__dismiss"
                 ).click()
-                time.sleep(random.uniform(3, 5))
+                self.waits.until(
+                    any_present(".artdeco-modal__confirm-dialog-btn"),
+                    timeout=5,
+                    description="the discard dialog",
+                )
                 self.browser.find_elements(
                     By.CLASS_NAME, "artdeco-modal__confirm-dialog-btn"
                 )[0].click()
-                time.sleep(random.uniform(3, 5))
+                self.waits.until(
+                    none_present(".artdeco-modal__confirm-dialog-btn"),
+                    timeout=5,
+                    description="the discard dialog to close",
+                )
+                self.waits.pause()
                 raise Exception("Failed to apply to job!")
 
         closed_notification = False
-        time.sleep(random.uniform(3, 5))
-        try:
-            self.browser.find_element(By.CLASS_NAME, "artdeco-modal__dismiss").click()
-            closed_notification = True
-        except:
-            pass
+        # The Easy Apply modal has its own dismiss button, so wait for its form
+        # to go before looking for the confirmation
+        confirmation = self.waits.until(
+            replaced_by(
+                ".jobs-easy-apply-modal__content",
+                ".artdeco-modal__dismiss",
+                ".artdeco-toast-item__dismiss",
+                'button[data-control-name="save_application_btn"]',
+            ),
+            timeout=5,
+            description="the applied confirmation",
+        )
+        if confirmation is not None:
+            try:
+                self.browser.find_element(
+                    By.CLASS_NAME, "artdeco-modal__dismiss"
+                ).click()
+                closed_notification = True
+            except:
+                pass
         try:
             self.browser.find_element(
                 By.CLASS_NAME, "artdeco-toast-item__dismiss"
@@ -627,7 +785,12 @@ class LinkedinEasyApply:
         except:
             pass
 
-        time.sleep(random.uniform(3, 5))
+        self.waits.until(
+            none_present(".artdeco-modal"),
+            timeout=5,
+            description="the confirmation to close",
+        )
+        self.waits.pause()
 
         if closed_notification is False:
             raise Exception("Could not close the applied confirmation window!")
@@ -650,7 +813,11 @@ class LinkedinEasyApply:
                         )
                     elif "city" in lb:
                         self.enter_text(input_field, self.personal_info["City"])
-                        time.sleep(3)
+                        self.waits.until(
+                            any_present("[role=listbox] [role=option]"),
+                            timeout=3,
+                            description="city suggestions",
+                        )
                         input_field.send_keys(Keys.DOWN)
                         input_field.send_keys(Keys.RETURN)
                     elif "zip" in lb or "zip / postal code" in lb or "postal" in lb:
@@ -668,214 +835,261 @@ class LinkedinEasyApply:
         else:
             return "no"
 
+    def experience_in(self, question_text):
+        """Experience keys mentioned in ``question_text``, in config order"""
+        found = set(self.experience_matcher.find(question_text))
+        return [term for term in self.experience if term in found]
+
     def additional_questions(self, form):
         print("Trying to fill up additional questions")
 
+        # Questions that need the AI are collected and answered together once the
+        # whole step has been walked, then filled in by _apply_ai_answer
+        pending_ai_answers = []
+
         questions = form.find_elements(By.CLASS_NAME, "fb-dash-form-element")
-        for question in questions:
-            try:
+        # One script call describes every question of the step; questions it
+        # couldn't describe are probed field type by field type as before
+        fields = read_form_schema(self.browser, questions)
+        if fields is None:
+            fields = [None] * len(questions)
+
+        for question, field in zip(questions, fields):
+            fill = self._field_filler(field)
+            if fill is not None and fill(question, field, pending_ai_answers):
+                continue
+            for fill in (
+                self._fill_radio,
+                self._fill_text,
+                self._fill_date,
+                self._fill_dropdown,
+                self._fill_checkbox,
+            ):
+                if fill(question, None, pending_ai_answers):
+                    break
+
+        self.resolve_ai_answers(pending_ai_answers)
+        self.ai_response_generator.save_question_memory()
+
+    def _field_filler(self, field):
+        """Filler method for a field of the form schema, or None to probe"""
+        if field is None:
+            return None
+        if field["type"] == "radio" or (
+            field["type"] == "checkbox" and field["fieldset"]
+        ):
+            # Checkbox groups are answered like radio questions
+            return self._fill_radio
+        return {
+            "text": self._fill_text,
+            "numeric": self._fill_text,
+            "textarea": self._fill_text,
+            "date": self._fill_date,
+            "select": self._fill_dropdown,
+            "checkbox": self._fill_checkbox,
+        }.get(field["type"])
+
+    def _fill_radio(self, question, field, pending_ai_answers):
+        """Answer a radio (or checkbox group) question; True if handled"""
+        try:
+            if field is not None:
+                radio_text = field["label"].lower()
+                radio_labels = field["labels"]
+                radio_options = [
+                    (i, text.lower()) for i, text in enumerate(field["options"])
+                ]
+            else:
                 # Radio check
                 radio_fieldset = question.find_element(By.TAG_NAME, "fieldset")
                 question_span = radio_fieldset.find_element(
                     By.CLASS_NAME, "fb-dash-form-element__label"
                 ).find_elements(By.TAG_NAME, "span")[0]
                 radio_text = question_span.text.lower()
-                print(f"Radio question text: {radio_text}")
-
                 radio_labels = radio_fieldset.find_elements(By.TAG_NAME, "label")
                 radio_options = [
                     (i, text.text.lower()) for i, text in enumerate(radio_labels)
                 ]
-                print(f"radio options: {[opt[1] for opt in radio_options]}")
-
-                if len(radio_options) == 0:
-                    raise Exception("No radio options found in question")
-
-                answer = None
-
-                # Try to determine answer using existing logic
-                if "driver's licence" in radio_text or "driver's license" in radio_text:
-                    answer = self.get_answer("driversLicence")
-                elif any(
-                    keyword in radio_text.lower()
-                    for keyword in [
-                        "Aboriginal",
-                        "native",
-                        "genous",
-                        "tribe",
-                        "first nations",
-                        "native american",
-                        "native hawaiian",
-                        "inuit",
-                        "metis",
-                        "maori",
-                        "aborigine",
-                        "ancestral",
-                        "native peoples",
-                        "original people",
-                        "first people",
-                        "gender",
-                        "race",
-                        "disability",
-                        "latino",
-                        "torres",
-                        "do you identify",
-                    ]
-                ):
-                    negative_keywords = [
-                        "prefer",
-                        "decline",
-                        "don't",
-                        "specified",
-                        "none",
-                        "no",
-                    ]
-                    answer = next(
-                        (
-                            option
-                            for option in radio_options
-                            if any(
-                                neg_keyword in option[1].lower()
-                                for neg_keyword in negative_keywords
-                            )
-                        ),
-                        None,
-                    )
-
-                elif "assessment" in radio_text:
-                    answer = self.get_answer("assessment")
-
-                elif "clearance" in radio_text:
-                    answer = self.get_answer("securityClearance")
+            print(f"Radio question text: {radio_text}")
+            print(f"radio options: {[opt[1] for opt in radio_options]}")
+
+            if len(radio_options) == 0:
+                raise Exception("No radio options found in question")
+
+            answer = None
+
+            # Try to determine answer using existing logic
+            if "driver's licence" in radio_text or "driver's license" in radio_text:
+                answer = self.get_answer("driversLicence")
+            elif any(
+                keyword in radio_text.lower()
+                for keyword in [
+                    "Aboriginal",
+                    "native",
+                    "genous",
+                    "tribe",
+                    "first nations",
+                    "native american",
+                    "native hawaiian",
+                    "inuit",
+                    "metis",
+                    "maori",
+                    "aborigine",
+                    "ancestral",
+                    "native peoples",
+                    "original people",
+                    "first people",
+                    "gender",
+                    "race",
+                    "disability",
+                    "latino",
+                    "torres",
+                    "do you identify",
+                ]
+            ):
+                negative_keywords = [
+                    "prefer",
+                    "decline",
+                    "don't",
+                    "specified",
+                    "none",
+                    "no",
+                ]
+                answer = next(
+                    (
+                        option
+                        for option in radio_options
+                        if any(
+                            neg_keyword in option[1].lower()
+                            for neg_keyword in negative_keywords
+                        )
+                    ),
+                    None,
+                )
 
-                elif "north korea" in radio_text:
-                    answer = "no"
+            elif "assessment" in radio_text:
+                answer = self.get_answer("assessment")
 
-                elif (
-                    "previously employ" in radio_text or "previous employ" in radio_text
-                ):
-                    answer = "no"
+            elif "clearance" in radio_text:
+                answer = self.get_answer("securityClearance")
 
-                elif (
-                    "authorized" in radio_text
-                    or "authorised" in radio_text
-                    or "legally" in radio_text
-                ):
-                    answer = self.get_answer("legallyAuthorized")
+            elif "north korea" in radio_text:
+                answer = "no"
 
-                elif any(
-                    keyword in radio_text.lower()
-                    for keyword in [
-                        "certified",
-                        "certificate",
-                        "cpa",
-                        "chartered accountant",
-                        "qualification",
-                    ]
-                ):
-                    answer = self.get_answer("certifiedProfessional")
+            elif "previously employ" in radio_text or "previous employ" in radio_text:
+                answer = "no"
 
-                elif "urgent" in radio_text:
-                    answer = self.get_answer("urgentFill")
+            elif (
+                "authorized" in radio_text
+                or "authorised" in radio_text
+                or "legally" in radio_text
+            ):
+                answer = self.get_answer("legallyAuthorized")
+
+            elif any(
+                keyword in radio_text.lower()
+                for keyword in [
+                    "certified",
+                    "certificate",
+                    "cpa",
+                    "chartered accountant",
+                    "qualification",
+                ]
+            ):
+                answer = self.get_answer("certifiedProfessional")
 
-                elif (
-                    "commut" in radio_text
-                    or "on-site" in radio_text
-                    or "hybrid" in radio_text
-                    or "onsite" in radio_text
-                ):
-                    answer = self.get_answer("commute")
+            elif "urgent" in radio_text:
+                answer = self.get_answer("urgentFill")
 
-                elif "remote" in radio_text:
-                    answer = self.get_answer("remote")
+            elif (
+                "commut" in radio_text
+                or "on-site" in radio_text
+                or "hybrid" in radio_text
+                or "onsite" in radio_text
+            ):
+                answer = self.get_answer("commute")
 
-                elif "background check" in radio_text:
-                    answer = self.get_answer("backgroundCheck")
+            elif "remote" in radio_text:
+                answer = self.get_answer("remote")
 
-                elif "drug test" in radio_text:
-                    answer = self.get_answer("drugTest")
+            elif "background check" in radio_text:
+                answer = self.get_answer("backgroundCheck")
 
-                elif (
-                    "currently living" in radio_text
-                    or "currently reside" in radio_text
-                    or "right to live" in radio_text
-                ):
-                    answer = self.get_answer("residency")
+            elif "drug test" in radio_text:
+                answer = self.get_answer("drugTest")
 
-                elif "level of education" in radio_text:
-                    for degree in self.checkboxes["degreeCompleted"]:
-                        if degree.lower() in radio_text:
-                            answer = "yes"
-                            break
+            elif (
+                "currently living" in radio_text
+                or "currently reside" in radio_text
+                or "right to live" in radio_text
+            ):
+                answer = self.get_answer("residency")
 
-                elif "experience" in radio_text:
-                    if self.experience_default > 0:
+            elif "level of education" in radio_text:
+                for degree in self.checkboxes["degreeCompleted"]:
+                    if degree.lower() in radio_text:
                         answer = "yes"
-                    else:
-                        for experience in self.experience:
-                            if experience.lower() in radio_text:
-                                answer = "yes"
-                                break
-
-                elif "data retention" in radio_text:
-                    answer = "no"
-
-                elif "sponsor" in radio_text:
-                    answer = self.get_answer("requireVisa")
-
-                to_select = None
-                if answer is not None:
-                    print(f"Choosing answer: {answer}")
-                    i = 0
-                    for radio in radio_labels:
-                        if answer in radio.text.lower():
-                            to_select = radio_labels[i]
-                            break
-                        i += 1
-                    if to_select is None:
-                        print("Answer not found in radio options")
-
+                        break
+
+            elif "experience" in radio_text:
+                if self.experience_default > 0:
+                    answer = "yes"
+                elif self.experience_in(radio_text):
+                    answer = "yes"
+
+            elif "data retention" in radio_text:
+                answer = "no"
+
+            elif "sponsor" in radio_text:
+                answer = self.get_answer("requireVisa")
+
+            to_select = None
+            if answer is not None:
+                print(f"Choosing answer: {answer}")
+                for i, option in radio_options:
+                    if answer in option:
+                        to_select = radio_labels[i]
+                        break
                 if to_select is None:
-                    print("No answer determined")
-
-                    # Since no response can be determined, we use AI to identify the best responseif available, falling back to the final option if the AI response is not available
-                    ai_response = self.ai_response_generator.generate_response(
-                        question_text, response_type="choice", options=radio_options
-                    )
-                    if ai_response is not None:
-                        to_select = radio_labels[ai_response]
-                    else:
-                        to_select = radio_labels[len(radio_labels) - 1]
-                    # Use original AI response text for CSV, not parsed index
-                    ai_response_text = getattr(self.ai_response_generator, '_last_ai_response_text', str(ai_response) if ai_response is not None else '')
-                    record_unprepared_question(
-                        self.unprepared_questions_file_name,
-                        "radio",
-                        radio_text,
-                        ai_response_text,
-                    )
+                    print("Answer not found in radio options")
+
+            if to_select is None:
+                print("No answer determined")
+
+                # Since no response can be determined, we use AI to identify the best responseif available, falling back to the final option if the AI response is not available
+                pending_ai_answers.append(
+                    {
+                        "kind": "radio",
+                        "question": radio_text,
+                        "response_type": "choice",
+                        "options": radio_options,
+                        "element": radio_labels,
+                    }
+                )
+            else:
                 to_select.click()
 
-                if radio_labels:
-                    continue
-            except Exception as e:
-                print("An exception occurred while filling up radio field")
+            if radio_labels:
+                return True
+        except Exception as e:
+            print("An exception occurred while filling up radio field")
+        return False
 
-            # Questions check
-            try:
+    def _fill_text(self, question, field, pending_ai_answers):
+        """Fill a text, numeric or textarea question; True if handled"""
+        try:
+            if field is not None:
+                question_text = field["label"].lower()
+                txt_field = field["control"]
+                text_field_type = "numeric" if field["type"] == "numeric" else "text"
+            else:
                 question_text = question.find_element(By.TAG_NAME, "label").text.lower()
-                print(question_text)  # TODO: Put logging behind debug flag
-
-                txt_field_visible = False
                 try:
                     txt_field = question.find_element(By.TAG_NAME, "input")
-                    txt_field_visible = True
                 except:
                     try:
                         txt_field = question.find_element(
                             By.TAG_NAME, "textarea"
                         )  # TODO: Test textarea
-                        txt_field_visible = True
                     except:
                         raise Exception(
                             "Could not find textarea or input tag for question"
@@ -888,455 +1102,533 @@ class LinkedinEasyApply:
                     text_field_type = "text"
                 else:
                     raise Exception("Could not determine input type of input field!")
+            print(question_text)  # TODO: Put logging behind debug flag
+
+            to_enter = ""
+            if "experience" in question_text or "how many years in" in question_text:
+                no_of_years = None
+                matched = self.experience_in(question_text)
+                if matched:
+                    no_of_years = int(self.experience[matched[0]])
+                if no_of_years is None:
+                    pending_ai_answers.append(
+                        {
+                            "kind": "number",
+                            "question": question_text,
+                            "response_type": "numeric",
+                            "element": txt_field,
+                            "field_type": text_field_type,
+                            "default": int(self.experience_default),
+                        }
+                    )
+                    return True
+                to_enter = no_of_years
 
-                to_enter = ""
-                if (
-                    "experience" in question_text
-                    or "how many years in" in question_text
-                ):
-                    no_of_years = None
-                    for experience in self.experience:
-                        if experience.lower() in question_text:
-                            no_of_years = int(self.experience[experience])
-                            break
-                    if no_of_years is None:
-                        # self.record_unprepared_question(text_field_type, question_text)
-                        ai_response = self.ai_response_generator.generate_response(
-                            question_text, response_type="numeric"
-                        )
-                        no_of_years = (
-                            ai_response
-                            if ai_response is not None
-                            else int(self.experience_default)
-                        )
-                        # Use original AI response text for CSV, not parsed number
-                        ai_response_text = getattr(self.ai_response_generator, '_last_ai_response_text', str(ai_response) if ai_response is not None else '')
-                        record_unprepared_question(
-                            self.unprepared_questions_file_name,
-                            text_field_type,
-                            question_text,
-                            ai_response_text,
-                        )
-                    to_enter = no_of_years
-
-                elif "grade point average" in question_text:
-                    to_enter = self.university_gpa
-
-                elif "first name" in question_text:
-                    to_enter = self.personal_info["First Name"]
+            elif "grade point average" in question_text:
+                to_enter = self.university_gpa
 
-                elif "last name" in question_text:
-                    to_enter = self.personal_info["Last Name"]
+            elif "first name" in question_text:
+                to_enter = self.personal_info["First Name"]
 
-                elif "name" in question_text:
-                    to_enter = (
-                        self.personal_info["First Name"]
-                        + " "
-                        + self.personal_info["Last Name"]
-                    )
+            elif "last name" in question_text:
+                to_enter = self.personal_info["Last Name"]
 
-                elif "pronouns" in question_text:
-                    to_enter = self.personal_info["Pronouns"]
+            elif "name" in question_text:
+                to_enter = (
+                    self.personal_info["First Name"]
+                    + " "
+                    + self.personal_info["Last Name"]
+                )
 
-                elif "phone" in question_text:
-                    to_enter = self.personal_info["Mobile Phone Number"]
+            elif "pronouns" in question_text:
+                to_enter = self.personal_info["Pronouns"]
 
-                elif "linkedin" in question_text:
-                    to_enter = self.personal_info["Linkedin"]
+            elif "phone" in question_text:
+                to_enter = self.personal_info["Mobile Phone Number"]
 
-                elif (
-                    "message to hiring" in question_text
-                    or "cover letter" in question_text
-                ):
-                    to_enter = self.personal_info["MessageToManager"]
+            elif "linkedin" in question_text:
+                to_enter = self.personal_info["Linkedin"]
 
-                    if not to_enter:
-                        job_title = self.get_current_job_title()
-                        job_description = self.get_current_job_description()
-                        self.ai_response_generator.generate_response(
-                            question_text, response_type="text", jd=job_description
-                        )
+            elif (
+                "message to hiring" in question_text or "cover letter" in question_text
+            ):
+                to_enter = self.personal_info["MessageToManager"]
 
-                elif (
-                    "website" in question_text
-                    or "github" in question_text
-                    or "portfolio" in question_text
-                ):
-                    to_enter = self.personal_info["Website"]
+                if not to_enter:
+                    job_title = self.get_current_job_title()
+                    job_description = self.get_current_job_description()
+                    self.ai_response_generator.generate_response(
+                        question_text, response_type="text", jd=job_description
+                    )
 
-                elif "notice" in question_text or "weeks" in question_text:
-                    if text_field_type == "numeric":
-                        to_enter = int(self.notice_period)
-                    else:
-                        to_enter = str(self.notice_period)
+            elif (
+                "website" in question_text
+                or "github" in question_text
+                or "portfolio" in question_text
+            ):
+                to_enter = self.personal_info["Website"]
 
-                elif (
-                    "salary" in question_text
-                    or "expectation" in question_text
-                    or "compensation" in question_text
-                    or "CTC" in question_text
-                ):
-                    if text_field_type == "numeric":
-                        to_enter = int(self.salary_minimum)
-                    else:
-                        to_enter = float(self.salary_minimum)
+            elif "notice" in question_text or "weeks" in question_text:
+                if text_field_type == "numeric":
+                    to_enter = int(self.notice_period)
+                else:
+                    to_enter = str(self.notice_period)
 
-                # Since no response can be determined, we use AI to generate a response if available, falling back to 0 or empty string if the AI response is not available
+            elif (
+                "salary" in question_text
+                or "expectation" in question_text
+                or "compensation" in question_text
+                or "CTC" in question_text
+            ):
                 if text_field_type == "numeric":
-                    if not isinstance(to_enter, (int, float)):
-                        ai_response = self.ai_response_generator.generate_response(
-                            question_text, response_type="numeric"
-                        )
-                        # Use original AI response text for CSV, not parsed number
-                        ai_response_text = getattr(self.ai_response_generator, '_last_ai_response_text', str(ai_response) if ai_response is not None else '')
-                        record_unprepared_question(
-                            self.unprepared_questions_file_name,
-                            text_field_type,
-                            question_text,
-                            ai_response_text,
-                        )
-                        to_enter = ai_response if ai_response is not None else 0
-                elif to_enter == "":
-                    ai_response = self.ai_response_generator.generate_response(
-                        question_text, response_type="text"
-                    )
-                    # Use original AI response text for CSV
-                    ai_response_text = getattr(self.ai_response_generator, '_last_ai_response_text', ai_response if ai_response is not None else '')
-                    record_unprepared_question(
-                        self.unprepared_questions_file_name,
-                        text_field_type,
-                        question_text,
-                        ai_response_text,
+                    to_enter = int(self.salary_minimum)
+                else:
+                    to_enter = float(self.salary_minimum)
+
+            # Since no response can be determined, we use AI to generate a response if available, falling back to 0 or empty string if the AI response is not available
+            if text_field_type == "numeric":
+                if not isinstance(to_enter, (int, float)):
+                    pending_ai_answers.append(
+                        {
+                            "kind": "number",
+                            "question": question_text,
+                            "response_type": "numeric",
+                            "element": txt_field,
+                            "field_type": text_field_type,
+                            "default": 0,
+                        }
                     )
-                    to_enter = ai_response if ai_response is not None else " ‏‏‎ "
+                    return True
+            elif to_enter == "":
+                pending_ai_answers.append(
+                    {
+                        "kind": "text",
+                        "question": question_text,
+                        "response_type": "text",
+                        "element": txt_field,
+                        "field_type": text_field_type,
+                        "default": " ‏‏‎ ",
+                    }
+                )
+                return True
 
-                enter_text(txt_field, to_enter)
-                continue
-            except:
-                print(
-                    "An exception occurred while filling up text field"
-                )  # TODO: Put logging behind debug flag
+            enter_text(txt_field, to_enter)
+            return True
+        except:
+            print(
+                "An exception occurred while filling up text field"
+            )  # TODO: Put logging behind debug flag
+        return False
 
-            # Date Check
-            try:
+    def _fill_date(self, question, field, pending_ai_answers):
+        """Fill a date picker with today's date; True if handled"""
+        try:
+            if field is not None:
+                date_picker = field["control"]
+            else:
                 date_picker = question.find_element(
                     By.CLASS_NAME, "artdeco-datepicker__input "
                 )
-                date_picker.clear()
-                date_picker.send_keys(date.today().strftime("%m/%d/%y"))
-                time.sleep(3)
-                date_picker.send_keys(Keys.RETURN)
-                time.sleep(2)
-                continue
-            except:
-                print(
-                    "An exception occurred while filling up date picker field"
-                )  # TODO: Put logging behind debug flag
+            date_picker.clear()
+            today = date.today().strftime("%m/%d/%y")
+            date_picker.send_keys(today)
+            self.waits.until(
+                lambda driver: date_picker.get_attribute("value") == today,
+                timeout=3,
+                description="the date to be entered",
+            )
+            date_picker.send_keys(Keys.RETURN)
+            self.waits.pause()
+            return True
+        except:
+            print(
+                "An exception occurred while filling up date picker field"
+            )  # TODO: Put logging behind debug flag
+        return False
 
-            # Dropdown check
-            try:
+    def _fill_dropdown(self, question, field, pending_ai_answers):
+        """Answer a select question; True if handled"""
+        try:
+            if field is not None:
+                question_text = field["label"].lower()
+                dropdown_field = field["control"]
+                options = field["options"]
+            else:
                 question_text = question.find_element(By.TAG_NAME, "label").text.lower()
-                print(
-                    f"Dropdown question text: {question_text}"
-                )  # TODO: Put logging behind debug flag
                 dropdown_field = question.find_element(By.TAG_NAME, "select")
 
                 select = Select(dropdown_field)
                 options = [options.text for options in select.options]
-                print(
-                    f"Dropdown options: {options}"
-                )  # TODO: Put logging behind debug flag
-
-                if "proficiency" in question_text:
-                    proficiency = "None"
-                    for language in self.languages:
-                        if language.lower() in question_text:
-                            proficiency = self.languages[language]
-                            break
-                    select_dropdown(dropdown_field, proficiency)
-
-                elif "clearance" in question_text:
-                    answer = self.get_answer("securityClearance")
-
-                    choice = ""
-                    for option in options:
-                        if answer == "yes":
-                            choice = option
-                        else:
-                            if "no" in option.lower():
-                                choice = option
-                    if choice == "":
-                        record_unprepared_question(
-                            self.unprepared_questions_file_name,
-                            text_field_type,
-                            question_text,
-                        )
-                    select_dropdown(dropdown_field, choice)
-
-                elif "assessment" in question_text:
-                    answer = self.get_answer("assessment")
-                    choice = ""
-                    for option in options:
-                        if answer == "yes":
-                            choice = option
-                        else:
-                            if "no" in option.lower():
-                                choice = option
-                    # if choice == "":
-                    #    choice = options[len(options) - 1]
-                    select_dropdown(dropdown_field, choice)
-
-                elif (
-                    "commut" in question_text
-                    or "on-site" in question_text
-                    or "hybrid" in question_text
-                    or "onsite" in question_text
-                ):
-                    answer = self.get_answer("commute")
-
-                    choice = ""
-                    for option in options:
-                        if answer == "yes":
+            print(
+                f"Dropdown question text: {question_text}"
+            )  # TODO: Put logging behind debug flag
+            print(f"Dropdown options: {options}")  # TODO: Put logging behind debug flag
+
+            if "proficiency" in question_text:
+                proficiency = "None"
+                for language in self.languages:
+                    if language.lower() in question_text:
+                        proficiency = self.languages[language]
+                        break
+                select_dropdown(dropdown_field, proficiency)
+
+            elif "clearance" in question_text:
+                answer = self.get_answer("securityClearance")
+
+                choice = ""
+                for option in options:
+                    if answer == "yes":
+                        choice = option
+                    else:
+                        if "no" in option.lower():
                             choice = option
-                        else:
-                            if "no" in option.lower():
-                                choice = option
-                    # if choice == "":
-                    #    choice = options[len(options) - 1]
-                    select_dropdown(dropdown_field, choice)
-
-                elif "country code" in question_text:
-                    select_dropdown(
-                        dropdown_field, self.personal_info["Phone Country Code"]
+                if choice == "":
+                    record_unprepared_question(
+                        self.unprepared_questions_file_name,
+                        "dropdown",
+                        question_text,
                     )
-
-                elif "north korea" in question_text:
-                    choice = ""
-                    for option in options:
+                select_dropdown(dropdown_field, choice)
+
+            elif "assessment" in question_text:
+                answer = self.get_answer("assessment")
+                choice = ""
+                for option in options:
+                    if answer == "yes":
+                        choice = option
+                    else:
                         if "no" in option.lower():
                             choice = option
-                    if choice == "":
-                        choice = options[len(options) - 1]
-                    select_dropdown(dropdown_field, choice)
+                # if choice == "":
+                #    choice = options[len(options) - 1]
+                select_dropdown(dropdown_field, choice)
+
+            elif (
+                "commut" in question_text
+                or "on-site" in question_text
+                or "hybrid" in question_text
+                or "onsite" in question_text
+            ):
+                answer = self.get_answer("commute")
 
-                elif (
-                    "previously employed" in question_text
-                    or "previous employment" in question_text
-                ):
-                    choice = ""
-                    for option in options:
+                choice = ""
+                for option in options:
+                    if answer == "yes":
+                        choice = option
+                    else:
                         if "no" in option.lower():
                             choice = option
-                    if choice == "":
-                        choice = options[len(options) - 1]
-                    select_dropdown(dropdown_field, choice)
-
-                elif "sponsor" in question_text:
-                    answer = self.get_answer("requireVisa")
-                    choice = ""
-                    for option in options:
-                        if answer == "yes":
+                # if choice == "":
+                #    choice = options[len(options) - 1]
+                select_dropdown(dropdown_field, choice)
+
+            elif "country code" in question_text:
+                select_dropdown(
+                    dropdown_field, self.personal_info["Phone Country Code"]
+                )
+
+            elif "north korea" in question_text:
+                choice = ""
+                for option in options:
+                    if "no" in option.lower():
+                        choice = option
+                if choice == "":
+                    choice = options[len(options) - 1]
+                select_dropdown(dropdown_field, choice)
+
+            elif (
+                "previously employed" in question_text
+                or "previous employment" in question_text
+            ):
+                choice = ""
+                for option in options:
+                    if "no" in option.lower():
+                        choice = option
+                if choice == "":
+                    choice = options[len(options) - 1]
+                select_dropdown(dropdown_field, choice)
+
+            elif "sponsor" in question_text:
+                answer = self.get_answer("requireVisa")
+                choice = ""
+                for option in options:
+                    if answer == "yes":
+                        choice = option
+                    else:
+                        if "no" in option.lower():
                             choice = option
-                        else:
-                            if "no" in option.lower():
-                                choice = option
-                    if choice == "":
-                        choice = options[len(options) - 1]
-                    select_dropdown(dropdown_field, choice)
-
-                elif (
-                    "above 18" in question_text.lower()
-                ):  # Check for "above 18" in the question text
-                    choice = ""
-                    for option in options:
-                        if "yes" in option.lower():  # Select 'yes' option
+                if choice == "":
+                    choice = options[len(options) - 1]
+                select_dropdown(dropdown_field, choice)
+
+            elif (
+                "above 18" in question_text.lower()
+            ):  # Check for "above 18" in the question text
+                choice = ""
+                for option in options:
+                    if "yes" in option.lower():  # Select 'yes' option
+                        choice = option
+                if choice == "":
+                    choice = options[
+                        0
+                    ]  # Default to the first option if 'yes' is not found
+                select_dropdown(dropdown_field, choice)
+
+            elif (
+                "currently living" in question_text
+                or "currently reside" in question_text
+            ):
+                answer = self.get_answer("residency")
+                choice = ""
+                for option in options:
+                    if answer == "yes":
+                        choice = option
+                    else:
+                        if "no" in option.lower():
                             choice = option
-                    if choice == "":
-                        choice = options[
-                            0
-                        ]  # Default to the first option if 'yes' is not found
-                    select_dropdown(dropdown_field, choice)
-
-                elif (
-                    "currently living" in question_text
-                    or "currently reside" in question_text
-                ):
-                    answer = self.get_answer("residency")
-                    choice = ""
-                    for option in options:
-                        if answer == "yes":
+                if choice == "":
+                    choice = options[len(options) - 1]
+                select_dropdown(dropdown_field, choice)
+
+            elif "authorized" in question_text or "authorised" in question_text:
+                answer = self.get_answer("legallyAuthorized")
+                choice = ""
+                for option in options:
+                    if answer == "yes":
+                        # find some common words
+                        choice = option
+                    else:
+                        if "no" in option.lower():
                             choice = option
-                        else:
-                            if "no" in option.lower():
-                                choice = option
-                    if choice == "":
-                        choice = options[len(options) - 1]
-                    select_dropdown(dropdown_field, choice)
-
-                elif "authorized" in question_text or "authorised" in question_text:
-                    answer = self.get_answer("legallyAuthorized")
-                    choice = ""
-                    for option in options:
-                        if answer == "yes":
-                            # find some common words
+                if choice == "":
+                    choice = options[len(options) - 1]
+                select_dropdown(dropdown_field, choice)
+
+            elif "citizenship" in question_text:
+                answer = self.get_answer("legallyAuthorized")
+                choice = ""
+                for option in options:
+                    if answer == "yes":
+                        if "no" in option.lower():
                             choice = option
-                        else:
-                            if "no" in option.lower():
-                                choice = option
-                    if choice == "":
-                        choice = options[len(options) - 1]
-                    select_dropdown(dropdown_field, choice)
-
-                elif "citizenship" in question_text:
-                    answer = self.get_answer("legallyAuthorized")
-                    choice = ""
-                    for option in options:
-                        if answer == "yes":
-                            if "no" in option.lower():
-                                choice = option
-                    if choice == "":
-                        choice = options[len(options) - 1]
-                    select_dropdown(dropdown_field, choice)
-
-                elif "clearance" in question_text:
-                    answer = self.get_answer("clearance")
-                    choice = ""
-                    for option in options:
-                        if answer == "yes":
+                if choice == "":
+                    choice = options[len(options) - 1]
+                select_dropdown(dropdown_field, choice)
+
+            elif "clearance" in question_text:
+                answer = self.get_answer("clearance")
+                choice = ""
+                for option in options:
+                    if answer == "yes":
+                        choice = option
+                    else:
+                        if "no" in option.lower():
                             choice = option
-                        else:
-                            if "no" in option.lower():
-                                choice = option
-                    if choice == "":
-                        choice = options[len(options) - 1]
-
-                    select_dropdown(dropdown_field, choice)
-
-                elif any(
-                    keyword in question_text.lower()
-                    for keyword in [
-                        "aboriginal",
-                        "native",
-                        "indigenous",
-                        "tribe",
-                        "first nations",
-                        "native american",
-                        "native hawaiian",
-                        "inuit",
-                        "metis",
-                        "maori",
-                        "aborigine",
-                        "ancestral",
-                        "native peoples",
-                        "original people",
-                        "first people",
-                        "gender",
-                        "race",
-                        "disability",
-                        "latino",
-                    ]
-                ):
-                    negative_keywords = [
-                        "prefer",
-                        "decline",
-                        "don't",
-                        "specified",
-                        "none",
-                    ]
-
-                    choice = ""
-                    choice = next(
-                        (
-                            option
-                            for options in option.lower()
-                            if any(
-                                neg_keyword in option.lower()
-                                for neg_keyword in negative_keywords
-                            )
-                        ),
-                        None,
-                    )
-
-                    self.select_dropdown(dropdown_field, choice)
+                if choice == "":
+                    choice = options[len(options) - 1]
 
-                elif "email" in question_text:
-                    continue  # assume email address is filled in properly by default
+                select_dropdown(dropdown_field, choice)
+
+            elif any(
+                keyword in question_text.lower()
+                for keyword in [
+                    "aboriginal",
+                    "native",
+                    "indigenous",
+                    "tribe",
+                    "first nations",
+                    "native american",
+                    "native hawaiian",
+                    "inuit",
+                    "metis",
+                    "maori",
+                    "aborigine",
+                    "ancestral",
+                    "native peoples",
+                    "original people",
+                    "first people",
+                    "gender",
+                    "race",
+                    "disability",
+                    "latino",
+                ]
+            ):
+                negative_keywords = [
+                    "prefer",
+                    "decline",
+                    "don't",
+                    "specified",
+                    "none",
+                ]
 
-                elif (
-                    "experience" in question_text
-                    or "understanding" in question_text
-                    or "familiar" in question_text
-                    or "comfortable" in question_text
-                    or "able to" in question_text
-                ):
-                    answer = "no"
-                    if self.experience_default > 0:
-                        answer = "yes"
-                    else:
-                        for experience in self.experience:
-                            if (
-                                experience.lower() in question_text
-                                and self.experience[experience] > 0
-                            ):
-                                answer = "yes"
-                                break
-                    if answer == "no":
-                        # record unlisted experience as unprepared questions
-                        record_unprepared_question(
-                            self.unprepared_questions_file_name,
-                            "dropdown",
-                            question_text,
+                choice = ""
+                choice = next(
+                    (
+                        option
+                        for options in option.lower()
+                        if any(
+                            neg_keyword in option.lower()
+                            for neg_keyword in negative_keywords
                         )
+                    ),
+                    None,
+                )
 
-                    choice = ""
-                    for option in options:
-                        if answer in option.lower():
-                            choice = option
-                    if choice == "":
-                        choice = options[len(options) - 1]
-                    select_dropdown(dropdown_field, choice)
+                self.select_dropdown(dropdown_field, choice)
 
-                else:
-                    print(f"Unhandled dropdown question: {question_text}")
+            elif "email" in question_text:
+                return True  # assume email address is filled in properly by default
 
-                    # Since no response can be determined, we use AI to identify the best responseif available, falling back "yes" or the final response if the AI response is not available
-                    choice = options[len(options) - 1]
-                    choices = [(i, option) for i, option in enumerate(options)]
-                    ai_response = self.ai_response_generator.generate_response(
-                        question_text, response_type="choice", options=choices
-                    )
-                    # Use original AI response text for CSV, not parsed index
-                    ai_response_text = getattr(self.ai_response_generator, '_last_ai_response_text', str(ai_response) if ai_response is not None else '')
+            elif (
+                "experience" in question_text
+                or "understanding" in question_text
+                or "familiar" in question_text
+                or "comfortable" in question_text
+                or "able to" in question_text
+            ):
+                answer = "no"
+                if self.experience_default > 0:
+                    answer = "yes"
+                elif any(
+                    self.experience[experience] > 0
+                    for experience in self.experience_in(question_text)
+                ):
+                    answer = "yes"
+                if answer == "no":
+                    # record unlisted experience as unprepared questions
                     record_unprepared_question(
                         self.unprepared_questions_file_name,
                         "dropdown",
                         question_text,
-                        ai_response_text,
                     )
-                    if ai_response is not None:
-                        choice = options[ai_response]
-                    else:
-                        choice = ""
-                        for option in options:
-                            if "yes" in option.lower():
-                                choice = option
 
-                    print(f"Selected option: {choice}")
-                    select_dropdown(dropdown_field, choice)
-                continue
-            except:
-                print(
-                    "An exception occurred while filling up dropdown field"
-                )  # TODO: Put logging behind debug flag
+                choice = ""
+                for option in options:
+                    if answer in option.lower():
+                        choice = option
+                if choice == "":
+                    choice = options[len(options) - 1]
+                select_dropdown(dropdown_field, choice)
 
-            # Checkbox check for agreeing to terms and service
-            try:
+            else:
+                print(f"Unhandled dropdown question: {question_text}")
+
+                # Since no response can be determined, we use AI to identify the best responseif available, falling back "yes" or the final response if the AI response is not available
+                pending_ai_answers.append(
+                    {
+                        "kind": "dropdown",
+                        "question": question_text,
+                        "response_type": "choice",
+                        "options": [(i, option) for i, option in enumerate(options)],
+                        "element": dropdown_field,
+                    }
+                )
+            return True
+        except:
+            print(
+                "An exception occurred while filling up dropdown field"
+            )  # TODO: Put logging behind debug flag
+        return False
+
+    def _fill_checkbox(self, question, field, pending_ai_answers):
+        """Tick a checkbox, e.g. agreeing to terms; True if handled"""
+        try:
+            if field is not None:
+                if field["value"]:
+                    return True  # already ticked, clicking would untick it
+                clickable_checkbox = field["labels"][0]
+            else:
                 clickable_checkbox = question.find_element(By.TAG_NAME, "label")
-                clickable_checkbox.click()
-            except:
-                print(
-                    "An exception occurred while filling up checkbox field"
-                )  # TODO: Put logging behind debug flag
+            clickable_checkbox.click()
+            return True
+        except:
+            print(
+                "An exception occurred while filling up checkbox field"
+            )  # TODO: Put logging behind debug flag
+        return False
+
+    def resolve_ai_answers(self, pending_ai_answers):
+        """
+        Answer the questions collected on the current form step and fill them in.
+        With batchQuestions enabled all of them go to the AI in a single request.
+        """
+        if not pending_ai_answers:
+            return
+
+        if self.batch_questions and len(pending_ai_answers) > 1:
+            ai_responses = self.ai_response_generator.generate_responses(
+                pending_ai_answers
+            )
+            ai_response_texts = self.ai_response_generator._last_ai_response_texts
+        else:
+            ai_responses, ai_response_texts = [], []
+            for pending in pending_ai_answers:
+                ai_responses.append(
+                    self.ai_response_generator.generate_response(
+                        pending["question"],
+                        response_type=pending["response_type"],
+                        options=pending.get("options"),
+                    )
+                )
+                # Use original AI response text for CSV, not the parsed value
+                ai_response_texts.append(
+                    self.ai_response_generator._last_ai_response_text or ""
+                )
+
+        for pending, ai_response, ai_response_text in zip(
+            pending_ai_answers, ai_responses, ai_response_texts
+        ):
+            try:
+                self._apply_ai_answer(pending, ai_response, ai_response_text)
+            except Exception:
+                print(f"An exception occurred while filling up {pending['kind']} field")
+
+    def _apply_ai_answer(self, pending, ai_response, ai_response_text):
+        kind = pending["kind"]
+        question_text = pending["question"]
+
+        if kind == "radio":
+            radio_labels = pending["element"]
+            if ai_response is not None:
+                to_select = radio_labels[ai_response]
+            else:
+                to_select = radio_labels[len(radio_labels) - 1]
+            record_unprepared_question(
+                self.unprepared_questions_file_name,
+                "radio",
+                question_text,
+                ai_response_text,
+            )
+            to_select.click()
+
+        elif kind == "dropdown":
+            options = [option for _, option in pending["options"]]
+            record_unprepared_question(
+                self.unprepared_questions_file_name,
+                "dropdown",
+                question_text,
+                ai_response_text,
+            )
+            if ai_response is not None:
+                choice = options[ai_response]
+            else:
+                choice = ""
+                for option in options:
+                    if "yes" in option.lower():
+                        choice = option
+
+            print(f"Selected option: {choice}")
+            select_dropdown(pending["element"], choice)
+
+        else:
+            record_unprepared_question(
+                self.unprepared_questions_file_name,
+                pending["field_type"],
+                question_text,
+                ai_response_text,
+            )
+            to_enter = ai_response if ai_response is not None else pending["default"]
+            enter_text(pending["element"], to_enter)
 
     def unfollow(self):
         try:
@@ -1369,12 +1661,12 @@ class LinkedinEasyApply:
                         By.XPATH, ".."
                     ).find_element(By.XPATH, "preceding-sibling::*")
                     if "resume" in upload_type.text.lower():
-                        upload_button.send_keys(self.resume_dir)
+                        upload_button.send_keys(self.job_resume_dir)
                     elif "cover" in upload_type.text.lower():
                         if self.cover_letter_dir != "":
                             upload_button.send_keys(self.cover_letter_dir)
                         elif "required" in upload_type.text.lower():
-                            upload_button.send_keys(self.resume_dir)
+                            upload_button.send_keys(self.job_resume_dir)
         except:
             print("Failed to upload resume or cover letter!")
             pass
@@ -1418,6 +1710,8 @@ class LinkedinEasyApply:
         if self.disable_lock:
             return
 
+        import pyautogui
+
         pyautogui.keyDown("ctrl")
         pyautogui.press("esc")
         pyautogui.keyUp("ctrl")
@@ -87,6 +87,75 @@ def human_scroll(browser, element, scrolls=2):
         random_delay(0.2, 0.5)
 
 
+# Deferred AI answers: handlers first scan the whole form, queueing every field
+# that needs the AI as (question, response_type, options, apply), then resolve
+# all of them concurrently and only then fill them in.
+def resolve_ai_answers(ai_response_generator, pending, jd=""):
+    if not pending:
+        ai_response_generator.save_question_memory()
+        return
+    questions = [
+        {"question": question, "response_type": response_type, "options": options}
+        for question, response_type, options, _ in pending
+    ]
+    try:
+        answers = ai_response_generator.generate_responses_concurrently(
+            questions, jd=jd
+        )
+    except Exception as e:
+        print(f"Could not resolve AI answers concurrently: {e}")
+        answers = [
+            ai_response_generator.generate_response(
+                q["question"],
+                response_type=q["response_type"],
+                options=q["options"],
+                jd=jd,
+            )
+            for q in questions
+        ]
+    ai_response_generator.save_question_memory()
+    for (question, _, _, apply), answer in zip(pending, answers):
+        try:
+            apply(answer)
+            random_delay()
+        except Exception as e:
+            print(f"Could not fill AI answer for '{question}': {e}")
+
+
+def type_answer(element):
+    def apply(answer):
+        element.clear()
+        element.send_keys(answer)
+
+    return apply
+
+
+def choose_option(options, option_texts):
+    """Click the option at the AI's index, else 'Prefer not to say' or the first"""
+
+    def apply(answer):
+        if answer is not None and 0 <= answer < len(options):
+            options[answer].click()
+            return
+        for opt, text in zip(options, option_texts):
+            if "prefer not" in text.lower():
+                opt.click()
+                break
+        else:
+            options[0].click()
+
+    return apply
+
+
+def tick_if_yes(checkbox):
+    def apply(answer):
+        if answer and answer.strip().lower().startswith("y"):
+            if not checkbox.is_selected():
+                checkbox.click()
+
+    return apply
+
+
 # Ashby application handler
 def apply_to_ashby(
     browser,
@@ -100,6 +169,7 @@ def apply_to_ashby(
     print("Starting Ashby Application.")
     wait = WebDriverWait(browser, 20)
     context = get_field_context(personal_info, eeo, salary_minimum)
+    pending_ai_answers = []
     try:
         # 1. Go to "Application" tab (if not already there)
         try:
@@ -169,11 +239,9 @@ def apply_to_ashby(
                             value_filled = True
                             break
                 if not value_filled:
-                    ai_answer = ai_response_generator.generate_response(
-                        label_text, response_type="text", jd=jd
+                    pending_ai_answers.append(
+                        (label_text, "text", None, type_answer(inp))
                     )
-                    inp.clear()
-                    inp.send_keys(ai_answer)
                 random_delay()
             except Exception as e:
                 print(f"Could not fill Ashby text input: {e}")
@@ -202,17 +270,18 @@ def apply_to_ashby(
                         value_filled = True
                         break
                 if not value_filled:
-                    ai_answer = ai_response_generator.generate_response(
-                        label_text, response_type="text", jd=jd
+                    pending_ai_answers.append(
+                        (label_text, "text", None, type_answer(ta))
                     )
-                    ta.clear()
-                    ta.send_keys(ai_answer)
                 random_delay()
             except Exception as e:
                 print(f"Could not fill Ashby textarea: {e}")
 
-        # 5. Optionally handle selects (dropdowns) if needed
-        # 6. Submit the form
+        # 5. Answer the remaining questions with the AI, all at once
+        resolve_ai_answers(ai_response_generator, pending_ai_answers, jd=jd)
+
+        # 6. Optionally handle selects (dropdowns) if needed
+        # 7. Submit the form
         submit_btn = browser.find_element(
             By.XPATH,
             "//button[contains(@class,'ashby-application-form-submit-button')]",
@@ -233,6 +302,7 @@ def apply_to_greenhouse(
 ):
     print("Starting Greenhouse Application.")
     wait = WebDriverWait(browser, 15)
+    pending_ai_answers = []
     try:
         # Wait for either modern or classic Greenhouse form container
         try:
@@ -412,11 +482,9 @@ def apply_to_greenhouse(
                             value_filled = True
                             break
                     if not value_filled:
-                        ai_answer = ai_response_generator.generate_response(
-                            label_text, response_type="text", jd=jd
+                        pending_ai_answers.append(
+                            (label_text, "text", None, type_answer(input_elem))
                         )
-                        input_elem.clear()
-                        input_elem.send_keys(ai_answer)
                     random_delay()
                 except Exception as e:
                     print(f"Could not autofill .field: {e}")
@@ -534,70 +602,43 @@ def apply_to_greenhouse(
                             print(f"Could not handle React select for {qid}: {e}")
                     if not value_filled:
                         if input_type == "checkbox":
-                            ai_answer = ai_response_generator.generate_response(
-                                label_text, response_type="text", jd=jd
+                            pending_ai_answers.append(
+                                (label_text, "text", None, tick_if_yes(inp))
                             )
-                            if ai_answer.strip().lower().startswith("y"):
-                                if not inp.is_selected():
-                                    inp.click()
                         elif input_type == "radio":
                             name = inp.get_attribute("name")
                             radios = browser.find_elements(By.NAME, name)
-                            options = [
-                                (i, radio.get_attribute("value"))
-                                for i, radio in enumerate(radios)
+                            radio_values = [
+                                radio.get_attribute("value") for radio in radios
                             ]
-                            ai_answer = ai_response_generator.generate_response(
-                                label_text,
-                                response_type="choice",
-                                options=options,
-                                jd=jd,
+                            pending_ai_answers.append(
+                                (
+                                    label_text,
+                                    "choice",
+                                    list(enumerate(radio_values)),
+                                    choose_option(radios, radio_values),
+                                )
                             )
-                            if ai_answer is not None and 0 <= ai_answer < len(radios):
-                                radios[ai_answer].click()
-                            else:
-                                for radio in radios:
-                                    if (
-                                        "prefer not"
-                                        in radio.get_attribute("value").lower()
-                                    ):
-                                        radio.click()
-                                        break
-                                else:
-                                    radios[0].click()
                         elif input_type == "select-one":
                             options = inp.find_elements(By.TAG_NAME, "option")
                             option_texts = [opt.text.strip() for opt in options]
                             if options and len(option_texts) > 1:
-                                ai_answer = ai_response_generator.generate_response(
-                                    label_text,
-                                    response_type="choice",
-                                    options=list(enumerate(option_texts)),
-                                    jd=jd,
+                                pending_ai_answers.append(
+                                    (
+                                        label_text,
+                                        "choice",
+                                        list(enumerate(option_texts)),
+                                        choose_option(options, option_texts),
+                                    )
                                 )
-                                if ai_answer is not None and 0 <= ai_answer < len(
-                                    options
-                                ):
-                                    options[ai_answer].click()
-                                else:
-                                    for i, opt in enumerate(options):
-                                        if "prefer not" in opt.text.lower():
-                                            opt.click()
-                                            break
-                                    else:
-                                        options[0].click()
                             else:
-                                ai_answer = ai_response_generator.generate_response(
-                                    label_text, response_type="text", jd=jd
+                                pending_ai_answers.append(
+                                    (label_text, "text", None, type_answer(inp))
                                 )
-                                inp.clear()
-                                inp.send_keys(ai_answer)
                         else:
-                            ai_answer = ai_response_generator.generate_response(
-                                label_text, response_type="text", jd=jd
+                            pending_ai_answers.append(
+                                (label_text, "text", None, type_answer(inp))
                             )
-                            inp.clear()
-                            inp.send_keys(ai_answer)
                 random_delay()
             except Exception as e:
                 print(f"Could not fill input {inp.get_attribute('id')}: {e}")
@@ -624,11 +665,9 @@ def apply_to_greenhouse(
                         value_filled = True
                         break
                 if not value_filled:
-                    ai_answer = ai_response_generator.generate_response(
-                        label_text, response_type="text", jd=jd
+                    pending_ai_answers.append(
+                        (label_text, "text", None, type_answer(ta))
                     )
-                    ta.clear()
-                    ta.send_keys(ai_answer)
                 random_delay()
             except Exception as e:
                 print(f"Could not fill textarea {ta.get_attribute('id')}: {e}")
@@ -651,31 +690,22 @@ def apply_to_greenhouse(
                 option_texts = [opt.text.strip() for opt in options]
                 if options and len(option_texts) > 1:
                     # Always pass the question and options to AI
-                    ai_answer = ai_response_generator.generate_response(
-                        label_text,
-                        response_type="choice",
-                        options=list(enumerate(option_texts)),
-                        jd=jd,
+                    pending_ai_answers.append(
+                        (
+                            label_text,
+                            "choice",
+                            list(enumerate(option_texts)),
+                            choose_option(options, option_texts),
+                        )
                     )
-                    if ai_answer is not None and 0 <= ai_answer < len(options):
-                        options[ai_answer].click()
-                    else:
-                        # fallback: select 'Prefer not to say' or first
-                        for i, opt in enumerate(options):
-                            if "prefer not" in opt.text.lower():
-                                opt.click()
-                                break
-                        else:
-                            options[0].click()
                 else:
                     # If no options found, fallback to text answer
-                    ai_answer = ai_response_generator.generate_response(
-                        label_text, response_type="text", jd=jd
-                    )
-                    sel.send_keys(ai_answer)
+                    pending_ai_answers.append((label_text, "text", None, sel.send_keys))
                 random_delay()
             except Exception as e:
                 print(f"Could not fill select {sel.get_attribute('id')}: {e}")
+        # Answer every queued question concurrently, then fill them in
+        resolve_ai_answers(ai_response_generator, pending_ai_answers, jd=jd)
         random_delay(0.8, 1.5)
         submit_btn = browser.find_element(
             By.XPATH, "//button[contains(text(), 'Submit application')]"
@@ -3,11 +3,7 @@ import warnings
 from pathlib import Path
 
 import yaml
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from validate_email import validate_email
-from webdriver_manager.chrome import ChromeDriverManager
 
 # Suppress Pydantic serialization warnings from LiteLLM
 warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
@@ -43,6 +39,11 @@ def find_config_file():
 
 
 def init_browser():
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
     browser_options = Options()
     options = [
         "--disable-blink-features",
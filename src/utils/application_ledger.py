@@ -0,0 +1,177 @@
+import csv
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# ".../jobs/view/4012345678/" or "...?currentJobId=4012345678"
+JOB_ID_IN_PATH = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)")
+JOB_ID_IN_QUERY = re.compile(r"[?&](?:currentJobId|jobId)=(\d+)")
+
+
+def job_id_from_link(link):
+    """LinkedIn job ID of ``link``, or the bare link for other job boards"""
+    link = (link or "").strip()
+    if not link:
+        return None
+    match = JOB_ID_IN_PATH.search(link) or JOB_ID_IN_QUERY.search(link)
+    if match:
+        return match.group(1)
+    return link.split("?")[0].split("#")[0].rstrip("/")
+
+
+class ApplicationLedger:
+    """
+    Jobs already applied to, keyed by LinkedIn job ID.
+
+    Applications are stored in SQLite (WAL mode, so several bot processes can
+    share the file) and their IDs are loaded into a set once, at startup.
+    Membership checks hit the set first and fall back to a primary-key lookup,
+    which also sees applications recorded by other processes since startup.
+    Jobs that were only looked at in this run (skipped, blacklisted) are kept
+    in memory with ``mark_seen`` and not persisted.
+
+    When the database is new, the links of ``csv_path`` (the bot's
+    ``output.csv``, link in the third column) are imported once.
+    """
+
+    def __init__(self, path, csv_path=None):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False
+        )
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS applications (
+                    job_id TEXT PRIMARY KEY,
+                    link TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    company TEXT NOT NULL DEFAULT '',
+                    job_title TEXT NOT NULL DEFAULT '',
+                    location TEXT NOT NULL DEFAULT '',
+                    search_location TEXT NOT NULL DEFAULT '',
+                    recorded_at REAL NOT NULL
+                )
+                """)
+            empty = (
+                self._conn.execute("SELECT 1 FROM applications LIMIT 1").fetchone()
+                is None
+            )
+        if empty and csv_path:
+            self.import_csv(csv_path)
+        with self._lock:
+            self._seen = {
+                row[0] for row in self._conn.execute("SELECT job_id FROM applications")
+            }
+
+    def import_csv(self, csv_path):
+        """Record the links of an ``output.csv`` written by earlier versions"""
+        try:
+            with open(csv_path, "r", encoding="utf-8", newline="") as f:
+                rows = [row for row in csv.reader(f) if len(row) > 2]
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            print(f"Error reading {csv_path}: {e}")
+            return 0
+
+        now = time.time()
+        records = []
+        for row in rows:
+            job_id = job_id_from_link(row[2])
+            if job_id:
+                company, job_title = row[0], row[1]
+                location = row[3] if len(row) > 3 else ""
+                search_location = row[4] if len(row) > 4 else ""
+                records.append(
+                    (job_id, row[2], company, job_title, location, search_location, now)
+                )
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO applications (job_id, link, status, company, "
+                "job_title, location, search_location, recorded_at) "
+                "VALUES (?, ?, 'imported', ?, ?, ?, ?, ?)",
+                records,
+            )
+        print(f"Imported {len(records)} jobs from {csv_path} into {self.path}")
+        return len(records)
+
+    def __contains__(self, link):
+        job_id = job_id_from_link(link)
+        if job_id is None:
+            return False
+        with self._lock:
+            if job_id in self._seen:
+                return True
+            # Recorded by another process since this one started?
+            row = self._conn.execute(
+                "SELECT 1 FROM applications WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is not None:
+                self._seen.add(job_id)
+            return row is not None
+
+    def __len__(self):
+        with self._lock:
+            return len(self._seen)
+
+    def mark_seen(self, link):
+        """Skip ``link`` for the rest of this run without recording it"""
+        job_id = job_id_from_link(link)
+        if job_id is not None:
+            with self._lock:
+                self._seen.add(job_id)
+
+    def record(
+        self,
+        link,
+        status,
+        company="",
+        job_title="",
+        location="",
+        search_location="",
+    ):
+        """
+        Persist an application attempt. ``status`` is e.g. "applied" or
+        "failed"; a later record of the same job replaces the earlier one.
+        """
+        job_id = job_id_from_link(link)
+        if job_id is None:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO applications (job_id, link, status, company, "
+                "job_title, location, search_location, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    link,
+                    status,
+                    company,
+                    job_title,
+                    location,
+                    search_location,
+                    time.time(),
+                ),
+            )
+            self._seen.add(job_id)
+
+    def status(self, link):
+        """Recorded status of ``link``, or None if it was never applied to"""
+        job_id = job_id_from_link(link)
+        if job_id is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM applications WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,113 @@
+# Describes every question of an Easy Apply step in one WebDriver round-trip.
+# The checks follow the order additional_questions used to probe in: radio
+# fieldset, text input or textarea, date picker, select, checkbox.
+FORM_SCHEMA_SCRIPT = """
+const visibleText = (el) => (el ? el.innerText.trim() : "");
+const locatorOf = (el) => (el && el.id ? "#" + CSS.escape(el.id) : null);
+return arguments[0].map((question) => {
+    try {
+        const required = (control) =>
+            Boolean(
+                (control && (control.required
+                    || control.getAttribute("aria-required") === "true"))
+                || question.querySelector("[class*='required']")
+            );
+        const fieldset = question.querySelector("fieldset");
+        if (fieldset) {
+            const labels = Array.from(fieldset.querySelectorAll("label"));
+            const legend = fieldset.querySelector(".fb-dash-form-element__label");
+            const span = legend ? legend.querySelector("span") : null;
+            const inputs = Array.from(fieldset.querySelectorAll("input"));
+            const checked = inputs.find((input) => input.checked);
+            const checkedLabel = checked
+                ? labels.find((label) => label.htmlFor === checked.id)
+                : null;
+            return {
+                type: inputs.some((input) => input.type === "checkbox")
+                    ? "checkbox" : "radio",
+                fieldset: true,
+                label: visibleText(span || legend),
+                value: visibleText(checkedLabel),
+                required: required(inputs[0]),
+                options: labels.map(visibleText),
+                labels: labels,
+                control: fieldset,
+                locator: locatorOf(fieldset) || locatorOf(inputs[0]),
+            };
+        }
+
+        const label = question.querySelector("label");
+        const select = question.querySelector("select");
+        // An input wins over a select, as the text probe used to run first
+        const control = question.querySelector("input:not([type=hidden]), textarea")
+            || select;
+        if (!control) {
+            return null;
+        }
+        let type;
+        if (control.tagName === "SELECT") {
+            type = "select";
+        } else if (control.tagName === "TEXTAREA") {
+            type = "textarea";
+        } else if (control.type === "checkbox") {
+            type = "checkbox";
+        } else if (control.classList.contains("artdeco-datepicker__input")) {
+            type = "date";
+        } else if ((control.id || "").toLowerCase().includes("numeric")) {
+            // Decimal and integer fields keep type "text"; the id says numeric
+            type = "numeric";
+        } else if ((control.type || "").toLowerCase().includes("text")) {
+            type = "text";
+        } else {
+            type = "unknown";
+        }
+        return {
+            type: type,
+            fieldset: false,
+            label: visibleText(label),
+            value: type === "select"
+                ? visibleText(control.options[control.selectedIndex])
+                : type === "checkbox"
+                    ? (control.checked ? "checked" : "")
+                    : control.value || "",
+            required: required(control),
+            options: type === "select"
+                ? Array.from(control.options).map(visibleText)
+                : [],
+            labels: label ? [label] : [],
+            control: control,
+            locator: locatorOf(control),
+        };
+    } catch (e) {
+        return null;
+    }
+});
+"""
+
+FIELD_TYPES = ("radio", "checkbox", "text", "numeric", "textarea", "date", "select")
+
+
+def read_form_schema(browser, questions):
+    """
+    Typed description of each element of ``questions`` (the
+    ``fb-dash-form-element`` containers of a step), from one
+    ``execute_script``. Each field is a dict with ``type`` (one of
+    ``FIELD_TYPES`` or "unknown"), ``label``, ``value`` ("checked" for a
+    ticked checkbox), ``required``, ``options``, ``labels`` and ``control``
+    (WebElements to fill in) and a ``locator`` CSS selector, or None where a
+    question couldn't be described. Returns None when the script failed and
+    the questions have to be probed.
+    """
+    if not questions:
+        return []
+    try:
+        fields = browser.execute_script(FORM_SCHEMA_SCRIPT, list(questions))
+    except Exception as e:
+        print(f"Could not read the form schema with JavaScript: {str(e)}")
+        return None
+    if not isinstance(fields, list) or len(fields) != len(questions):
+        return None
+    return [
+        field if isinstance(field, dict) and field.get("type") else None
+        for field in fields
+    ]
@@ -0,0 +1,87 @@
+# Reads every job card of a results page in one WebDriver round-trip. Selectors
+# mirror the per-element lookups in LinkedinEasyApply._read_job_tile.
+JOB_CARDS_SCRIPT = """
+const text = (root, selector) => {
+    const el = root.querySelector(selector);
+    return el ? el.innerText.trim() : "";
+};
+return arguments[0].map((card) => {
+    try {
+        const titleLink = card.querySelector(".job-card-list__title--link");
+        const strong = titleLink ? titleLink.querySelector("strong") : null;
+        let poster = "";
+        for (const span of card.querySelectorAll("span")) {
+            const index = span.innerText.indexOf(" is hiring for this");
+            if (index !== -1) {
+                poster = span.innerText.slice(0, index).trim();
+                break;
+            }
+        }
+        const idHolder = card.hasAttribute("data-occludable-job-id")
+            ? card
+            : card.querySelector("[data-occludable-job-id], [data-job-id]");
+        const footer = card.querySelectorAll(
+            ".job-card-container__footer-job-state, .job-card-container__footer-item"
+        );
+        return {
+            job_id: idHolder
+                ? idHolder.getAttribute("data-occludable-job-id")
+                    || idHolder.getAttribute("data-job-id") || ""
+                : "",
+            title: strong ? strong.innerText.trim() : "",
+            link: titleLink ? (titleLink.href || "").split("?")[0] : "",
+            company: text(card, ".artdeco-entity-lockup__subtitle"),
+            poster: poster,
+            location: text(card, ".job-card-container__metadata-item"),
+            apply_method: text(card, ".job-card-container__apply-method"),
+            applied: Array.from(footer).some(
+                (el) => /^applied\\b/i.test(el.innerText.trim())
+            ),
+        };
+    } catch (e) {
+        return null;
+    }
+});
+"""
+
+JOB_CARD_FIELDS = (
+    "job_id",
+    "title",
+    "link",
+    "company",
+    "poster",
+    "location",
+    "apply_method",
+)
+
+
+def extract_job_cards(browser, job_tiles):
+    """
+    Fields of every card in ``job_tiles`` from a single ``execute_script``:
+    one dict per tile (None where the card couldn't be read), or None when
+    the script failed and the tiles have to be read element by element.
+    """
+    if not job_tiles:
+        return []
+    try:
+        cards = browser.execute_script(JOB_CARDS_SCRIPT, list(job_tiles))
+    except Exception as e:
+        print(f"Could not read job cards with JavaScript: {str(e)}")
+        return None
+    if not isinstance(cards, list) or len(cards) != len(job_tiles):
+        return None
+
+    result = []
+    for card in cards:
+        # A card without title and link is still loading; read it directly
+        if not isinstance(card, dict) or not (card.get("title") or card.get("link")):
+            result.append(None)
+            continue
+        normalized = {field: str(card.get(field) or "") for field in JOB_CARD_FIELDS}
+        normalized["applied"] = bool(card.get("applied"))
+        if not normalized["link"] and normalized["job_id"]:
+            normalized["link"] = (
+                f"https://www.linkedin.com/jobs/view/{normalized['job_id']}/"
+            )
+        result.append(normalized)
+    return result
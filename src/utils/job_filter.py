@@ -0,0 +1,141 @@
+import difflib
+import re
+
+# Title blacklist entries with these prefixes are a regular expression or a
+# fuzzy word/phrase instead of a literal one
+REGEX_PREFIX = "re:"
+FUZZY_PREFIX = "~"
+FUZZY_MIN_RATIO = 0.85
+
+
+def _normalize(name):
+    return " ".join(str(name).casefold().split())
+
+
+def _whole_words(*alternatives):
+    """Pattern matching any of ``alternatives`` on word boundaries"""
+    return re.compile(
+        r"(?<!\w)(?:" + "|".join(f"(?:{a})" for a in alternatives) + r")(?!\w)",
+        re.I,
+    )
+
+
+class JobFilter:
+    """
+    Company, poster and job title blacklists, compiled once.
+
+    Companies and posters are matched exactly (case-insensitively) against
+    frozen sets. Title entries are words or phrases matched on word
+    boundaries, all in one compiled regular expression; entries starting
+    with ``re:`` are regular expressions and entries starting with ``~``
+    also match misspellings (similarity ratio of at least
+    ``FUZZY_MIN_RATIO``). ``rejection`` reports which entry rejected a job.
+    """
+
+    def __init__(
+        self, title_blacklist=None, company_blacklist=None, poster_blacklist=None
+    ):
+        self.companies = frozenset(
+            _normalize(name) for name in company_blacklist or [] if name
+        )
+        self.posters = frozenset(
+            _normalize(name) for name in poster_blacklist or [] if name
+        )
+
+        self._title_literals = {}
+        self._title_regexes = []
+        self._title_fuzzy = []
+        for entry in title_blacklist or []:
+            if not entry:
+                continue
+            entry = str(entry).strip()
+            if entry.lower().startswith(REGEX_PREFIX):
+                pattern = entry[len(REGEX_PREFIX) :].strip()
+                # Checked on its own, so a bad entry is skipped, not fatal
+                try:
+                    self._title_regexes.append((_whole_words(pattern), pattern, entry))
+                except re.error as e:
+                    print(
+                        f"Skipping invalid titleBlacklist regex '{pattern}': {str(e)}"
+                    )
+            elif entry.startswith(FUZZY_PREFIX):
+                phrase = _normalize(entry[len(FUZZY_PREFIX) :])
+                if phrase:
+                    self._title_fuzzy.append((phrase, entry))
+                    self._title_literals.setdefault(phrase, entry)
+            else:
+                self._title_literals.setdefault(_normalize(entry), entry)
+
+        # Longest phrases first so "senior staff" is reported over "senior"
+        alternatives = [
+            r"\s+".join(re.escape(word) for word in phrase.split())
+            for phrase in sorted(self._title_literals, key=len, reverse=True)
+        ]
+        self._title_pattern = None
+        # Regexes valid on their own may still clash once combined (e.g. two
+        # with the same group name); those are then searched one by one
+        self._separate_regexes = False
+        try:
+            if alternatives or self._title_regexes:
+                self._title_pattern = _whole_words(
+                    *alternatives, *(pattern for _, pattern, _ in self._title_regexes)
+                )
+        except re.error:
+            self._separate_regexes = True
+            self._title_pattern = _whole_words(*alternatives) if alternatives else None
+        self.rejections = {}
+
+    def _title_entry(self, title):
+        """Blacklist entry matching ``title``, or None"""
+        if self._title_pattern is not None:
+            match = self._title_pattern.search(title)
+            if match:
+                matched = _normalize(match.group())
+                if matched in self._title_literals:
+                    return self._title_literals[matched]
+                for regex, _, entry in self._title_regexes:
+                    if regex.fullmatch(match.group()):
+                        return entry
+                return match.group()
+
+        if self._separate_regexes:
+            for regex, _, entry in self._title_regexes:
+                if regex.search(title):
+                    return entry
+
+        if self._title_fuzzy:
+            words = _normalize(re.sub(r"[^\w+#]+", " ", title)).split()
+            for phrase, entry in self._title_fuzzy:
+                size = len(phrase.split())
+                for start in range(len(words) - size + 1):
+                    candidate = " ".join(words[start : start + size])
+                    ratio = difflib.SequenceMatcher(None, phrase, candidate).ratio()
+                    if ratio >= FUZZY_MIN_RATIO:
+                        return entry
+        return None
+
+    def rejection(self, job_title="", company="", poster=""):
+        """
+        ``(field, entry)`` of the blacklist entry rejecting the job, e.g.
+        ``("title", "senior")``, or None if the job passes all blacklists.
+        """
+        if company and _normalize(company) in self.companies:
+            reason = ("company", company)
+        elif poster and _normalize(poster) in self.posters:
+            reason = ("poster", poster)
+        else:
+            entry = self._title_entry(job_title or "")
+            if entry is None:
+                return None
+            reason = ("title", entry)
+        self.rejections[reason] = self.rejections.get(reason, 0) + 1
+        return reason
+
+    def stats(self):
+        """Rejected jobs per blacklist entry, most frequent first"""
+        return {
+            f"{field}: {entry}": count
+            for (field, entry), count in sorted(
+                self.rejections.items(), key=lambda item: -item[1]
+            )
+        }
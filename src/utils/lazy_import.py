@@ -0,0 +1,46 @@
+import importlib
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is only imported on first attribute access.
+
+    Heavy optional dependencies (FAISS, PyTorch via sentence-transformers,
+    LiteLLM, PDF parsers) cost seconds and hundreds of MB at import time, so
+    modules bind them through this proxy and pay that cost only on the code
+    path that actually uses them. Attributes set on the proxy (e.g. by
+    ``unittest.mock.patch``) shadow the real module's attributes.
+    """
+
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            module = importlib.import_module(self.__dict__["_name"])
+            self.__dict__["_module"] = module
+        return module
+
+    @property
+    def is_loaded(self):
+        return self.__dict__["_module"] is not None
+
+    def __getattr__(self, item):
+        return getattr(self._load(), item)
+
+    def __setattr__(self, key, value):
+        self.__dict__[key] = value
+
+    def __delattr__(self, item):
+        del self.__dict__[item]
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_import(name):
+    """Return a proxy that imports ``name`` the first time it is used"""
+    return LazyModule(name)
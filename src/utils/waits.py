@@ -0,0 +1,167 @@
+import random
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Conditions query the DOM with JavaScript rather than find_element(s), so a
+# miss costs one round-trip instead of the driver's implicit wait.
+_ANY_PRESENT_SCRIPT = """
+for (const selector of arguments[0]) {
+    if (document.querySelector(selector)) {
+        return selector;
+    }
+}
+return null;
+"""
+
+# What changes when an Easy Apply step advances or is rejected: the progress,
+# the step heading, the primary button and the inline error messages
+_MODAL_STATE_SCRIPT = """
+const modal = document.querySelector(".jobs-easy-apply-modal, .artdeco-modal");
+if (!modal) {
+    return null;
+}
+const text = (selector) => {
+    const el = modal.querySelector(selector);
+    return el ? el.innerText.trim() : "";
+};
+const progress = modal.querySelector("progress, [role=progressbar]");
+return [
+    progress ? progress.value || progress.getAttribute("aria-valuenow") : "",
+    text("h3"),
+    text(".artdeco-button--primary"),
+    modal.querySelectorAll(".artdeco-inline-feedback--error").length,
+].join("|");
+"""
+
+_TEXT_SCRIPT = """
+const el = document.querySelector(arguments[0]);
+return el ? el.innerText : null;
+"""
+
+
+def any_present(*selectors):
+    """Condition: the first of the CSS ``selectors`` present on the page"""
+
+    def condition(driver):
+        return driver.execute_script(_ANY_PRESENT_SCRIPT, list(selectors))
+
+    return condition
+
+
+def none_present(*selectors):
+    """Condition: none of the CSS ``selectors`` is on the page any more"""
+
+    def condition(driver):
+        return driver.execute_script(_ANY_PRESENT_SCRIPT, list(selectors)) is None
+
+    return condition
+
+
+def replaced_by(gone, *selectors):
+    """Condition: ``gone`` left the page and one of ``selectors`` is present"""
+
+    def condition(driver):
+        if driver.execute_script(_ANY_PRESENT_SCRIPT, [gone]) is not None:
+            return None
+        return driver.execute_script(_ANY_PRESENT_SCRIPT, list(selectors))
+
+    return condition
+
+
+def modal_state(driver):
+    """Fingerprint of the open Easy Apply modal, or None when it is closed"""
+    return driver.execute_script(_MODAL_STATE_SCRIPT)
+
+
+def modal_changed(before):
+    """Condition: the modal moved on from ``before`` (or was closed)"""
+
+    def condition(driver):
+        return modal_state(driver) != before
+
+    return condition
+
+
+def text_of(driver, selector):
+    return driver.execute_script(_TEXT_SCRIPT, selector)
+
+
+def text_changed(selector, before):
+    """Condition: ``selector`` is present and its text differs from ``before``"""
+
+    def condition(driver):
+        text = text_of(driver, selector)
+        return text is not None and text.strip() != "" and text != before
+
+    return condition
+
+
+def new_window_or(handle_count, *selectors):
+    """Condition: a tab was opened, or one of ``selectors`` appeared"""
+
+    def condition(driver):
+        if len(driver.window_handles) > handle_count:
+            return "window"
+        return driver.execute_script(_ANY_PRESENT_SCRIPT, list(selectors))
+
+    return condition
+
+
+class PageWaits:
+    """
+    Waits that end as soon as the page is ready, plus a configurable pause.
+
+    ``until`` polls a condition with ``WebDriverWait`` and returns its value,
+    or None after ``timeout`` seconds (callers carry on as they did after a
+    fixed sleep). ``pause`` is the human-like delay between actions, drawn
+    from ``min_delay``..``max_delay`` and independent of page speed.
+    """
+
+    def __init__(
+        self, browser, timeout=10, min_delay=1.0, max_delay=2.0, poll_frequency=0.2
+    ):
+        self.browser = browser
+        self.timeout = timeout
+        self.min_delay = max(0.0, min_delay)
+        self.max_delay = max(self.min_delay, max_delay)
+        self.poll_frequency = poll_frequency
+        self._stats = {
+            "waits": 0,
+            "timeouts": 0,
+            "waited_seconds": 0.0,
+            "paused_seconds": 0.0,
+        }
+
+    def until(self, condition, timeout=None, description="the page"):
+        started = time.monotonic()
+        self._stats["waits"] += 1
+        try:
+            return WebDriverWait(
+                self.browser,
+                self.timeout if timeout is None else timeout,
+                poll_frequency=self.poll_frequency,
+                ignored_exceptions=(WebDriverException,),
+            ).until(condition)
+        except TimeoutException:
+            self._stats["timeouts"] += 1
+            print(f"Timed out waiting for {description}")
+            return None
+        finally:
+            self._stats["waited_seconds"] += time.monotonic() - started
+
+    def pause(self):
+        """Human-like delay between actions, as configured"""
+        delay = random.uniform(self.min_delay, self.max_delay)
+        if delay > 0:
+            time.sleep(delay)
+            self._stats["paused_seconds"] += delay
+        return delay
+
+    def stats(self):
+        return {
+            **self._stats,
+            "waited_seconds": round(self._stats["waited_seconds"], 3),
+            "paused_seconds": round(self._stats["paused_seconds"], 3),
+        }
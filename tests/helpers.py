@@ -0,0 +1,82 @@
+import shutil
+import tempfile
+import unittest
+import zlib
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.ai.ai_response_generator import AIResponseGenerator
+from src.ai.cache import normalize_text
+
+
+def bag_of_words_encode(texts, dimension=64):
+    """Deterministic stand-in for the sentence embedding model"""
+    vectors = np.zeros((len(texts), dimension), dtype="float32")
+    for row, text in enumerate(texts):
+        for word in normalize_text(text).split():
+            vectors[row, zlib.crc32(word.encode()) % dimension] += 1.0
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def random_encode(texts, dimension=8):
+    return np.random.rand(len(texts), dimension).astype("float32")
+
+
+def completion_response(content):
+    response = MagicMock()
+    response.choices = [{"message": {"content": content}}]
+    return response
+
+
+def stream_response(*pieces, consumed=None):
+    """Streamed completion yielding ``pieces``; appends each one to ``consumed``"""
+    for piece in pieces:
+        if consumed is not None:
+            consumed.append(piece)
+        chunk = MagicMock()
+        chunk.choices[0].delta = {"content": piece}
+        chunk.choices[0].finish_reason = None
+        yield chunk
+
+
+def make_generator(
+    cache_dir, resume_text=None, encode=bag_of_words_encode, context=None, **kwargs
+):
+    """
+    ``AIResponseGenerator`` caching under ``cache_dir``, with the resume text
+    set directly, embeddings from ``encode`` instead of the sentence model and,
+    when ``context`` is given, that string as every RAG context. ``kwargs``
+    override the constructor arguments.
+    """
+    arguments = {
+        "api_key": "test_api_key",
+        "personal_info": {"First Name": "Test", "Last Name": "User"},
+        "experience": {"Python": 5},
+        "languages": {"English": "Native"},
+        "resume_path": "test_data/sample_resume.pdf",
+        "checkboxes": {"requireVisa": False},
+        "model_name": "test-model",
+        "cache_dir": cache_dir,
+        **kwargs,
+    }
+    generator = AIResponseGenerator(**arguments)
+    if resume_text is not None:
+        generator._resume_content = resume_text
+    if encode is not None:
+        generator._embedding_model = MagicMock()
+        generator._embedding_model.encode.side_effect = lambda texts, **_: encode(texts)
+    if context is not None:
+        generator._build_context_rag = MagicMock(return_value=context)
+    return generator
+
+
+class GeneratorTestCase(unittest.TestCase):
+    """Test case with a temporary cache directory for its generators"""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -1,11 +1,18 @@
 import os
 import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
 import unittest
 from datetime import (
     datetime as dt,  # Alias to avoid conflict with datetime class attribute
 )
 from unittest.mock import MagicMock, mock_open, patch
 
+import numpy as np
+
 # Attempt to import PyPDF2 and its error for PdfReadError
 try:
     import PyPDF2
@@ -21,6 +28,14 @@ except ImportError:
 
 
 from src.ai.ai_response_generator import AIResponseGenerator
+from src.ai.tokens import count_tokens
+from tests.helpers import (
+    GeneratorTestCase,
+    completion_response,
+    make_generator,
+    random_encode,
+    stream_response,
+)
 
 
 class TestAIResponseGenerator(unittest.TestCase):
@@ -103,10 +118,13 @@ class TestAIResponseGenerator(unittest.TestCase):
 
         input_pdf = "test_data/dummy_input.pdf"  # This is a dummy path used as input for the method
 
-        # Construct expected output path based on the dummy input_pdf path
-        expected_dir = os.path.dirname(input_pdf)  # 'test_data'
-        expected_basename = f"dummy_input_tailored_{self.formatted_timestamp}.pdf"
-        expected_output_path = os.path.join(expected_dir, expected_basename)
+        # Tailored copies are named by a hash of the source and replacement set
+        expected_output_path = self.generator.tailored_resume_path(
+            input_pdf, replacements
+        )
+        self.assertRegex(
+            expected_output_path, r"^test_data/dummy_input_tailored_[0-9a-f]{16}\.pdf$"
+        )
 
         result_path = self.generator.tailor_resume_pdf(replacements, input_pdf)
 
@@ -211,10 +229,9 @@ class TestAIResponseGenerator(unittest.TestCase):
         replacements = [{"old": "NonExistentSkill", "new": "SomeSkill"}]
         input_pdf = "test_data/dummy_input.pdf"
 
-        # Expected path construction
-        expected_dir = os.path.dirname(input_pdf)
-        expected_basename = f"dummy_input_tailored_{self.formatted_timestamp}.pdf"
-        expected_output_path = os.path.join(expected_dir, expected_basename)
+        expected_output_path = self.generator.tailored_resume_path(
+            input_pdf, replacements
+        )
 
         result_path = self.generator.tailor_resume_pdf(replacements, input_pdf)
         self.assertEqual(result_path, expected_output_path)  # File is still created
@@ -269,18 +286,8 @@ class TestAIResponseGenerator(unittest.TestCase):
             replacements, self.initial_resume_path
         )
 
-        # Construct the expected tailored path based on initial_resume_path
-        expected_base_name = os.path.basename(
-            self.initial_resume_path
-        )  # sample_resume.pdf
-        name_part, ext_part = os.path.splitext(
-            expected_base_name
-        )  # sample_resume, .pdf
-        expected_tailored_filename = (
-            f"{name_part}_tailored_{self.formatted_timestamp}{ext_part}"
-        )
-        expected_tailored_full_path = os.path.join(
-            os.path.dirname(self.initial_resume_path), expected_tailored_filename
+        expected_tailored_full_path = self.generator.tailored_resume_path(
+            self.initial_resume_path, replacements
         )
 
         self.assertEqual(tailored_path_result, expected_tailored_full_path)
@@ -303,5 +310,552 @@ class TestAIResponseGenerator(unittest.TestCase):
         self.assertEqual(calls[1].args[0], expected_tailored_full_path)
 
 
+class TestVectorIndexPersistence(GeneratorTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.experience = {"currentRole": "Chief Tester", "Python": "5 years"}
+
+    def _make_generator(self, resume_text):
+        return make_generator(
+            self.cache_dir,
+            resume_text,
+            encode=random_encode,
+            experience=self.experience,
+        )
+
+    def test_warm_start_loads_index_without_encoding(self):
+        resume_text = "Experience\n\n" + "Built test automation frameworks. " * 10
+
+        cold = self._make_generator(resume_text)
+        cold._build_vector_index()
+        self.assertEqual(cold._embedding_model.encode.call_count, 1)
+
+        warm = self._make_generator(resume_text)
+        warm._build_vector_index()
+        warm._embedding_model.encode.assert_not_called()
+        self.assertEqual(warm.resume_chunks, cold.resume_chunks)
+        self.assertEqual(warm._faiss_index.ntotal, cold._faiss_index.ntotal)
+        np.testing.assert_allclose(warm._chunk_embeddings, cold._chunk_embeddings)
+
+    def test_profile_change_triggers_rebuild(self):
+        resume_text = "Skills\n\n" + "Python, Selenium, pytest and CI pipelines. " * 5
+
+        self._make_generator(resume_text)._build_vector_index()
+
+        self.experience = {"currentRole": "Chief Tester", "Python": "6 years"}
+        changed = self._make_generator(resume_text)
+        changed._build_vector_index()
+        self.assertEqual(changed._embedding_model.encode.call_count, 1)
+
+    def test_changed_resume_reencodes_only_changed_chunks(self):
+        paragraphs = [
+            f"Project {i}: built test automation for team {i} with Python."
+            for i in range(4)
+        ]
+        generator = self._make_generator("\n\n".join(paragraphs))
+        generator._build_vector_index()
+        before = dict(
+            zip(
+                [chunk["text"] for chunk in generator.resume_chunks],
+                generator._chunk_embeddings,
+            )
+        )
+        generator._build_context_rag("Python?")
+
+        generator.invalidate_resume()
+        paragraphs[2] = "Project 2: migrated the team's test suites to Playwright."
+        generator._resume_content = "\n\n".join(paragraphs)
+        generator._build_vector_index()
+
+        encoded = generator._embedding_model.encode.call_args.args[0]
+        self.assertEqual(encoded, [paragraphs[2]])
+        self.assertEqual(generator._faiss_index.ntotal, 5)
+        for chunk, vector in zip(generator.resume_chunks, generator._chunk_embeddings):
+            if chunk["text"] in before:
+                np.testing.assert_allclose(vector, before[chunk["text"]], rtol=1e-5)
+        self.assertEqual(generator.index_stats, {"encoded": 6, "reused": 4})
+        self.assertEqual(len(generator.context_cache), 0)
+
+    def test_embedding_backends_keep_separate_indexes(self):
+        resume_text = "Experience\n\n" + "Built test automation frameworks. " * 10
+        self._make_generator(resume_text)._build_vector_index()
+
+        onnx = self._make_generator(resume_text)
+        onnx.embedding_backend = "onnx"
+        onnx._build_vector_index()
+
+        # Vectors of one backend are never searched with queries of the other
+        self.assertEqual(onnx._embedding_model.encode.call_count, 1)
+        self.assertTrue(onnx._vector_index_dir().name.endswith("-onnx-int8"))
+
+    def test_rag_context_packs_whole_chunks_within_token_budget(self):
+        resume_text = "\n\n".join(
+            f"Experience\n\nProject {i}: built test automation for team {i}. " * 4
+            for i in range(12)
+        )
+        generator = self._make_generator(resume_text)
+
+        context = generator._build_context_rag("Test automation?", max_tokens=200)
+
+        self.assertLessEqual(count_tokens(context), 200)
+        chunk_texts = {chunk["text"] for chunk in generator.resume_chunks}
+        parts = [part for part in context.split("\n\n") if part.strip()]
+        for part in parts[1:]:
+            self.assertTrue(part in chunk_texts or part.endswith(":"), part)
+
+    def test_rag_context_is_cached_in_bounded_lru(self):
+        resume_text = "Experience\n\n" + "Built test automation frameworks. " * 10
+        generator = self._make_generator(resume_text)
+        generator.context_cache_max_entries = 2
+
+        first = generator._build_context_rag("Years of Python?", "JD one")
+        encodes = generator._embedding_model.encode.call_count
+        second = generator._build_context_rag("Years of Python?", "JD one")
+        self.assertEqual(second, first)
+        self.assertEqual(generator._embedding_model.encode.call_count, encodes)
+
+        generator._build_context_rag("Years of Python?", "JD two")
+        generator._build_context_rag("Years of Python?", "JD three")
+        self.assertEqual(
+            generator.cache_stats()["context"],
+            {**generator.context_cache.stats(), "hits": 1, "evictions": 1, "size": 2},
+        )
+
+
+class TestTailoredResumeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.resume_path = os.path.join(self.directory, "resume.pdf")
+        writer = PyPDF2.PdfWriter()
+        writer.add_blank_page(width=612, height=792)
+        with open(self.resume_path, "wb") as f:
+            writer.write(f)
+        self.generator = make_generator(
+            os.path.join(self.directory, "cache"), resume_path=self.resume_path
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _tailored_copies(self):
+        return sorted(
+            name for name in os.listdir(self.directory) if "_tailored_" in name
+        )
+
+    def test_same_replacement_set_reuses_tailored_pdf(self):
+        first = self.generator.tailor_resume_pdf(
+            [{"old": "Java", "new": "Go"}, {"old": "AWS", "new": "GCP"}],
+            self.resume_path,
+        )
+        with patch("src.ai.ai_response_generator.PyPDF2.PdfReader") as reader:
+            second = self.generator.tailor_resume_pdf(
+                [{"old": "aws", "new": "GCP"}, {"old": "Java ", "new": "Go"}],
+                self.resume_path,
+            )
+
+        self.assertEqual(second, first)
+        reader.assert_not_called()
+        self.assertEqual(self._tailored_copies(), [os.path.basename(first)])
+
+    def test_tailored_copies_are_capped_by_size(self):
+        self.generator.tailored_resume_cache_mb = 1e-6  # room for one copy only
+        self.generator.tailor_resume_pdf([{"old": "A", "new": "B"}], self.resume_path)
+        latest = self.generator.tailor_resume_pdf(
+            [{"old": "C", "new": "D"}], self.resume_path
+        )
+
+        self.assertEqual(self._tailored_copies(), [os.path.basename(latest)])
+
+
+class QuestionTestCase(GeneratorTestCase):
+    """Generators with a fixed resume and RAG context, for question answering"""
+
+    def _make_generator(self):
+        return make_generator(
+            self.cache_dir,
+            "Senior engineer with five years of Python.",
+            context="context",
+        )
+
+
+class TestAnswerCache(QuestionTestCase):
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_repeated_question_is_answered_from_cache_across_restarts(
+        self, mock_completion
+    ):
+        mock_completion.return_value = completion_response("5")
+
+        first = self._make_generator().generate_response(
+            "How many years of experience with Python?", response_type="numeric"
+        )
+        restarted = self._make_generator()
+        second = restarted.generate_response(
+            "how many years of experience with python", response_type="numeric"
+        )
+
+        self.assertEqual(first, 5)
+        self.assertEqual(second, 5)
+        self.assertEqual(mock_completion.call_count, 1)
+        self.assertEqual(restarted.cache_stats()["answers"]["hits"], 1)
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_stock_answers_are_reused_across_jobs(self, mock_completion):
+        mock_completion.return_value = completion_response("5")
+        generator = self._make_generator()
+        generator._question_memory_enabled = False
+
+        for jd in ("Backend engineer at Acme", "Data engineer at Beta"):
+            answer = generator.generate_response(
+                "How many years of experience with Python?",
+                response_type="numeric",
+                jd=jd,
+            )
+            self.assertEqual(answer, 5)
+
+        self.assertEqual(mock_completion.call_count, 1)
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_free_text_answers_are_cached_per_job(self, mock_completion):
+        mock_completion.return_value = completion_response("I like the team.")
+        generator = self._make_generator()
+        generator._question_memory_enabled = False
+
+        for jd in ("Backend engineer at Acme", "Data engineer at Beta"):
+            generator.generate_response(
+                "Why do you want to work here?", response_type="text", jd=jd
+            )
+
+        self.assertEqual(mock_completion.call_count, 2)
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_choice_answers_are_keyed_by_options(self, mock_completion):
+        mock_completion.return_value = completion_response("1")
+        generator = self._make_generator()
+
+        question = "Will you require sponsorship?"
+        generator.generate_response(
+            question, response_type="choice", options=[(0, "Yes"), (1, "No")]
+        )
+        generator.generate_response(
+            question, response_type="choice", options=[(0, "No"), (1, "Yes")]
+        )
+
+        self.assertEqual(mock_completion.call_count, 2)
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_reworded_question_reuses_remembered_answer(self, mock_completion):
+        mock_completion.return_value = completion_response("4")
+        generator = self._make_generator()
+        generator.question_similarity_threshold = 0.5
+
+        generator.generate_response(
+            "How many years of Java experience do you have?", response_type="numeric"
+        )
+        generator.save_question_memory()
+        reused = self._make_generator()
+        reused.question_similarity_threshold = 0.5
+        answer = reused.generate_response(
+            "Years of experience in Java?", response_type="numeric"
+        )
+
+        self.assertEqual(answer, 4)
+        self.assertEqual(mock_completion.call_count, 1)
+        self.assertEqual(reused.cache_stats()["question_memory"]["hits"], 1)
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_resume_change_in_process_invalidates_answers(self, mock_completion):
+        mock_completion.return_value = completion_response("4")
+        generator = self._make_generator()
+        generator.question_similarity_threshold = 0.5
+        generator.generate_response(
+            "How many years of Java experience do you have?", response_type="numeric"
+        )
+
+        generator.invalidate_resume()
+        generator._resume_content = "Junior engineer, one year of Java."
+        generator.generate_response(
+            "Years of experience in Java?", response_type="numeric"
+        )
+
+        # The remembered answer belongs to the old resume
+        self.assertEqual(mock_completion.call_count, 2)
+        self.assertEqual(generator.cache_stats()["question_memory"]["hits"], 0)
+
+
+class TestBatchedAnswers(QuestionTestCase):
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_step_questions_are_answered_in_one_call(self, mock_completion):
+        mock_completion.return_value = completion_response(
+            '{"answers": {"0": "3", "1": "1", "2": "Two weeks"}}'
+        )
+        generator = self._make_generator()
+
+        answers = generator.generate_responses(
+            [
+                {"question": "Years of Go experience?", "response_type": "numeric"},
+                {
+                    "question": "Are you authorized to work in the US?",
+                    "response_type": "choice",
+                    "options": [(0, "No"), (1, "Yes")],
+                },
+                {"question": "What is your notice period?", "response_type": "text"},
+            ]
+        )
+
+        self.assertEqual(answers, [3, 1, "Two weeks"])
+        self.assertEqual(generator._last_ai_response_texts, ["3", "1", "Two weeks"])
+        self.assertEqual(mock_completion.call_count, 1)
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_unparseable_batch_falls_back_to_single_questions(self, mock_completion):
+        mock_completion.side_effect = [
+            completion_response("not json"),
+            completion_response("3"),
+            completion_response("Two weeks"),
+        ]
+        generator = self._make_generator()
+
+        answers = generator.generate_responses(
+            [
+                {"question": "Years of Go experience?", "response_type": "numeric"},
+                {"question": "What is your notice period?", "response_type": "text"},
+            ]
+        )
+
+        self.assertEqual(answers, [3, "Two weeks"])
+        self.assertEqual(mock_completion.call_count, 3)
+
+
+class TestModelEscalation(QuestionTestCase):
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_invalid_small_model_answer_escalates(self, mock_completion):
+        mock_completion.side_effect = [
+            completion_response("Somewhere between three and five"),
+            completion_response("4"),
+        ]
+        generator = self._make_generator()
+        generator.router.model_tiers = {"small": "small-model", "large": "large-model"}
+
+        answer = generator.generate_response(
+            "Years of Go experience?", response_type="numeric"
+        )
+
+        self.assertEqual(answer, 4)
+        self.assertEqual(
+            [c.kwargs["model"] for c in mock_completion.call_args_list],
+            ["small-model", "large-model"],
+        )
+        models = generator.cache_stats()["models"]
+        self.assertEqual(models["small"]["calls"], 1)
+        self.assertEqual(models["large"]["escalations"], 1)
+
+
+class TestConcurrentAnswers(QuestionTestCase):
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_concurrent_answers_deduplicate_identical_questions(self, mock_completion):
+        mock_completion.side_effect = lambda model, messages: (
+            completion_response(
+                "Yes" if "relocate" in messages[1]["content"] else "Two weeks"
+            )
+        )
+        generator = self._make_generator()
+        generator._resume_chunks = []
+
+        relocate = {"question": "Willing to relocate?", "response_type": "text"}
+        answers = generator.generate_responses_concurrently(
+            [
+                relocate,
+                {"question": "What is your notice period?", "response_type": "text"},
+                relocate,
+            ]
+        )
+
+        self.assertEqual(answers, ["Yes", "Two weeks", "Yes"])
+        self.assertEqual(generator._last_ai_response_texts, answers)
+        self.assertEqual(mock_completion.call_count, 2)
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_index_is_built_once_before_the_workers_start(self, mock_completion):
+        mock_completion.return_value = completion_response("3")
+        paragraphs = [
+            f"Project {i}: built test automation for team {i} with Python."
+            for i in range(6)
+        ]
+        generator = make_generator(self.cache_dir, "\n\n".join(paragraphs))
+
+        generator.generate_responses_concurrently(
+            [
+                {"question": f"Years of {skill} experience?", "response_type": "text"}
+                for skill in ("Go", "Rust", "Java", "Kotlin")
+            ]
+        )
+
+        chunk_count = len(generator.resume_chunks)
+        self.assertEqual(generator.index_stats, {"encoded": chunk_count, "reused": 0})
+
+    def test_embedding_model_is_loaded_once_across_threads(self):
+        generator = make_generator(self.cache_dir, encode=None)
+        loaded = []
+
+        def slow_model(name):
+            loaded.append(name)
+            time.sleep(0.05)
+            return MagicMock()
+
+        fake_module = MagicMock(SentenceTransformer=slow_model)
+        with patch.dict(sys.modules, {"sentence_transformers": fake_module}):
+            threads = [
+                threading.Thread(target=lambda: generator.embedding_model)
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(loaded), 1)
+
+
+class TestPromptPrefix(QuestionTestCase):
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_prompts_share_a_stable_profile_prefix(self, mock_completion):
+        response = completion_response("3")
+        response.usage.prompt_tokens = 1500
+        response.usage.prompt_tokens_details = {"cached_tokens": 1200}
+        mock_completion.return_value = response
+        generator = self._make_generator()
+
+        generator.generate_response("Years of Go experience?", "numeric")
+        generator.generate_response("Years of Rust experience?", "numeric")
+
+        first, second = [c.kwargs["messages"] for c in mock_completion.call_args_list]
+        self.assertEqual(first[0], second[0])
+        self.assertIn("First Name: Test", first[0]["content"])
+        self.assertNotIn("Go", first[0]["content"])
+        self.assertTrue(first[1]["content"].endswith("Years of Go experience?"))
+        self.assertEqual(
+            generator.cache_stats()["prompt_tokens"]["generate_response"],
+            {"calls": 2, "prompt_tokens": 3000, "cached_tokens": 2400},
+        )
+
+
+class TestJobFitEvaluation(QuestionTestCase):
+
+    @patch("src.ai.ai_response_generator.time.sleep")
+    @patch("src.ai.ai_response_generator.completion")
+    def test_streamed_job_fit_stops_at_decision(self, mock_completion, _):
+        consumed = []
+        mock_completion.side_effect = lambda **kwargs: (
+            completion_response("Needs 5 years of Python.")
+            if kwargs["model"] == "test-model"
+            else stream_response(
+                "<think>The role asks for Python; the candidate should APPLY ",
+                "if the years match. They do.</think>",
+                " SKIP",
+                ": missing Kubernetes.",
+                " More text that is never read.",
+                consumed=consumed,
+            )
+        )
+        generator = self._make_generator()
+
+        self.assertFalse(generator.evaluate_job_fit("Engineer", "Python engineer"))
+        self.assertEqual(len(consumed), 4)
+        self.assertTrue(mock_completion.call_args.kwargs["stream"])
+
+    @patch("src.ai.ai_response_generator.time.sleep")
+    @patch("src.ai.ai_response_generator.completion")
+    def test_prefilter_decides_clear_cases_without_llm(self, mock_completion, _):
+        mock_completion.side_effect = lambda **kwargs: (
+            completion_response("Summary.")
+            if kwargs["model"] == "test-model"
+            else stream_response("<think>ok</think>", " APPLY", "\n")
+        )
+        generator = self._make_generator()
+        generator._resume_content = (
+            "Experience\n\n"
+            "Built Python test automation frameworks with Selenium and pytest "
+            "for web applications at scale."
+        )
+        generator.job_fit_skip_below = 0.25
+        generator.job_fit_apply_above = 0.6
+
+        matching = "Built Python test automation frameworks with Selenium and pytest."
+        unrelated = "Chef: pastry kitchen, bakery ovens, morning shifts."
+        partial = "Python developer for backend services and cloud data pipelines."
+
+        self.assertTrue(generator.evaluate_job_fit("QA", matching))
+        self.assertFalse(generator.evaluate_job_fit("Chef", unrelated))
+        mock_completion.assert_not_called()
+
+        self.assertTrue(generator.evaluate_job_fit("Developer", partial))
+        self.assertEqual(mock_completion.call_count, 2)
+        tiers = generator.job_fit_tier_stats()
+        self.assertEqual(tiers["prefilter_apply"]["count"], 1)
+        self.assertEqual(tiers["prefilter_skip"]["count"], 1)
+        self.assertAlmostEqual(tiers["llm"]["fraction"], 1 / 3)
+
+    def test_early_decision_detection(self):
+        early = AIResponseGenerator._early_job_fit_decision
+
+        self.assertIsNone(early("<think>should I APPLY or SKIP? "))
+        self.assertEqual(early("<think>Clear fit.\nDECISION: APPLY\n"), "APPLY")
+        self.assertIsNone(early("<think>ok</think> SKIP"))  # token may continue
+        self.assertEqual(early("<think>ok</think> SKIP."), "SKIP")
+        self.assertEqual(early("APPLY\n", decision_only=True), "APPLY")
+        self.assertIsNone(early("APPLY\n"))
+
+    @patch("src.ai.ai_response_generator.time.sleep")
+    @patch("src.ai.ai_response_generator.completion")
+    def test_job_fit_is_reused_until_profile_changes(self, mock_completion, _):
+        mock_completion.side_effect = lambda **kwargs: (
+            completion_response("Needs 5 years of Python.")
+            if kwargs["model"] == "test-model"
+            else stream_response("<think>Good match</think>", " APPLY", "\n")
+        )
+        job_description = "Senior Python Engineer.\nFive years of Python required."
+
+        first = self._make_generator().evaluate_job_fit("Engineer", job_description)
+        repost = self._make_generator().evaluate_job_fit(
+            "Engineer", "  senior python engineer; five years of PYTHON required "
+        )
+        self.assertTrue(first)
+        self.assertTrue(repost)
+        self.assertEqual(mock_completion.call_count, 2)
+
+        changed = self._make_generator()
+        changed._resume_content = "Junior engineer, one year of Python."
+        changed.evaluate_job_fit("Engineer", job_description)
+        self.assertEqual(mock_completion.call_count, 4)
+
+    @patch("src.ai.ai_response_generator.time.sleep")
+    @patch("src.ai.ai_response_generator.completion")
+    def test_resume_change_in_process_invalidates_job_fit(self, mock_completion, _):
+        mock_completion.side_effect = lambda **kwargs: (
+            completion_response("Needs 5 years of Python.")
+            if kwargs["model"] == "test-model"
+            else stream_response("<think>Good match</think>", " APPLY", "\n")
+        )
+        job_description = "Senior Python Engineer.\nFive years of Python required."
+        generator = self._make_generator()
+
+        generator.evaluate_job_fit("Engineer", job_description)
+        generator.evaluate_job_fit("Engineer", job_description)
+        self.assertEqual(mock_completion.call_count, 2)
+
+        generator.invalidate_resume()
+        generator._resume_content = "Junior engineer, one year of Python."
+        generator.evaluate_job_fit("Engineer", job_description)
+        self.assertEqual(mock_completion.call_count, 4)
+        self.assertEqual(generator.job_fit_tier_stats()["cache"]["count"], 1)
+
+
 if __name__ == "__main__":
     unittest.main()
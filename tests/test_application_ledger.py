@@ -0,0 +1,112 @@
+import csv
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from src.utils.application_ledger import ApplicationLedger, job_id_from_link
+
+
+class TestJobIdFromLink(unittest.TestCase):
+
+    def test_linkedin_links_are_keyed_by_job_id(self):
+        for link in (
+            "https://www.linkedin.com/jobs/view/4012345678/",
+            "https://www.linkedin.com/jobs/view/4012345678/?trk=abc",
+            "https://www.linkedin.com/jobs/view/python-developer-at-acme-4012345678",
+            "https://www.linkedin.com/jobs/search/?currentJobId=4012345678&f_AL=true",
+        ):
+            self.assertEqual(job_id_from_link(link), "4012345678")
+
+    def test_other_links_are_keyed_without_query(self):
+        self.assertEqual(
+            job_id_from_link("https://boards.greenhouse.io/acme/jobs/42?gh_src=x"),
+            "https://boards.greenhouse.io/acme/jobs/42",
+        )
+        self.assertIsNone(job_id_from_link(""))
+
+
+class TestApplicationLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "applications.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_recorded_jobs_persist_across_restarts(self):
+        ledger = ApplicationLedger(self.db_path)
+        ledger.record(
+            "https://www.linkedin.com/jobs/view/111/", "applied", "Acme", "Engineer"
+        )
+        ledger.close()
+
+        restarted = ApplicationLedger(self.db_path)
+        self.assertIn("https://www.linkedin.com/jobs/view/111/?refId=x", restarted)
+        self.assertNotIn("https://www.linkedin.com/jobs/view/222/", restarted)
+        self.assertEqual(
+            restarted.status("https://www.linkedin.com/jobs/view/111/"), "applied"
+        )
+
+    def test_seen_jobs_are_not_persisted(self):
+        ledger = ApplicationLedger(self.db_path)
+        ledger.mark_seen("https://www.linkedin.com/jobs/view/333/")
+        self.assertIn("https://www.linkedin.com/jobs/view/333/", ledger)
+        ledger.close()
+
+        self.assertNotIn(
+            "https://www.linkedin.com/jobs/view/333/", ApplicationLedger(self.db_path)
+        )
+
+    def test_output_csv_is_imported_once(self):
+        csv_path = os.path.join(self.tmp_dir, "output.csv")
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["Acme", "Engineer", "https://www.linkedin.com/jobs/view/1/"]
+            )
+            writer.writerow(
+                ["Beta", "Analyst", "https://www.linkedin.com/jobs/view/2/"]
+            )
+            writer.writerow(["malformed row"])
+
+        ledger = ApplicationLedger(self.db_path, csv_path=csv_path)
+        self.assertEqual(len(ledger), 2)
+        self.assertEqual(
+            ledger.status("https://www.linkedin.com/jobs/view/2/"), "imported"
+        )
+        ledger.close()
+
+        os.remove(csv_path)
+        self.assertEqual(len(ApplicationLedger(self.db_path, csv_path=csv_path)), 2)
+
+    def test_jobs_recorded_by_another_worker_are_seen(self):
+        first = ApplicationLedger(self.db_path)
+        second = ApplicationLedger(self.db_path)
+
+        second.record("https://www.linkedin.com/jobs/view/444/", "failed")
+
+        self.assertIn("https://www.linkedin.com/jobs/view/444/", first)
+
+    def test_concurrent_records_from_threads(self):
+        ledger = ApplicationLedger(self.db_path)
+
+        def worker(offset):
+            for i in range(50):
+                ledger.record(
+                    f"https://www.linkedin.com/jobs/view/{offset + i}/", "applied"
+                )
+
+        threads = [threading.Thread(target=worker, args=(n * 50,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(ApplicationLedger(self.db_path)), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.ai.cache import LRUCache, PersistentCache, make_cache_key, normalize_text
+
+
+class TestPersistentCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, "cache.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_values_survive_reopen_and_count_hits(self):
+        cache = PersistentCache(self.db_path, namespace="answers")
+        cache.set("k", {"answer": "5"})
+        cache.close()
+
+        reopened = PersistentCache(self.db_path, namespace="answers")
+        self.assertEqual(reopened.get("k"), {"answer": "5"})
+        self.assertIsNone(reopened.get("missing"))
+        self.assertEqual(reopened.stats()["hits"], 1)
+        self.assertEqual(reopened.stats()["misses"], 1)
+
+    def test_expired_entries_are_misses(self):
+        cache = PersistentCache(self.db_path, namespace="answers", ttl_seconds=60)
+        with patch("src.ai.cache.time.time", return_value=1000.0):
+            cache.set("k", "yes")
+        with patch("src.ai.cache.time.time", return_value=1061.0):
+            self.assertIsNone(cache.get("k"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = PersistentCache(self.db_path, namespace="answers", max_entries=2)
+        with patch("src.ai.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.set("a", 1)
+            cache.set("b", 2)
+            cache.get("a")
+            cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+    def test_scopes_share_the_file_without_seeing_each_other(self):
+        PersistentCache(self.db_path, namespace="answers", scope="v1").set("k", 1)
+
+        cache = PersistentCache(self.db_path, namespace="answers", scope="v2")
+        self.assertIsNone(cache.get("k"))
+        cache.set("k", 2)
+
+        # Opening another scope must not wipe the entries of the first one
+        reopened = PersistentCache(self.db_path, namespace="answers", scope="v1")
+        self.assertEqual(reopened.get("k"), 1)
+        self.assertEqual(cache.get("k"), 2)
+
+    def test_keys_ignore_case_punctuation_and_spacing(self):
+        self.assertEqual(
+            make_cache_key(normalize_text("Do you require  sponsorship?")),
+            make_cache_key(normalize_text("do you require sponsorship")),
+        )
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = LRUCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        self.assertEqual(cache.get("a"), "1")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(
+            cache.stats(),
+            {"hits": 2, "misses": 1, "evictions": 1, "size": 2, "bytes": 6},
+        )
+
+    def test_memory_is_bounded_by_size(self):
+        cache = LRUCache(max_entries=1000, max_bytes=1000)
+        for i in range(200):
+            cache.set(f"job-{i}", "x" * 98)
+
+        self.assertLessEqual(cache.stats()["bytes"], 1000)
+        self.assertEqual(len(cache), 10)
+        self.assertIn("job-199", cache)
+
+    def test_backing_store_is_shared_across_instances(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir, True)
+        db_path = os.path.join(tmp_dir, "cache.sqlite3")
+
+        LRUCache(backing=PersistentCache(db_path, namespace="ctx")).set("k", "v")
+        fresh = LRUCache(backing=PersistentCache(db_path, namespace="ctx"))
+
+        self.assertEqual(fresh.get("k"), "v")
+        self.assertIn("k", fresh)
+
+
+if __name__ == "__main__":
+    unittest.main()
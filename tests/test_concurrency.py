@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from src.ai.concurrency import AsyncCallLimiter, provider_of
+
+
+class TestAsyncCallLimiter(unittest.TestCase):
+
+    def test_identical_concurrent_calls_share_one_request(self):
+        limiter = AsyncCallLimiter(max_concurrency=4, requests_per_minute={})
+        calls = []
+
+        def ask(question):
+            calls.append(question)
+            time.sleep(0.05)
+            return question.upper()
+
+        async def main():
+            return await asyncio.gather(
+                limiter.run("same", "groq", ask, "yes"),
+                limiter.run("same", "groq", ask, "yes"),
+                limiter.run("other", "groq", ask, "no"),
+            )
+
+        self.assertEqual(asyncio.run(main()), ["YES", "YES", "NO"])
+        self.assertEqual(sorted(calls), ["no", "yes"])
+        self.assertEqual(limiter.stats(), {"calls": 2, "deduplicated": 1})
+
+    def test_concurrency_is_bounded(self):
+        limiter = AsyncCallLimiter(max_concurrency=2, requests_per_minute={})
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def ask(i):
+            with lock:
+                running.append(i)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(i)
+            return i
+
+        async def main():
+            return await asyncio.gather(
+                *(limiter.run(i, "groq", ask, i) for i in range(6))
+            )
+
+        self.assertEqual(asyncio.run(main()), list(range(6)))
+        self.assertEqual(max(peak), 2)
+
+    def test_requests_are_spaced_per_provider(self):
+        limiter = AsyncCallLimiter(requests_per_minute={"groq": 1200})
+        starts = []
+
+        def ask(i):
+            starts.append(time.monotonic())
+            return i
+
+        async def main():
+            await asyncio.gather(*(limiter.run(i, "groq", ask, i) for i in range(3)))
+
+        asyncio.run(main())
+        starts.sort()
+        # 1200 requests per minute leaves 50 ms between request starts
+        self.assertGreaterEqual(starts[2] - starts[0], 0.09)
+
+    def test_provider_of_model_name(self):
+        self.assertEqual(provider_of("groq/openai/gpt-oss-120b"), "groq")
+        self.assertEqual(provider_of("gpt-4o"), "openai")
+
+
+if __name__ == "__main__":
+    unittest.main()
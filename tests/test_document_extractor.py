@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import MagicMock
+
+import PyPDF2
+
+from src.ai.cache import PersistentCache
+from src.ai.document_extractor import DocumentExtractor
+
+DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p><w:r><w:t>Jane Doe</w:t></w:r></w:p>
+    <w:p><w:r><w:t>Skills:</w:t><w:tab/><w:t xml:space="preserve">Python, </w:t></w:r><w:r><w:t>Selenium</w:t></w:r></w:p>
+    <w:p/>
+  </w:body>
+</w:document>
+"""
+
+
+class TestDocumentExtractor(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _extractor(self, **kwargs):
+        cache = PersistentCache(
+            os.path.join(self.directory, "cache.sqlite3"), namespace="documents"
+        )
+        return DocumentExtractor(cache=cache, **kwargs)
+
+    def _write(self, name, text):
+        path = os.path.join(self.directory, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_unchanged_file_is_parsed_once_across_restarts(self):
+        path = self._write("resume.txt", "Experience\n\nBuilt test automation.")
+
+        self.assertEqual(
+            self._extractor().text(path), "Experience\n\nBuilt test automation."
+        )
+        restarted = self._extractor()
+        self.assertEqual(restarted.text(path), "Experience\n\nBuilt test automation.")
+
+        self.assertEqual(restarted.stats(), {"parsed": 0, "hits": 1})
+
+    def test_touched_file_is_matched_by_content_hash(self):
+        path = self._write("resume.txt", "Same text")
+        self._extractor().text(path)
+        os.utime(path, (1, 1))
+
+        extractor = self._extractor()
+        self.assertEqual(extractor.text(path), "Same text")
+        self.assertEqual(extractor.stats()["parsed"], 0)
+
+        self._write("resume.txt", "Changed text")
+        self.assertEqual(extractor.text(path), "Changed text")
+        self.assertEqual(extractor.stats()["parsed"], 1)
+
+    def test_docx_paragraphs(self):
+        path = os.path.join(self.directory, "resume.docx")
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("word/document.xml", DOCUMENT_XML)
+
+        self.assertEqual(
+            self._extractor().text(path), "Jane Doe\n\nSkills:\tPython, Selenium"
+        )
+
+    def test_pdf_pages_from_open_reader(self):
+        path = self._write("resume.pdf", "%PDF-1.4 placeholder")
+        pages = [MagicMock(), MagicMock()]
+        pages[0].extract_text.return_value = "Page one"
+        pages[1].extract_text.side_effect = ValueError("broken font")
+        reader = MagicMock(pages=pages)
+
+        extractor = self._extractor()
+        self.assertEqual(extractor.pages(path, reader=reader), ["Page one", None])
+        self.assertEqual(extractor.pages(path), ["Page one", None])
+        self.assertEqual(pages[0].extract_text.call_count, 1)
+
+    def test_multi_page_pdf_is_split_across_processes(self):
+        writer = PyPDF2.PdfWriter()
+        for _ in range(4):
+            writer.add_blank_page(width=612, height=792)
+        path = os.path.join(self.directory, "long.pdf")
+        with open(path, "wb") as f:
+            writer.write(f)
+
+        extractor = self._extractor(max_workers=2, parallel_min_pages=2)
+        self.assertEqual(extractor.pages(path), [""] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.ai.embeddings import EmbeddingService
+from tests.helpers import bag_of_words_encode
+
+
+class TestEmbeddingService(unittest.TestCase):
+
+    def setUp(self):
+        self.model = MagicMock()
+        self.model.encode.side_effect = lambda texts, **kwargs: (
+            bag_of_words_encode(texts) * 3.0
+        )
+        self.service = EmbeddingService(lambda: self.model, max_entries=3)
+
+    def test_uncached_texts_are_encoded_in_one_batch(self):
+        vectors = self.service.encode(["java", "python", "java", "go"])
+
+        self.model.encode.assert_called_once()
+        self.assertEqual(self.model.encode.call_args.args[0], ["java", "python", "go"])
+        self.assertEqual(vectors.shape, (4, 64))
+        np.testing.assert_allclose(vectors[0], vectors[2])
+        np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), np.ones(4))
+
+    def test_prefetched_texts_are_served_from_cache(self):
+        self.service.prefetch(["Years of Java?", "Notice period?"])
+        self.service.encode(["Notice period?"])
+        self.service.encode(["Years of Java?", "Salary?"])
+
+        self.assertEqual(self.model.encode.call_count, 2)
+        self.assertEqual(self.model.encode.call_args.args[0], ["Salary?"])
+        self.assertEqual(self.service.stats()["hits"], 2)
+
+    def test_cache_is_bounded(self):
+        self.service.encode([f"question {i}" for i in range(10)])
+
+        self.assertEqual(self.service.stats()["size"], 3)
+        self.assertEqual(self.service.stats()["evictions"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.bot.linkedin_easy_apply import LinkedinEasyApply
+from src.utils.form_schema import FORM_SCHEMA_SCRIPT, read_form_schema
+
+
+def text_field(label, type="text", value=""):
+    return {
+        "type": type,
+        "fieldset": False,
+        "label": label,
+        "value": value,
+        "required": True,
+        "options": [],
+        "labels": [MagicMock()],
+        "control": MagicMock(),
+        "locator": "#field",
+    }
+
+
+class TestReadFormSchema(unittest.TestCase):
+
+    def test_all_questions_are_described_with_one_script_call(self):
+        browser = MagicMock()
+        questions = [MagicMock(), MagicMock()]
+        browser.execute_script.return_value = [text_field("City"), None]
+
+        fields = read_form_schema(browser, questions)
+
+        browser.execute_script.assert_called_once_with(FORM_SCHEMA_SCRIPT, questions)
+        self.assertEqual(fields[0]["label"], "City")
+        self.assertIsNone(fields[1])
+
+    def test_script_failure_means_probing(self):
+        browser = MagicMock()
+        browser.execute_script.side_effect = Exception("javascript error")
+
+        self.assertIsNone(read_form_schema(browser, [MagicMock()]))
+        self.assertEqual(read_form_schema(browser, []), [])
+
+
+class TestSchemaDispatch(unittest.TestCase):
+
+    def setUp(self):
+        self.bot = LinkedinEasyApply.__new__(LinkedinEasyApply)
+        self.bot.browser = MagicMock()
+        self.bot.experience = {"Python": 5, "default": 0}
+        self.bot.experience_default = 0
+        self.bot.experience_matcher = MagicMock()
+        self.bot.experience_matcher.find.return_value = ["Python"]
+        self.bot.personal_info = {"First Name": "Test", "Last Name": "User"}
+        self.bot.resolve_ai_answers = MagicMock()
+        self.bot.ai_response_generator = MagicMock()
+        self.question = MagicMock()
+        self.form = MagicMock()
+        self.form.find_elements.return_value = [self.question]
+
+    @patch("src.bot.linkedin_easy_apply.enter_text")
+    def test_described_fields_are_filled_without_probing(self, mock_enter_text):
+        field = text_field("How many years of experience with Python?", "numeric")
+        self.bot.browser.execute_script.return_value = [field]
+
+        self.bot.additional_questions(self.form)
+
+        mock_enter_text.assert_called_once_with(field["control"], 5)
+        self.question.find_element.assert_not_called()
+        self.bot.resolve_ai_answers.assert_called_once_with([])
+
+    @patch("src.bot.linkedin_easy_apply.enter_text")
+    def test_ticked_checkbox_is_left_alone(self, mock_enter_text):
+        field = text_field("I agree to the terms", "checkbox", value="checked")
+        self.bot.browser.execute_script.return_value = [field]
+
+        self.bot.additional_questions(self.form)
+
+        field["labels"][0].click.assert_not_called()
+        self.question.find_element.assert_not_called()
+
+    def test_unknown_fields_are_probed(self):
+        self.bot.browser.execute_script.return_value = [None]
+        self.question.find_element.side_effect = Exception("no such element")
+
+        self.bot.additional_questions(self.form)
+
+        self.assertTrue(self.question.find_element.called)
+        self.bot.resolve_ai_answers.assert_called_once_with([])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.utils.job_cards import JOB_CARDS_SCRIPT, extract_job_cards
+
+
+class TestExtractJobCards(unittest.TestCase):
+
+    def setUp(self):
+        self.browser = MagicMock()
+        self.tiles = [MagicMock(), MagicMock(), MagicMock()]
+
+    def test_all_cards_are_read_with_one_script_call(self):
+        self.browser.execute_script.return_value = [
+            {
+                "job_id": "4012345678",
+                "title": "Python Developer",
+                "link": "https://www.linkedin.com/jobs/view/4012345678/",
+                "company": "Acme",
+                "poster": "Jane Doe",
+                "location": "Remote",
+                "apply_method": "Easy Apply",
+                "applied": False,
+            },
+            {"job_id": "4012345679", "title": "Data Engineer", "applied": True},
+            None,
+        ]
+
+        cards = extract_job_cards(self.browser, self.tiles)
+
+        self.browser.execute_script.assert_called_once_with(
+            JOB_CARDS_SCRIPT, self.tiles
+        )
+        self.assertEqual(cards[0]["company"], "Acme")
+        self.assertEqual(cards[0]["poster"], "Jane Doe")
+        self.assertFalse(cards[0]["applied"])
+        # Link rebuilt from the job ID, missing fields are empty strings
+        self.assertEqual(
+            cards[1]["link"], "https://www.linkedin.com/jobs/view/4012345679/"
+        )
+        self.assertEqual(cards[1]["location"], "")
+        self.assertTrue(cards[1]["applied"])
+        self.assertIsNone(cards[2])
+
+    def test_cards_still_loading_are_left_to_the_fallback(self):
+        self.browser.execute_script.return_value = [
+            {"job_id": "1", "title": "", "link": ""},
+            {"title": "Engineer", "link": "https://www.linkedin.com/jobs/view/2/"},
+            {"title": "Analyst", "link": "https://www.linkedin.com/jobs/view/3/"},
+        ]
+
+        cards = extract_job_cards(self.browser, self.tiles)
+
+        self.assertIsNone(cards[0])
+        self.assertEqual(cards[1]["title"], "Engineer")
+
+    def test_script_failure_falls_back_to_element_lookups(self):
+        self.browser.execute_script.side_effect = Exception("javascript error")
+
+        self.assertIsNone(extract_job_cards(self.browser, self.tiles))
+
+    def test_unexpected_result_falls_back_to_element_lookups(self):
+        self.browser.execute_script.return_value = [{"title": "Engineer"}]
+
+        self.assertIsNone(extract_job_cards(self.browser, self.tiles))
+
+    def test_no_tiles_needs_no_script_call(self):
+        self.assertEqual(extract_job_cards(self.browser, []), [])
+        self.browser.execute_script.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from unittest.mock import patch
+
+from src.utils.job_filter import JobFilter
+
+
+class TestJobFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.job_filter = JobFilter(
+            title_blacklist=["Senior", "staff engineer", "re:sr\\.?", "~principal"],
+            company_blacklist=["Acme Corp", None],
+            poster_blacklist=["Jane Recruiter"],
+        )
+
+    def test_companies_and_posters_match_exactly(self):
+        self.assertEqual(
+            self.job_filter.rejection("Engineer", "ACME  corp", ""),
+            ("company", "ACME  corp"),
+        )
+        self.assertEqual(
+            self.job_filter.rejection("Engineer", "Beta", "jane recruiter"),
+            ("poster", "jane recruiter"),
+        )
+        self.assertIsNone(self.job_filter.rejection("Engineer", "Acme", "Jane"))
+
+    def test_title_words_and_phrases_match_on_word_boundaries(self):
+        self.assertEqual(
+            self.job_filter.rejection("Senior, Backend Developer"), ("title", "Senior")
+        )
+        self.assertEqual(
+            self.job_filter.rejection("Lead Staff  Engineer (Remote)"),
+            ("title", "staff engineer"),
+        )
+        self.assertIsNone(self.job_filter.rejection("Seniority Analyst"))
+        self.assertIsNone(self.job_filter.rejection("Staff Accountant"))
+
+    def test_regex_and_fuzzy_entries(self):
+        self.assertEqual(
+            self.job_filter.rejection("Sr. Python Developer"), ("title", "re:sr\\.?")
+        )
+        self.assertEqual(
+            self.job_filter.rejection("Principle Engineer"), ("title", "~principal")
+        )
+        self.assertEqual(
+            self.job_filter.rejection("Principal Engineer"), ("title", "~principal")
+        )
+        self.assertIsNone(self.job_filter.rejection("Principles of Design Intern"))
+
+    def test_invalid_regex_entries_are_skipped(self):
+        with patch("builtins.print") as mock_print:
+            job_filter = JobFilter(
+                title_blacklist=["re:senior(", "re:(?i)lead", "Intern", "re:jr\\.?"]
+            )
+
+        self.assertEqual(mock_print.call_count, 2)
+        self.assertIn("senior(", mock_print.call_args_list[0].args[0])
+        self.assertEqual(job_filter.rejection("Summer Intern"), ("title", "Intern"))
+        self.assertEqual(job_filter.rejection("Jr. Developer"), ("title", "re:jr\\.?"))
+        self.assertIsNone(job_filter.rejection("Senior Lead Developer"))
+
+    def test_regexes_that_clash_when_combined_are_searched_separately(self):
+        job_filter = JobFilter(
+            title_blacklist=["re:(?P<level>senior)", "re:(?P<level>lead)", "Intern"]
+        )
+
+        self.assertEqual(
+            job_filter.rejection("Lead Developer"), ("title", "re:(?P<level>lead)")
+        )
+        self.assertEqual(job_filter.rejection("Summer Intern"), ("title", "Intern"))
+        self.assertIsNone(job_filter.rejection("Developer"))
+
+    def test_rejections_are_counted_per_entry(self):
+        self.job_filter.rejection("Senior Developer")
+        self.job_filter.rejection("Senior Analyst")
+        self.job_filter.rejection("Developer", "Acme Corp")
+
+        self.assertEqual(
+            self.job_filter.stats(), {"title: Senior": 2, "company: Acme Corp": 1}
+        )
+
+    def test_empty_blacklists_accept_everything(self):
+        job_filter = JobFilter(None, None, None)
+
+        self.assertIsNone(job_filter.rejection("Senior Developer", "Acme", "Jane"))
+
+    def test_invalid_regex_is_ignored(self):
+        job_filter = JobFilter(["re:(unclosed", "intern"])
+
+        self.assertEqual(job_filter.rejection("Summer Intern"), ("title", "intern"))
+
+
+if __name__ == "__main__":
+    unittest.main()
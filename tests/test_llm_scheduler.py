@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.ai.llm_scheduler import LLMScheduler
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, message="Rate limit reached", headers=None):
+        super().__init__(message)
+        self.response = MagicMock(headers=headers or {})
+
+
+class TestLLMScheduler(unittest.TestCase):
+
+    @patch("src.ai.llm_scheduler.time.sleep")
+    def test_no_sleep_with_budget_headroom(self, mock_sleep):
+        scheduler = LLMScheduler(
+            requests_per_minute={"groq": 30}, tokens_per_minute={"groq": 6000}
+        )
+
+        for _ in range(10):
+            scheduler.call("groq/qwen/qwen3-32b", lambda: "ok", estimated_tokens=500)
+
+        mock_sleep.assert_not_called()
+        self.assertEqual(scheduler.stats()["waits"], 0)
+
+    @patch("src.ai.llm_scheduler.time.sleep")
+    def test_exhausted_token_budget_waits_for_refill(self, mock_sleep):
+        scheduler = LLMScheduler(tokens_per_minute={"groq/qwen/qwen3-32b": 600})
+
+        scheduler.acquire("groq/qwen/qwen3-32b", 600)
+        mock_sleep.assert_not_called()
+        scheduler.acquire("groq/qwen/qwen3-32b", 100)
+
+        # 100 tokens at 10 tokens per second
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 10, delta=0.1)
+        # Other providers have their own budget
+        scheduler.acquire("openai/gpt-4o", 600)
+        self.assertEqual(mock_sleep.call_count, 1)
+
+    @patch("src.ai.llm_scheduler.time.sleep")
+    def test_rate_limit_honours_retry_after(self, mock_sleep):
+        scheduler = LLMScheduler(requests_per_minute={})
+        func = MagicMock(
+            side_effect=[RateLimitError(headers={"retry-after": "3"}), "ok"]
+        )
+
+        self.assertEqual(scheduler.call("groq/qwen/qwen3-32b", func), "ok")
+
+        self.assertEqual(func.call_count, 2)
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 3, delta=0.1)
+        self.assertEqual(scheduler.stats()["rate_limited"], 1)
+
+    def test_retry_after_from_groq_message(self):
+        error = RateLimitError("Limit 6000, Used 5800. Please try again in 1m2.5s.")
+        self.assertAlmostEqual(LLMScheduler.retry_after(error), 62.5)
+        error = RateLimitError("Please try again in 250ms.")
+        self.assertAlmostEqual(LLMScheduler.retry_after(error), 0.25)
+
+    @patch("src.ai.llm_scheduler.time.sleep")
+    def test_transient_errors_back_off_and_give_up(self, mock_sleep):
+        scheduler = LLMScheduler(requests_per_minute={}, max_retries=2, base_delay=1)
+        error = RuntimeError("bad gateway")
+        error.status_code = 502
+        func = MagicMock(side_effect=error)
+
+        with self.assertRaises(RuntimeError):
+            scheduler.call("groq/qwen/qwen3-32b", func)
+
+        self.assertEqual(func.call_count, 3)
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertTrue(0.5 <= delays[0] <= 1.0 and 1.0 <= delays[1] <= 2.0, delays)
+
+    @patch("src.ai.llm_scheduler.time.sleep")
+    def test_other_errors_are_not_retried(self, mock_sleep):
+        scheduler = LLMScheduler()
+        func = MagicMock(side_effect=ValueError("bad request"))
+
+        with self.assertRaises(ValueError):
+            scheduler.call("groq/qwen/qwen3-32b", func)
+
+        self.assertEqual(func.call_count, 1)
+        mock_sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
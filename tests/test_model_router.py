@@ -0,0 +1,53 @@
+import unittest
+
+from src.ai.model_router import ModelRouter
+
+
+class TestModelRouter(unittest.TestCase):
+
+    def setUp(self):
+        self.router = ModelRouter(
+            default_model="groq/llama-3.3-70b-versatile",
+            model_tiers={"small": "small-model", "large": "large-model"},
+        )
+
+    def test_tasks_are_routed_to_their_tier(self):
+        self.assertEqual(self.router.model_for("numeric"), "small-model")
+        self.assertEqual(self.router.model_for("text"), "large-model")
+        self.assertEqual(
+            self.router.model_for("summary"), "groq/llama-3.3-70b-versatile"
+        )
+        # No "medium" tier configured: fall back to the largest model
+        self.assertEqual(self.router.model_for("fit_decision"), "large-model")
+
+    def test_route_escalates_to_larger_tiers_only(self):
+        self.assertEqual(
+            self.router.route("choice"),
+            [("small", "small-model"), ("large", "large-model")],
+        )
+        self.assertEqual(self.router.route("text"), [("large", "large-model")])
+        self.assertEqual(
+            self.router.route("summary"),
+            [("default", "groq/llama-3.3-70b-versatile")],
+        )
+
+    def test_escalation_can_be_disabled(self):
+        router = ModelRouter(escalate=False, task_tiers={"text": "small"})
+        self.assertEqual(len(router.route("numeric")), 1)
+        self.assertEqual(router.route("text")[0][0], "small")
+
+    def test_stats_per_tier(self):
+        self.router.record("small", "small-model", 0.2, 100, 5)
+        self.router.record("small", "small-model", 0.4, 120, 3)
+        self.router.record("large", "large-model", 1.0, 100, 10, escalated=True)
+
+        stats = self.router.stats()
+        self.assertEqual(stats["small"]["calls"], 2)
+        self.assertEqual(stats["small"]["prompt_tokens"], 220)
+        self.assertEqual(stats["small"]["completion_tokens"], 8)
+        self.assertAlmostEqual(stats["small"]["avg_latency_seconds"], 0.3)
+        self.assertEqual(stats["large"]["escalations"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
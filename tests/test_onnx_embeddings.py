@@ -0,0 +1,121 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.ai.onnx_embeddings import OnnxSentenceEncoder
+
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+class FakeTokenizer:
+    """Whitespace tokenizer padding to the longest sentence, like ``tokenizers``"""
+
+    def enable_truncation(self, max_length):
+        self.max_length = max_length
+
+    def enable_padding(self):
+        pass
+
+    def encode_batch(self, sentences):
+        tokens = [sentence.split()[: self.max_length] for sentence in sentences]
+        width = max(len(words) for words in tokens)
+        return [
+            SimpleNamespace(
+                ids=[len(word) for word in words] + [0] * (width - len(words)),
+                attention_mask=[1] * len(words) + [0] * (width - len(words)),
+                type_ids=[0] * width,
+            )
+            for words in tokens
+        ]
+
+
+class FakeSession:
+    """Token embedding = [token id, 1]; padding tokens get a large vector"""
+
+    def get_inputs(self):
+        return [
+            SimpleNamespace(name="input_ids"),
+            SimpleNamespace(name="attention_mask"),
+        ]
+
+    def run(self, outputs, inputs):
+        self.inputs = inputs
+        ids = inputs["input_ids"].astype("float32")
+        hidden = np.stack([ids, np.ones_like(ids)], axis=-1)
+        hidden[inputs["attention_mask"] == 0] = 100.0
+        return [hidden]
+
+
+class TestOnnxSentenceEncoder(unittest.TestCase):
+
+    def test_mean_pooling_ignores_padding_and_normalizes(self):
+        session = FakeSession()
+        encoder = OnnxSentenceEncoder(session, FakeTokenizer())
+
+        vectors = encoder.encode(["abc abc", "a"], batch_size=8)
+
+        self.assertEqual(set(session.inputs), {"input_ids", "attention_mask"})
+        expected = np.array([[3.0, 1.0], [1.0, 1.0]])
+        expected /= np.linalg.norm(expected, axis=1, keepdims=True)
+        np.testing.assert_allclose(vectors, expected, rtol=1e-6)
+        self.assertEqual(vectors.dtype, np.float32)
+
+    def test_batches_and_single_sentence(self):
+        encoder = OnnxSentenceEncoder(FakeSession(), FakeTokenizer())
+
+        self.assertEqual(encoder.encode(["a", "bb", "ccc"], batch_size=2).shape, (3, 2))
+        self.assertEqual(encoder.encode("a b").shape, (2,))
+
+
+class TestOnnxParity(unittest.TestCase):
+    """int8 ONNX vectors against the PyTorch model, when both can be loaded"""
+
+    SENTENCES = [
+        "How many years of experience do you have with Python?",
+        "Are you legally authorized to work in the United States?",
+        "Built Selenium and pytest test automation frameworks for web apps.",
+        "Led a team of five engineers delivering cloud data pipelines on AWS.",
+        "Bachelor of Science in Computer Science, graduated 2018.",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            # Only models already in the Hugging Face cache, no downloads
+            cls.onnx_model = OnnxSentenceEncoder.from_pretrained(
+                EMBEDDING_MODEL_NAME, local_files_only=True
+            )
+            from sentence_transformers import SentenceTransformer
+
+            cls.torch_model = SentenceTransformer(
+                EMBEDDING_MODEL_NAME, local_files_only=True
+            )
+        except Exception as e:
+            raise unittest.SkipTest(f"embedding models unavailable: {e}")
+
+    def test_vectors_match_torch_within_tolerance(self):
+        torch_vectors = self.torch_model.encode(
+            self.SENTENCES, normalize_embeddings=True
+        )
+        onnx_vectors = self.onnx_model.encode(self.SENTENCES)
+
+        cosine = np.sum(torch_vectors * onnx_vectors, axis=1)
+        self.assertGreater(cosine.min(), 0.98, cosine)
+
+    def test_retrieval_ranking_is_unchanged(self):
+        chunks, queries = self.SENTENCES[2:], self.SENTENCES[:2] + [
+            "Experience with automated testing tools?",
+            "What is your highest level of education?",
+        ]
+        rankings = []
+        for model in (self.torch_model, self.onnx_model):
+            scores = (
+                np.asarray(model.encode(queries)) @ np.asarray(model.encode(chunks)).T
+            )
+            rankings.append(scores.argmax(axis=1).tolist())
+        self.assertEqual(rankings[0], rankings[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import shutil
+import tempfile
+import unittest
+
+from src.ai.question_memory import QuestionMemory
+from tests.helpers import bag_of_words_encode
+
+
+class TestQuestionMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _memory(self, scope="profile-v1"):
+        return QuestionMemory(
+            self.directory, encode=bag_of_words_encode, threshold=0.5, scope=scope
+        )
+
+    def test_reworded_question_reuses_answer(self):
+        memory = self._memory()
+        memory.add("How many years of Java experience do you have?", "numeric", "4")
+
+        match = memory.lookup("Years of experience in Java?", "numeric")
+
+        self.assertIsNotNone(match)
+        self.assertEqual(match[0], "4")
+        self.assertEqual(memory.stats()["hits"], 1)
+
+    def test_different_skill_or_type_is_not_reused(self):
+        memory = self._memory()
+        memory.add("How many years of Java experience do you have?", "numeric", "4")
+
+        self.assertIsNone(memory.lookup("Years of experience in Python?", "numeric"))
+        self.assertIsNone(memory.lookup("Years of experience in Java?", "text"))
+
+    def test_choice_answers_require_same_options(self):
+        memory = self._memory()
+        options = [(0, "Yes"), (1, "No")]
+        memory.add("Do you require visa sponsorship?", "choice", "1", options)
+
+        self.assertIsNotNone(
+            memory.lookup("Do you require sponsorship for a visa", "choice", options)
+        )
+        self.assertIsNone(
+            memory.lookup(
+                "Do you require sponsorship for a visa",
+                "choice",
+                [(0, "No"), (1, "Yes")],
+            )
+        )
+
+    def test_near_duplicates_are_reused_across_jobs(self):
+        memory = self._memory()
+        memory.add(
+            "How many years of Java experience do you have?",
+            "numeric",
+            "4",
+            jd="Backend engineer at Acme",
+        )
+        memory.add(
+            "Why do you want to join us?", "text", "Great team.", jd="Acme posting"
+        )
+
+        self.assertIsNotNone(
+            memory.lookup("Years of experience in Java?", "numeric", jd="Beta posting")
+        )
+        # Free-text answers are written for one posting
+        self.assertIsNone(
+            memory.lookup("Why do you want to join us", "text", jd="Beta posting")
+        )
+        self.assertIsNotNone(
+            memory.lookup("Why do you want to join us", "text", jd="Acme posting")
+        )
+
+    def test_answers_are_written_to_disk_on_save(self):
+        memory = self._memory()
+        memory.add("Are you willing to relocate?", "text", "Yes")
+        memory.add("Do you have a driver's license?", "text", "Yes")
+        self.assertEqual(memory._index.ntotal, 2)
+        self.assertIsNone(self._memory().lookup("Are you willing to relocate", "text"))
+
+        memory.save()
+        self.assertEqual(
+            self._memory().lookup("Are you willing to relocate", "text")[0], "Yes"
+        )
+
+    def test_save_trims_to_max_entries(self):
+        memory = self._memory()
+        memory.max_entries = 2
+        for skill in ("Java", "Python", "Rust"):
+            memory.add(f"Years of {skill} experience?", "numeric", "3")
+        memory.save()
+
+        reloaded = self._memory()
+        self.assertEqual(
+            [entry["question"] for entry in reloaded.entries],
+            ["Years of Python experience?", "Years of Rust experience?"],
+        )
+        self.assertEqual(reloaded._index.ntotal, 2)
+
+    def test_memory_persists_per_scope(self):
+        memory = self._memory()
+        memory.add("Are you willing to relocate?", "text", "Yes")
+        memory.save()
+
+        self.assertEqual(
+            self._memory().lookup("Are you willing to relocate", "text")[0], "Yes"
+        )
+        self.assertIsNone(
+            self._memory(scope="profile-v2").lookup(
+                "Are you willing to relocate", "text"
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+from unittest.mock import patch
+
+from src.ai.skill_extractor import SkillExtractor
+from tests.helpers import GeneratorTestCase, completion_response, make_generator
+
+JOB_DESCRIPTION = (
+    "We are hiring a backend engineer to build Python services on AWS. "
+    "You will design REST APIs with FastAPI, deploy them with Docker and "
+    "Kubernetes, and store data in PostgreSQL. Strong Python and SQL skills "
+    "are required; experience with Kafka is a plus. Python, python, Python."
+)
+
+
+class TestSkillExtractor(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = SkillExtractor()
+
+    def test_skills_are_ranked_by_frequency_then_position(self):
+        skills = self.extractor.extract(JOB_DESCRIPTION, top_k=10)
+
+        self.assertEqual(skills[0], "Python")
+        self.assertEqual(skills[1], "AWS")
+        self.assertIn("REST APIs", skills)
+        self.assertIn("PostgreSQL", skills)
+        self.assertEqual(skills.index("Kafka"), len(skills) - 1)
+        self.assertEqual(len(self.extractor.extract(JOB_DESCRIPTION, top_k=3)), 3)
+
+    def test_skills_are_returned_as_written(self):
+        skills = self.extractor.extract("Experience with k8s and golang; nodejs.")
+
+        self.assertEqual(skills, ["k8s", "golang", "nodejs"])
+
+    def test_matches_respect_word_boundaries(self):
+        text = "JavaScript, Scalability, Gitlab runners and the Rails console"
+
+        self.assertEqual(self.extractor.find(text), ["JavaScript", "Ruby on Rails"])
+        self.assertEqual(self.extractor.find("C++ and C# developers"), ["C++", "C#"])
+
+    def test_longest_mention_wins_over_overlapping_ones(self):
+        extractor = SkillExtractor(
+            {"Ruby": ["ruby"], "Ruby on Rails": ["ruby on rails"]},
+            include_defaults=False,
+        )
+
+        self.assertEqual(extractor.find("Ruby on Rails"), ["Ruby on Rails"])
+        self.assertEqual(extractor.find("Ruby or Rails"), ["Ruby"])
+
+    def test_lexicon_can_be_extended(self):
+        extractor = SkillExtractor({"Pulumi": ["pulumi"], "Python": "py3"})
+
+        self.assertEqual(extractor.find("Pulumi stacks in py3"), ["Pulumi", "Python"])
+        self.assertEqual(extractor.find("python"), ["Python"])
+
+    def test_from_terms_matches_literal_terms(self):
+        matcher = SkillExtractor.from_terms(["Java", "Customer Service"])
+
+        self.assertEqual(
+            matcher.find("years of customer service experience with java?"),
+            ["Customer Service", "Java"],
+        )
+        self.assertEqual(matcher.find("years of javascript?"), [])
+
+
+class TestLocalSkillExtraction(GeneratorTestCase):
+
+    def _make_generator(self, **kwargs):
+        return make_generator(
+            self.cache_dir, "Skills: Python, Flask, MySQL, Jenkins", **kwargs
+        )
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_job_skills_are_extracted_without_the_llm(self, mock_completion):
+        mock_completion.return_value = completion_response(
+            '[{"old": "Flask", "new": "FastAPI"}]'
+        )
+        generator = self._make_generator()
+
+        replacements = generator.get_tailored_skills_replacements(JOB_DESCRIPTION)
+
+        self.assertEqual(replacements, [{"old": "Flask", "new": "FastAPI"}])
+        # Only the replacement step went to the LLM
+        mock_completion.assert_called_once()
+        prompt = mock_completion.call_args.kwargs["messages"][1]["content"]
+        self.assertIn("Job Skills:\nPython, AWS", prompt)
+        self.assertEqual(
+            generator.cache_stats()["skill_extraction"], {"local": 1, "llm": 0}
+        )
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_llm_is_the_fallback_for_unknown_skills(self, mock_completion):
+        mock_completion.return_value = completion_response("Cobol, JCL")
+        generator = self._make_generator()
+
+        skills = generator.extract_job_skills("Mainframe role using Cobol and JCL.")
+
+        self.assertEqual(skills, "Cobol, JCL")
+        self.assertEqual(generator.skill_extraction_stats, {"local": 0, "llm": 1})
+
+    @patch("src.ai.ai_response_generator.completion")
+    def test_local_extraction_can_be_disabled(self, mock_completion):
+        mock_completion.return_value = completion_response("Python, AWS")
+        generator = self._make_generator(local_skill_extraction=False)
+
+        self.assertEqual(generator.extract_job_skills(JOB_DESCRIPTION), "Python, AWS")
+        mock_completion.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Cold import budget for `src.main`, overridable for slow CI runners
+IMPORT_BUDGET_MS = float(os.environ.get("STARTUP_IMPORT_BUDGET_MS", "2000"))
+
+# Dependencies that must only be imported on the code paths that need them
+HEAVY_MODULES = [
+    "faiss",
+    "sentence_transformers",
+    "torch",
+    "onnxruntime",
+    "litellm",
+    "ollama",
+    "pyautogui",
+    "PyPDF2",
+    "pypdf",
+    "requests",
+]
+
+
+def run_python(*args):
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+
+def parse_cumulative_import_time_us(importtime_output, module):
+    """Return the cumulative microseconds reported by `-X importtime` for a module"""
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    return None
+
+
+class TestStartupImports(unittest.TestCase):
+
+    def test_heavy_dependencies_are_not_imported_at_startup(self):
+        result = run_python(
+            "-c",
+            "import json, sys, src.main; "
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))",
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(json.loads(result.stdout.strip().splitlines()[-1]), [])
+
+    def test_cold_import_within_budget(self):
+        result = run_python("-X", "importtime", "-c", "import src.main")
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        cumulative_us = parse_cumulative_import_time_us(result.stderr, "src.main")
+        self.assertIsNotNone(cumulative_us, "src.main missing from importtime output")
+        self.assertLess(
+            cumulative_us / 1000,
+            IMPORT_BUDGET_MS,
+            f"Cold import of src.main took {cumulative_us / 1000:.0f} ms",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from src.ai.tokens import _bundled_tiktoken_files, count_tokens, truncate_to_tokens
+
+
+class TestTokens(unittest.TestCase):
+
+    def test_counts_tokens_not_characters(self):
+        text = "Built test automation frameworks in Python. " * 20
+
+        self.assertEqual(count_tokens(""), 0)
+        self.assertLess(count_tokens(text), len(text) / 2)
+        self.assertEqual(count_tokens(text), count_tokens(text, "groq/qwen/qwen3-32b"))
+
+    def test_truncate_respects_budget(self):
+        text = "Selenium, pytest and CI pipelines. " * 50
+
+        truncated = truncate_to_tokens(text, 40)
+
+        self.assertLessEqual(count_tokens(truncated), 40)
+        self.assertTrue(text.startswith(truncated))
+        self.assertEqual(truncate_to_tokens("short", 40), "short")
+
+    @patch("src.ai.tokens.encoding_for", return_value=None)
+    def test_approximation_without_tokenizer(self, _):
+        self.assertEqual(count_tokens("x" * 41), 11)
+        self.assertEqual(truncate_to_tokens("x" * 100, 10), "x" * 40)
+
+
+class TestBundledTiktokenFiles(unittest.TestCase):
+
+    @patch("src.ai.tokens._bundled_tiktoken_dir", return_value="/litellm/tokenizers")
+    def test_bundled_files_are_used_only_while_loading(self, _):
+        with patch.dict(os.environ):
+            os.environ.pop("TIKTOKEN_CACHE_DIR", None)
+            with _bundled_tiktoken_files("cl100k_base"):
+                self.assertEqual(
+                    os.environ["TIKTOKEN_CACHE_DIR"], "/litellm/tokenizers"
+                )
+            self.assertNotIn("TIKTOKEN_CACHE_DIR", os.environ)
+
+            # Not shipped with LiteLLM: tiktoken's own cache location
+            with _bundled_tiktoken_files("o200k_base"):
+                self.assertNotIn("TIKTOKEN_CACHE_DIR", os.environ)
+
+    @patch("src.ai.tokens._bundled_tiktoken_dir", return_value="/litellm/tokenizers")
+    def test_user_cache_setting_is_kept(self, _):
+        for value in ("/home/user/.tiktoken", ""):
+            with patch.dict(os.environ, {"TIKTOKEN_CACHE_DIR": value}):
+                with _bundled_tiktoken_files("cl100k_base"):
+                    self.assertEqual(os.environ["TIKTOKEN_CACHE_DIR"], value)
+                self.assertEqual(os.environ["TIKTOKEN_CACHE_DIR"], value)
+
+
+if __name__ == "__main__":
+    unittest.main()
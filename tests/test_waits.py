@@ -0,0 +1,119 @@
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.utils.waits import (
+    PageWaits,
+    any_present,
+    modal_changed,
+    new_window_or,
+    none_present,
+    replaced_by,
+    text_changed,
+)
+
+
+class TestConditions(unittest.TestCase):
+
+    def setUp(self):
+        self.driver = MagicMock()
+
+    def test_any_and_none_present(self):
+        self.driver.execute_script.return_value = ".artdeco-toast-item__dismiss"
+        self.assertEqual(
+            any_present(".artdeco-modal__dismiss", ".artdeco-toast-item__dismiss")(
+                self.driver
+            ),
+            ".artdeco-toast-item__dismiss",
+        )
+        self.assertFalse(none_present(".artdeco-modal")(self.driver))
+
+        self.driver.execute_script.return_value = None
+        self.assertIsNone(any_present(".artdeco-modal")(self.driver))
+        self.assertTrue(none_present(".artdeco-modal")(self.driver))
+
+    def test_modal_changed(self):
+        self.driver.execute_script.return_value = "25|Contact info|Next|0"
+        self.assertFalse(modal_changed("25|Contact info|Next|0")(self.driver))
+
+        self.driver.execute_script.return_value = "50|Resume|Next|0"
+        self.assertTrue(modal_changed("25|Contact info|Next|0")(self.driver))
+
+        # Closed after submitting
+        self.driver.execute_script.return_value = None
+        self.assertTrue(modal_changed("100|Review|Submit application|0")(self.driver))
+
+    def test_replaced_by_waits_for_the_form_to_go(self):
+        condition = replaced_by(
+            ".jobs-easy-apply-modal__content", ".artdeco-modal__dismiss"
+        )
+
+        # The Easy Apply modal is still open, with its own dismiss button
+        self.driver.execute_script.side_effect = lambda script, selectors: (
+            selectors[0]
+        )
+        self.assertIsNone(condition(self.driver))
+
+        self.driver.execute_script.side_effect = lambda script, selectors: (
+            None if selectors == [".jobs-easy-apply-modal__content"] else selectors[0]
+        )
+        self.assertEqual(condition(self.driver), ".artdeco-modal__dismiss")
+
+    def test_text_changed(self):
+        condition = text_changed("#job-details", "Old description")
+
+        self.driver.execute_script.return_value = "Old description"
+        self.assertFalse(condition(self.driver))
+        self.driver.execute_script.return_value = ""
+        self.assertFalse(condition(self.driver))
+        self.driver.execute_script.return_value = "New description"
+        self.assertTrue(condition(self.driver))
+
+    def test_new_window_or_selector(self):
+        self.driver.window_handles = ["main", "greenhouse"]
+        self.assertEqual(new_window_or(1, ".modal")(self.driver), "window")
+
+        self.driver.window_handles = ["main"]
+        self.driver.execute_script.return_value = ".modal"
+        self.assertEqual(new_window_or(1, ".modal")(self.driver), ".modal")
+
+
+class TestPageWaits(unittest.TestCase):
+
+    def test_until_returns_as_soon_as_the_condition_holds(self):
+        waits = PageWaits(MagicMock(), timeout=5, min_delay=0, max_delay=0)
+        calls = []
+
+        def condition(driver):
+            calls.append(driver)
+            return len(calls) >= 2 and "ready"
+
+        started = time.monotonic()
+        self.assertEqual(waits.until(condition), "ready")
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(waits.stats()["timeouts"], 0)
+
+    def test_until_gives_up_after_the_timeout(self):
+        waits = PageWaits(MagicMock(), timeout=0.3, poll_frequency=0.05)
+
+        self.assertIsNone(waits.until(lambda driver: False))
+        stats = waits.stats()
+        self.assertEqual((stats["waits"], stats["timeouts"]), (1, 1))
+        self.assertGreaterEqual(stats["waited_seconds"], 0.3)
+
+    @patch("src.utils.waits.time.sleep")
+    def test_pause_is_drawn_from_the_configured_range(self, mock_sleep):
+        waits = PageWaits(MagicMock(), min_delay=0.5, max_delay=1.5)
+
+        for _ in range(20):
+            delay = waits.pause()
+            self.assertTrue(0.5 <= delay <= 1.5)
+        self.assertEqual(mock_sleep.call_count, 20)
+
+        no_pause = PageWaits(MagicMock(), min_delay=0, max_delay=0)
+        self.assertEqual(no_pause.pause(), 0)
+        self.assertEqual(mock_sleep.call_count, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()